@@ -6,8 +6,10 @@ Objects for transferring data between layers.
 
 from .email_dto import EmailDTO, CreateEmailDTO, UpdateEmailDTO
 from .user_dto import UserDTO, CreateUserDTO, UpdateUserDTO
+from .llm_dto import ComposedEmailBodyDTO, SmartComposedEmailDTO
 
 __all__ = [
     "EmailDTO", "CreateEmailDTO", "UpdateEmailDTO",
-    "UserDTO", "CreateUserDTO", "UpdateUserDTO"
+    "UserDTO", "CreateUserDTO", "UpdateUserDTO",
+    "ComposedEmailBodyDTO", "SmartComposedEmailDTO"
 ] 
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""
+LLM Data Transfer Objects
+
+DTOs for results of the Gemini-powered composition use cases.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class ComposedEmailBodyDTO:
+    """Email body composed in the user's style"""
+
+    body: str
+
+
+@dataclass(frozen=True, slots=True)
+class SmartComposedEmailDTO:
+    """Email content and optional subject line from the smart composer"""
+
+    content: str
+    subject: Optional[str] = None
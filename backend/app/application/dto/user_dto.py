@@ -11,7 +11,7 @@ from datetime import datetime
 from ...domain.entities.user import UserRole
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserDTO:
     """User data transfer object"""
     
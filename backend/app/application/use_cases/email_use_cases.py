@@ -4,7 +4,13 @@ Email Use Cases
 Business use cases for email operations.
 """
 
-from typing import List, Optional, Dict, Any
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime
 
 from ...domain.entities.email import Email, EmailStatus
@@ -17,16 +23,82 @@ from ...domain.exceptions.domain_exceptions import (
 )
 from ...application.dto.email_dto import EmailDTO, CreateEmailDTO, UpdateEmailDTO, EmailListDTO
 from ...infrastructure.external_services.llm_service import LLMService
+from .profile_prompt import (
+    PROFILE_PROMPT_HEADER,
+    PROFILE_PROMPT_MAX_CHARS,
+    PROFILE_SYSTEM_INSTRUCTION,
+    PROFILE_TEMPLATE_VERSION,
+    dumps_compact,
+    loads_json,
+)
 import inspect
 from ...domain.entities.email import EmailType
 
 
+logger = logging.getLogger(__name__)
+
+# Number of emails packed into a single LLM summarization request
+SUMMARY_BATCH_SIZE = 5
+
+# Number of summarized emails buffered before they are written with one bulk update
+SUMMARY_FLUSH_SIZE = 25
+
+# Gmail import pipeline: queue bound, number of store workers, and emails per bulk write
+FETCH_QUEUE_SIZE = 100
+FETCH_STORE_WORKERS = 4
+FETCH_STORE_BATCH_SIZE = 25
+
+# Maximum number of error messages returned from batch summarization
+MAX_REPORTED_ERRORS = 10
+
+# Strips HTML tags from email bodies before they are sent to the LLM
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Maximum number of recent sent emails used to build the user profile
+PROFILE_SAMPLE_LIMIT = 50
+
+# Minimum number of seconds between background profile regenerations per user
+PROFILE_REGENERATION_INTERVAL = 300
+
+# Last successful regeneration time (time.monotonic()) per user email, oldest first;
+# entries older than PROFILE_REGENERATION_INTERVAL are pruned
+_profile_last_run: "OrderedDict[str, float]" = OrderedDict()
+# Emails with a regeneration running, and the tasks running them
+_profile_in_flight: Set[str] = set()
+_profile_tasks: Set[asyncio.Task] = set()
+
+
+def _contact_strs(email: Email) -> Tuple[str, str]:
+    """Return the sender and first recipient of an email as plain strings"""
+    recipient = email.recipients[0].value if email.recipients else ""
+    return email.sender.value, recipient
+
+
+def _profile_cache_key(model_name: str, email_ids: List[str]) -> str:
+    """Build a stable cache key for a profile generated from the given emails"""
+    raw = f"{model_name}|{PROFILE_TEMPLATE_VERSION}|{','.join(sorted(email_ids))}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
 class EmailUseCaseBase:
     """Base class for email use cases"""
     
     def __init__(self, email_repository: EmailRepository):
         self.email_repository = email_repository
     
+    async def _flush_summaries(self, to_update: List[Email]) -> int:
+        """Write buffered summarized emails with one bulk update and clear the buffer"""
+        if not to_update:
+            return 0
+        count = len(to_update)
+        try:
+            await self.email_repository.update_many(to_update)
+        except Exception as e:
+            logger.warning("Failed to store %d summarized emails: %s", count, e)
+            count = 0
+        to_update.clear()
+        return count
+    
     def _entity_to_dto(self, email: Email) -> EmailDTO:
         """Convert email entity to DTO"""
         return EmailDTO(
@@ -209,18 +281,14 @@ class SendNewEmailUseCase(EmailUseCaseBase):
         await self.email_repository.update(saved_email)
         
         try:
-            print(f"🔍 DEBUG: SendNewEmailUseCase - About to send email")
-            print(f"   📧 Email details:")
-            print(f"      sender: {sender_email}")
-            print(f"      recipients: {recipients}")
-            print(f"      subject: {subject}")
-            print(f"      body length: {len(body)} chars")
-            print(f"      html_body: {'provided' if html_body else 'None'}")
+            logger.debug(
+                "SendNewEmailUseCase sending email: sender=%s recipients=%s subject=%s body_length=%d html_body=%s",
+                sender_email, recipients, subject, len(body), "provided" if html_body else None
+            )
             
             # Send email using email service if available
             if self.email_service:
-                print(f"🔍 DEBUG: Email service is available, calling send_email()")
-                print(f"   🔧 Email service type: {type(self.email_service).__name__}")
+                logger.debug("Calling %s.send_email()", type(self.email_service).__name__)
                 
                 try:
                     success = await self.email_service.send_email(
@@ -230,26 +298,19 @@ class SendNewEmailUseCase(EmailUseCaseBase):
                         body=body,
                         html_body=html_body
                     )
-                    print(f"🔍 DEBUG: Email service send_email() returned: {success}")
+                    logger.debug("Email service send_email() returned: %s", success)
                     
                     if not success:
-                        print(f"🔍 DEBUG: Email service returned False, marking as failed")
                         # Email service failed to send
                         saved_email.mark_as_failed("Email service failed to send email")
                         await self.email_repository.update(saved_email)
                         raise DomainValidationError("Failed to send email: Email service returned failure")
-                    else:
-                        print(f"🔍 DEBUG: Email service returned True, proceeding to mark as sent")
                         
                 except Exception as email_service_error:
-                    print(f"🔍 DEBUG: Email service threw exception: {email_service_error}")
-                    print(f"🔍 DEBUG: Exception type: {type(email_service_error).__name__}")
-                    import traceback
-                    print(f"🔍 DEBUG: Email service exception traceback: {traceback.format_exc()}")
+                    logger.debug("Email service send_email() raised", exc_info=True)
                     raise email_service_error
                     
             else:
-                print(f"🔍 DEBUG: No email service available")
                 # No email service available
                 saved_email.mark_as_failed("No email service configured")
                 await self.email_repository.update(saved_email)
@@ -341,75 +402,71 @@ class FetchInitialEmailsUseCase(EmailUseCaseBase):
     async def execute(self, oauth_token, user_email: str, limit: int = 10, account_owner: Optional[str] = None) -> Dict[str, Any]:
         """Fetch initial emails from Gmail and store them"""
         try:
-            print(f"🔄 FetchInitialEmailsUseCase.execute called:")
-            print(f"   - user_email: {user_email}")
-            print(f"   - limit: {limit}")
-            print(f"   - account_owner: {account_owner}")
-            print(f"   - oauth_token type: {type(oauth_token).__name__}")
-            print(f"   - gmail_service type: {type(self.gmail_service).__name__}")
-            print(f"   - email_repository type: {type(self.email_repository).__name__}")
-            
             # Use account_owner if provided, otherwise use user_email
             actual_account_owner = account_owner or user_email
-            print(f"   - actual_account_owner: {actual_account_owner}")
+            logger.debug(
+                "FetchInitialEmailsUseCase.execute: user_email=%s limit=%s account_owner=%s",
+                user_email, limit, actual_account_owner
+            )
             
-            # Fetch emails from Gmail
-            print("🔄 Calling gmail_service.fetch_recent_emails...")
-            emails = await self.gmail_service.fetch_recent_emails(oauth_token, user_email, limit)
-            print(f"📧 Gmail service returned {len(emails) if emails else 0} emails")
+            # Stream emails from Gmail into a bounded queue while store workers
+            # categorize and bulk-save them, so fetching and storing overlap
+            queue: asyncio.Queue = asyncio.Queue(maxsize=FETCH_QUEUE_SIZE)
+            stored_emails: List[Email] = []
+            failed_emails: List[Email] = []
+            fetched_count = 0
             
-            if not emails:
-                print("⚠️ No emails found to import")
+            async def _produce() -> None:
+                nonlocal fetched_count
+                async for email in self.gmail_service.stream_recent_emails(oauth_token, user_email, limit):
+                    fetched_count += 1
+                    await queue.put(email)
+                # One sentinel per worker so every worker exits
+                for _ in range(FETCH_STORE_WORKERS):
+                    await queue.put(None)
+            
+            async def _consume() -> None:
+                done = False
+                while not done:
+                    batch = []
+                    email = await queue.get()
+                    while email is not None:
+                        batch.append(email)
+                        if len(batch) >= FETCH_STORE_BATCH_SIZE or queue.empty():
+                            break
+                        email = queue.get_nowait()
+                    done = email is None
+                    if batch:
+                        await self._store_batch(batch, actual_account_owner, user_email, stored_emails, failed_emails)
+            
+            tasks = [
+                asyncio.create_task(_produce()),
+                *(asyncio.create_task(_consume()) for _ in range(FETCH_STORE_WORKERS))
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                # If either side failed, stop the rest instead of leaving them saving in the background
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            logger.debug("Gmail service returned %d emails", fetched_count)
+            
+            if not fetched_count:
+                logger.debug("No emails found to import for %s", user_email)
                 return {
                     "success": True,
                     "emails_imported": 0,
                     "message": "No emails found to import"
                 }
             
-            # Store emails in database
-            print("🔄 Storing emails in database...")
-            stored_emails = []
-            for email in emails:
-                try:
-                    # Set account ownership
-                    email.account_owner = actual_account_owner
-                    email.email_holder = user_email
-                    # Categorize email as 'inbox' or 'tasks' using LLM if available
-                    if self.llm_service is not None and hasattr(self.llm_service, 'categorize_email') and callable(self.llm_service.categorize_email):
-                        try:
-                            category_result = self.llm_service.categorize_email(
-                                email_content=email.body,
-                                email_subject=email.subject,
-                                sender=str(email.sender),
-                                recipient=str(email.recipients[0]) if email.recipients else ""
-                            )
-                            # categorize_email is synchronous, do not await
-                            category = category_result
-                            if isinstance(category, str) and category.strip().lower() == 'tasks':
-                                email.set_email_type(EmailType.TASKS)
-                            else:
-                                email.set_email_type(EmailType.INBOX)
-                        except Exception as cat_err:
-                            print(f"⚠️ Failed to categorize email: {cat_err}")
-                            email.set_email_type(EmailType.INBOX)
-                    else:
-                        email.set_email_type(EmailType.INBOX)
-                    # Store email
-                    stored_email = await self.email_repository.save(email)
-                    stored_emails.append(stored_email)
-                    print(f"✅ Stored email: {stored_email.subject[:50]}...")
-                except Exception as e:
-                    print(f"⚠️ Failed to store email {email.subject[:50]}: {str(e)}")
-                    continue
-            
-            print(f"✅ Successfully stored {len(stored_emails)} emails")
+            logger.debug("Stored %d emails (%d failed)", len(stored_emails), len(failed_emails))
             
             # Summarize emails if LLM service is available
             summarized_count = 0
             if self.llm_service and stored_emails:
-                print("🔄 Summarizing emails with LLM...")
                 summarized_count = await self._summarize_emails(stored_emails)
-                print(f"✅ Summarized {summarized_count} emails")
+                logger.debug("Summarized %d emails", summarized_count)
             
             return {
                 "success": True,
@@ -419,35 +476,84 @@ class FetchInitialEmailsUseCase(EmailUseCaseBase):
             }
             
         except Exception as e:
-            print(f"❌ FetchInitialEmailsUseCase failed: {str(e)}")
-            import traceback
-            print(f"❌ Full traceback: {traceback.format_exc()}")
+            logger.exception("FetchInitialEmailsUseCase failed: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "message": f"Failed to import emails: {str(e)}"
             }
     
+    async def _store_batch(
+        self,
+        batch: List[Email],
+        account_owner: str,
+        user_email: str,
+        stored_emails: List[Email],
+        failed_emails: List[Email]
+    ) -> None:
+        """Categorize a batch of fetched emails and store them with one bulk write"""
+        prepared_emails = []
+        for email in batch:
+            try:
+                # Set account ownership
+                email.account_owner = account_owner
+                email.email_holder = user_email
+                email.set_email_type(await self._categorize_email(email))
+                prepared_emails.append(email)
+            except Exception as e:
+                logger.warning("Failed to prepare email %s: %s", email.subject[:50], e)
+                failed_emails.append(email)
+        
+        if not prepared_emails:
+            return
+        try:
+            stored_emails.extend(await self.email_repository.save_many(prepared_emails))
+        except Exception as e:
+            logger.warning("Failed to store %d emails: %s", len(prepared_emails), e)
+            failed_emails.extend(prepared_emails)
+    
+    async def _categorize_email(self, email: Email) -> EmailType:
+        """Categorize email as 'inbox' or 'tasks' using LLM if available"""
+        if self.llm_service is None or not callable(getattr(self.llm_service, 'categorize_email', None)):
+            return EmailType.INBOX
+        try:
+            sender, recipient = _contact_strs(email)
+            # categorize_email is synchronous, run it in a worker thread so the event loop stays free
+            category = await asyncio.to_thread(
+                self.llm_service.categorize_email,
+                email_content=email.body,
+                email_subject=email.subject,
+                sender=sender,
+                recipient=recipient
+            )
+        except Exception as cat_err:
+            logger.warning("Failed to categorize email: %s", cat_err)
+            return EmailType.INBOX
+        if isinstance(category, str) and category.strip().lower() == 'tasks':
+            return EmailType.TASKS
+        return EmailType.INBOX
+    
     async def _summarize_emails(self, emails: List[Email]) -> int:
         """Summarize a list of emails using LLM service"""
         summarized_count = 0
+        to_update: List[Email] = []
         
-        for email in emails:
+        # Skip emails that are already summarized
+        pending = [email for email in emails if not email.summary]
+        for email in pending:
             try:
-                # Skip if already summarized
-                if email.summary:
-                    continue
-                
                 # Summarize email
                 summary_data = {}
                 if self.llm_service is not None and hasattr(self.llm_service, 'summarize_email') and callable(self.llm_service.summarize_email):
-                    maybe_coro = self.llm_service.summarize_email(
+                    sender, recipient = _contact_strs(email)
+                    # summarize_email is synchronous, run it in a worker thread so the event loop stays free
+                    maybe_coro = await asyncio.to_thread(
+                        self.llm_service.summarize_email,
                         email_content=email.body,
                         email_subject=email.subject,
-                        sender=str(email.sender),
-                        recipient=str(email.recipients[0]) if email.recipients else ""
+                        sender=sender,
+                        recipient=recipient
                     )
-                    # summarize_email is synchronous, do not await
                     if maybe_coro is not None and not isinstance(maybe_coro, dict):
                         summary_data = maybe_coro
                     elif isinstance(maybe_coro, dict):
@@ -462,14 +568,16 @@ class FetchInitialEmailsUseCase(EmailUseCaseBase):
                 email.key_topics = summary_data.get('key_topics', [])
                 email.summarized_at = datetime.utcnow()
                 
-                # Save updated email
-                await self.email_repository.save(email)
-                summarized_count += 1
+                # Buffer updated email and write them out in bulk
+                to_update.append(email)
+                if len(to_update) >= SUMMARY_FLUSH_SIZE:
+                    summarized_count += await self._flush_summaries(to_update)
                 
             except Exception as e:
-                print(f"⚠️ Failed to summarize email {email.subject[:50]}: {str(e)}")
+                logger.warning("Failed to summarize email %s: %s", email.subject[:50], e)
                 continue
         
+        summarized_count += await self._flush_summaries(to_update)
         return summarized_count
 
 
@@ -557,23 +665,24 @@ class FetchStarredEmailsUseCase(EmailUseCaseBase):
     async def _summarize_emails(self, emails: List[Email]) -> int:
         """Summarize a list of emails using LLM service"""
         summarized_count = 0
+        to_update: List[Email] = []
         
-        for email in emails:
+        # Skip emails that are already summarized
+        pending = [email for email in emails if not email.summary]
+        for email in pending:
             try:
-                # Skip if already summarized
-                if email.summary:
-                    continue
-                
                 # Summarize email
                 summary_data = {}
                 if self.llm_service is not None and hasattr(self.llm_service, 'summarize_email') and callable(self.llm_service.summarize_email):
-                    maybe_coro = self.llm_service.summarize_email(
+                    sender, recipient = _contact_strs(email)
+                    # summarize_email is synchronous, run it in a worker thread so the event loop stays free
+                    maybe_coro = await asyncio.to_thread(
+                        self.llm_service.summarize_email,
                         email_content=email.body,
                         email_subject=email.subject,
-                        sender=str(email.sender),
-                        recipient=str(email.recipients[0]) if email.recipients else ""
+                        sender=sender,
+                        recipient=recipient
                     )
-                    # summarize_email is synchronous, do not await
                     if maybe_coro is not None and not isinstance(maybe_coro, dict):
                         summary_data = maybe_coro
                     elif isinstance(maybe_coro, dict):
@@ -588,14 +697,16 @@ class FetchStarredEmailsUseCase(EmailUseCaseBase):
                 email.key_topics = summary_data.get('key_topics', [])
                 email.summarized_at = datetime.utcnow()
                 
-                # Save updated email
-                await self.email_repository.save(email)
-                summarized_count += 1
+                # Buffer updated email and write them out in bulk
+                to_update.append(email)
+                if len(to_update) >= SUMMARY_FLUSH_SIZE:
+                    summarized_count += await self._flush_summaries(to_update)
                 
             except Exception as e:
                 print(f"⚠️ Failed to summarize starred email {email.subject[:50]}: {str(e)}")
                 continue
         
+        summarized_count += await self._flush_summaries(to_update)
         return summarized_count
 
 
@@ -636,12 +747,10 @@ class SummarizeEmailUseCase(EmailUseCaseBase):
             email_content = email.body
             if email.html_body:
                 # Use HTML body if available, but strip HTML tags for better analysis
-                import re
-                email_content = re.sub(r'<[^>]+>', '', email.html_body)
+                email_content = _HTML_TAG_RE.sub('', email.html_body)
             
             # Get context information
-            sender = str(email.sender)
-            recipient = str(email.recipients[0]) if email.recipients else ""
+            sender, recipient = _contact_strs(email)
             
             print(f"🔄 Calling LLM service to summarize email...")
             print(f"   - Content length: {len(email_content)} chars")
@@ -650,7 +759,8 @@ class SummarizeEmailUseCase(EmailUseCaseBase):
             print(f"   - Recipient: {recipient}")
             
             # Call LLM service for summarization
-            summarization_result = self.llm_service.summarize_email(
+            summarization_result = await asyncio.to_thread(
+                self.llm_service.summarize_email,
                 email_content=email_content,
                 email_subject=email.subject,
                 sender=sender,
@@ -706,44 +816,76 @@ class SummarizeMultipleEmailsUseCase(EmailUseCaseBase):
         super().__init__(email_repository)
         self.llm_service = llm_service
     
-    async def execute(self, email_ids: List[str], max_concurrent: int = 5) -> Dict[str, Any]:
+    async def execute(
+        self,
+        email_ids: List[str],
+        max_concurrent: int = 5,
+        batch_size: int = SUMMARY_BATCH_SIZE
+    ) -> Dict[str, Any]:
         """Summarize multiple emails using AI"""
         try:
             print(f"🔄 SummarizeMultipleEmailsUseCase.execute called for {len(email_ids)} emails")
             
-            import asyncio
-            from concurrent.futures import ThreadPoolExecutor
+            # Load every email with one multi-get instead of N point reads
+            emails_by_id = await self.email_repository.find_by_ids(email_ids)
             
-            # Create summarization tasks
-            tasks = []
+            # Split off missing and already-summarized emails before any work is scheduled
+            results: List[Any] = []
+            pending: List[Email] = []
+            already_summarized = 0
             for email_id in email_ids:
-                task = self._summarize_single_email(email_id)
-                tasks.append(task)
-            
-            # Execute tasks with concurrency limit
-            results = []
-            for i in range(0, len(tasks), max_concurrent):
-                batch = tasks[i:i + max_concurrent]
-                batch_results = await asyncio.gather(*batch, return_exceptions=True)
-                results.extend(batch_results)
-            
-            # Process results
-            successful = 0
+                email = emails_by_id.get(email_id)
+                if not email:
+                    results.append({
+                        "success": False,
+                        "error": f"Email {email_id} not found"
+                    })
+                elif email.has_summarization():
+                    already_summarized += 1
+                else:
+                    pending.append(email)
+            
+            # Pack emails into batches so each LLM round-trip summarizes several
+            batch_size = max(1, batch_size)
+            batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+            
+            # Bound in-flight LLM calls with a semaphore instead of a thread pool;
+            # the upstream rate limit, not CPU, is the bottleneck here. Every
+            # batch is scheduled up front so a slow call only holds its own slot.
+            # A non-positive limit would deadlock the semaphore, so clamp it.
+            semaphore = asyncio.Semaphore(max(1, max_concurrent))
+            
+            async def _summarize_with_limit(batch: List[Email]) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    return await self._summarize_email_batch(batch)
+            
+            batch_results = await asyncio.gather(
+                *(_summarize_with_limit(batch) for batch in batches),
+                return_exceptions=True
+            )
+            
+            for batch, batch_result in zip(batches, batch_results):
+                if isinstance(batch_result, Exception):
+                    results.extend([batch_result] * len(batch))
+                else:
+                    results.extend(batch_result)
+            
+            # Process results; already-summarized emails count as successful
+            successful = already_summarized
             failed = 0
-            already_summarized = 0
             errors = []
             
             for result in results:
                 if isinstance(result, Exception):
                     failed += 1
-                    errors.append(str(result))
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append(str(result))
                 elif result.get('success'):
                     successful += 1
-                    if result.get('already_summarized'):
-                        already_summarized += 1
                 else:
                     failed += 1
-                    errors.append(result.get('error', 'Unknown error'))
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append(result.get('error', 'Unknown error'))
             
             print(f"✅ Batch summarization completed:")
             print(f"   - Successful: {successful}")
@@ -756,7 +898,7 @@ class SummarizeMultipleEmailsUseCase(EmailUseCaseBase):
                 "successful": successful,
                 "already_summarized": already_summarized,
                 "failed": failed,
-                "errors": errors[:10],  # Limit error list
+                "errors": errors,  # Already capped at MAX_REPORTED_ERRORS
                 "message": f"Processed {len(email_ids)} emails"
             }
             
@@ -768,67 +910,59 @@ class SummarizeMultipleEmailsUseCase(EmailUseCaseBase):
                 "message": "Failed to summarize emails"
             }
     
-    async def _summarize_single_email(self, email_id: str) -> Dict[str, Any]:
-        """Helper method to summarize a single email"""
-        try:
-            # Get email from repository
-            email = await self.email_repository.find_by_id(email_id)
-            if not email:
-                return {
-                    "success": False,
-                    "error": f"Email {email_id} not found"
-                }
-            
-            # Check if already summarized
-            if email.has_summarization():
-                return {
+    def _summarization_payload(self, email: Email) -> Dict[str, str]:
+        """Build the LLM summarization arguments for an email"""
+        # Prepare content for summarization
+        email_content = email.body
+        if email.html_body:
+            email_content = _HTML_TAG_RE.sub('', email.html_body)
+        
+        sender, recipient = _contact_strs(email)
+        return {
+            "email_content": email_content,
+            "email_subject": email.subject,
+            "sender": sender,
+            "recipient": recipient
+        }
+    
+    async def _summarize_email_batch(self, emails: List[Email]) -> List[Dict[str, Any]]:
+        """Helper method to summarize a batch of loaded emails with one LLM request"""
+        # Call LLM service for summarization off the event loop
+        payloads = [self._summarization_payload(email) for email in emails]
+        summarization_results = await asyncio.to_thread(
+            self.llm_service.summarize_emails_batch, payloads
+        )
+        
+        results: List[Dict[str, Any]] = []
+        summarized: List[Email] = []
+        for email, summarization_result in zip(emails, summarization_results):
+            try:
+                # Set summarization data on email
+                email.set_summarization(
+                    summary=summarization_result.get('summary', ''),
+                    main_concept=summarization_result.get('main_concept', ''),
+                    sentiment=summarization_result.get('sentiment', ''),
+                    key_topics=summarization_result.get('key_topics', [])
+                )
+                summarized.append(email)
+                results.append({
                     "success": True,
-                    "already_summarized": True,
-                    "email_id": email_id
-                }
-            
-            # Prepare content for summarization
-            email_content = email.body
-            if email.html_body:
-                import re
-                email_content = re.sub(r'<[^>]+>', '', email.html_body)
-            
-            # Get context information
-            sender = str(email.sender)
-            recipient = str(email.recipients[0]) if email.recipients else ""
-            
-            # Call LLM service for summarization
-            summarization_result = self.llm_service.summarize_email(
-                email_content=email_content,
-                email_subject=email.subject,
-                sender=sender,
-                recipient=recipient
-            )
-            
-            # Set summarization data on email
-            email.set_summarization(
-                summary=summarization_result.get('summary', ''),
-                main_concept=summarization_result.get('main_concept', ''),
-                sentiment=summarization_result.get('sentiment', ''),
-                key_topics=summarization_result.get('key_topics', [])
-            )
-            
-            # Save updated email
-            await self.email_repository.update(email)
-            
-            return {
-                "success": True,
-                "already_summarized": False,
-                "email_id": email_id,
-                "summarization": email.get_summarization_data()
-            }
-            
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "email_id": email_id
-            } 
+                    "already_summarized": False,
+                    "email_id": email.id,
+                    "summarization": email.get_summarization_data()
+                })
+            except Exception as e:
+                results.append({
+                    "success": False,
+                    "error": str(e),
+                    "email_id": email.id
+                })
+        
+        # Save all updated emails in one round-trip
+        if summarized:
+            await self.email_repository.update_many(summarized)
+        
+        return results
 
 
 class FetchSentEmailsUseCase(EmailUseCaseBase):
@@ -840,124 +974,60 @@ class FetchSentEmailsUseCase(EmailUseCaseBase):
         gmail_service,
         llm_service: Optional[LLMService] = None,
         category_repository=None,
-        user_profile_repository=None  # NEW: Inject user_profile_repository
+        user_profile_repository=None,  # NEW: Inject user_profile_repository
+        user_repository=None
     ):
         super().__init__(email_repository)
         self.gmail_service = gmail_service
         self.llm_service = llm_service
         self.category_repository = category_repository
         self.user_profile_repository = user_profile_repository
+        self.user_repository = user_repository
     
     async def execute(self, oauth_token, user_email: str, limit: int = 10, account_owner: Optional[str] = None, user_id: Optional[str] = None) -> Dict[str, Any]:
         """Fetch sent emails from Gmail, store, summarize, and update user profile"""
         try:
-            print(f"🔄 FetchSentEmailsUseCase.execute called:")
-            print(f"   - user_email: {user_email}")
-            print(f"   - limit: {limit}")
-            print(f"   - account_owner: {account_owner}")
-            print(f"   - oauth_token type: {type(oauth_token).__name__}")
-            print(f"   - gmail_service type: {type(self.gmail_service).__name__}")
-            print(f"   - email_repository type: {type(self.email_repository).__name__}")
-            
             # Use account_owner if provided, otherwise use user_email
             actual_account_owner = account_owner or user_email
-            print(f"   - actual_account_owner: {actual_account_owner}")
+            logger.debug(
+                "FetchSentEmailsUseCase.execute: user_email=%s limit=%s account_owner=%s",
+                user_email, limit, actual_account_owner
+            )
             
             # Fetch sent emails from Gmail
-            print("🔄 Calling gmail_service.fetch_sent_emails...")
             emails = await self.gmail_service.fetch_sent_emails(oauth_token, user_email, limit)
-            print(f"📧 Gmail service returned {len(emails) if emails else 0} sent emails")
+            logger.debug("Gmail service returned %d sent emails", len(emails) if emails else 0)
             
             if not emails:
-                print("⚠️ No sent emails found to import")
+                logger.debug("No sent emails found to import for %s", user_email)
                 return {
                     "success": True,
                     "emails_imported": 0,
                     "message": "No sent emails found to import"
                 }
             
-            # Store emails in database
-            print("🔄 Storing sent emails in database...")
+            # Set account ownership and the SENT type in one pass, then store with one bulk write
+            Email.prepare_for_sent_import(emails, actual_account_owner, user_email)
+            
             stored_emails = []
-            for email in emails:
-                try:
-                    # Set account ownership
-                    email.account_owner = actual_account_owner
-                    email.email_holder = user_email
-                    # Set email type to SENT
-                    email.set_email_type(EmailType.SENT)
-                    # Store email
-                    stored_email = await self.email_repository.save(email)
-                    stored_emails.append(stored_email)
-                    print(f"✅ Stored sent email: {stored_email.subject[:50]}...")
-                except Exception as e:
-                    print(f"⚠️ Failed to store sent email {email.subject[:50]}: {str(e)}")
-                    continue
+            failed_emails = []
+            try:
+                stored_emails = await self.email_repository.save_many(emails)
+            except Exception as e:
+                logger.warning("Failed to store %d sent emails: %s", len(emails), e)
+                failed_emails.extend(emails)
             
-            print(f"✅ Successfully stored {len(stored_emails)} sent emails")
+            logger.debug("Stored %d sent emails (%d failed)", len(stored_emails), len(failed_emails))
             
             # Summarize emails if LLM service is available
             summarized_count = 0
             if self.llm_service and stored_emails:
-                print("🔄 Summarizing sent emails with LLM...")
                 summarized_count = await self._summarize_emails(stored_emails)
-                print(f"✅ Summarized {summarized_count} sent emails")
-            
-            # --- NEW: Aggregate all sent emails and update user profile using LLM ---
-            if self.llm_service and (account_owner or user_id):
-                print("🔄 Aggregating ALL sent emails for user profile generation...")
-                # Fetch all sent emails for the user
-                all_sent_emails = await self.email_repository.find_by_sender(user_email, email_type=EmailType.SENT)
-                email_samples = []
-                for email in all_sent_emails:
-                    email_samples.append({
-                        "subject": email.subject,
-                        "body": email.body,
-                        "summary": email.summary,
-                        "sentiment": email.sentiment,
-                        "main_concept": email.main_concept,
-                        "key_topics": email.key_topics
-                    })
-                # Build prompt for LLM
-                prompt = (
-                    "Analyze the following list of sent emails and generate a JSON user profile that describes "
-                    "the user's typical tone, writing style, common structures, and favorite phrases. "
-                    "Be concise and helpful. Respond ONLY with valid JSON in this format: "
-                    '{"dominant_tone": "string", "tone_distribution": {"tone": count, ...}, "common_structures": ["structure1", ...], "favorite_phrases": ["phrase1", ...], "summary": "A helpful summary of the user\'s email style."}'
-                    "\n\nEmails: " + str(email_samples)
-                )
-                try:
-                    llm_response = self.llm_service.generate_content(
-                        system_instruction="You are an expert at analyzing email writing style and generating user profiles.",
-                        query=prompt,
-                        response_type="text/plain"
-                    )
-                    import json
-                    profile_data = json.loads(llm_response)
-                    print(f"[DEBUG] LLM profile_data to be saved: {profile_data}")
-                    # Store in user document
-                    from app.infrastructure.di.container import get_container
-                    container = get_container()
-                    user_repo = container.user_repository()
-                    user = await user_repo.find_by_email(user_email)
-                    if user:
-                        user.user_profile = profile_data
-                        print(f"[DEBUG] About to update user {user.email} with profile: {user.user_profile}")
-                        await user_repo.update(user)
-                        print(f"[DEBUG] User profile (LLM, all sent emails) updated for user: {user.email}")
-                except Exception as e:
-                    print(f"⚠️ Failed to generate user profile with LLM: {e}")
-                    # Fallback: set a test profile to verify update
-                    from app.infrastructure.di.container import get_container
-                    container = get_container()
-                    user_repo = container.user_repository()
-                    user = await user_repo.find_by_email(user_email)
-                    if user:
-                        user.user_profile = {"test": "value", "error": str(e)}
-                        print(f"[DEBUG] About to update user {user.email} with fallback profile: {user.user_profile}")
-                        await user_repo.update(user)
-                        print(f"[DEBUG] Fallback user_profile set for user: {user.email}")
-            # --- END NEW ---
+                logger.debug("Summarized %d sent emails", summarized_count)
+            
+            # Regenerate the user profile in the background, off the request path
+            if self.llm_service and self.user_repository and (account_owner or user_id):
+                self._schedule_profile_regeneration(user_email)
             
             return {
                 "success": True,
@@ -967,49 +1037,137 @@ class FetchSentEmailsUseCase(EmailUseCaseBase):
             }
             
         except Exception as e:
-            print(f"❌ FetchSentEmailsUseCase failed: {str(e)}")
-            import traceback
-            print(f"❌ Full traceback: {traceback.format_exc()}")
+            logger.exception("FetchSentEmailsUseCase failed: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "message": f"Failed to import sent emails: {str(e)}"
             } 
 
+    def _schedule_profile_regeneration(self, user_email: str) -> None:
+        """Start a background profile regeneration unless one is running or succeeded recently"""
+        now = time.monotonic()
+        # Drop timestamps too old to block anything, so the map only holds recent runs
+        while _profile_last_run:
+            oldest_email, oldest_run = next(iter(_profile_last_run.items()))
+            if now - oldest_run < PROFILE_REGENERATION_INTERVAL:
+                break
+            del _profile_last_run[oldest_email]
+        
+        last_run = _profile_last_run.get(user_email)
+        if last_run is not None:
+            logger.debug("Skipping user profile regeneration for %s, last run %ds ago", user_email, now - last_run)
+            return
+        if user_email in _profile_in_flight:
+            logger.debug("Skipping user profile regeneration for %s, one is already running", user_email)
+            return
+        _profile_in_flight.add(user_email)
+        task = asyncio.create_task(self._regenerate_profile(user_email))
+        # Keep a reference so the task is not garbage collected before it finishes
+        _profile_tasks.add(task)
+        task.add_done_callback(_profile_tasks.discard)
+        task.add_done_callback(lambda _: _profile_in_flight.discard(user_email))
+    
+    @staticmethod
+    def _record_profile_run(user_email: str) -> None:
+        """Remember a successful regeneration so the next one waits out the interval"""
+        _profile_last_run.pop(user_email, None)
+        _profile_last_run[user_email] = time.monotonic()
+    
+    async def _regenerate_profile(self, user_email: str) -> None:
+        """Aggregate the user's sent emails and update their profile using LLM"""
+        try:
+            user_repo = self.user_repository
+            user = await user_repo.find_by_email(user_email)
+            if user is None:
+                # e.g. a secondary account added to another user; there is no profile to store
+                logger.debug("Skipping user profile regeneration for %s: no user with that email", user_email)
+                return
+            # Fetch only the summary fields of the user's most recent sent emails
+            email_samples = await self.email_repository.find_sender_summaries(
+                user_email, email_type=EmailType.SENT, limit=PROFILE_SAMPLE_LIMIT
+            )
+            # Skip the LLM call when the profile was already built from this exact sample set
+            profile_cache_key = _profile_cache_key(
+                getattr(self.llm_service, 'model_name', ''),
+                [sample["id"] for sample in email_samples]
+            )
+            if user.user_profile and user.profile_cache_key == profile_cache_key:
+                logger.debug("User profile is up to date for user: %s", user.email)
+                self._record_profile_run(user_email)
+                return
+            
+            email_samples = [
+                {key: value for key, value in sample.items() if key != "id"}
+                for sample in email_samples
+            ]
+            # Build prompt for LLM
+            samples_json = dumps_compact(email_samples)[:PROFILE_PROMPT_MAX_CHARS]
+            prompt = PROFILE_PROMPT_HEADER + samples_json
+            try:
+                # Run the blocking LLM call in a worker thread so the event loop stays free
+                llm_response = await asyncio.to_thread(
+                    self.llm_service.generate_content,
+                    system_instruction=PROFILE_SYSTEM_INSTRUCTION,
+                    query=prompt,
+                    response_type="text/plain"
+                )
+                profile_data = loads_json(llm_response)
+                # Store in user document
+                await user_repo.update_profile(user.id, profile_data, profile_cache_key)
+                logger.debug("User profile updated for user: %s", user.email)
+                self._record_profile_run(user_email)
+            except Exception as e:
+                logger.warning("Failed to generate user profile with LLM: %s", e)
+                # Fallback: set a test profile to verify update
+                await user_repo.update_profile(user.id, {"test": "value", "error": str(e)})
+                logger.debug("Fallback user_profile set for user: %s", user.email)
+        except Exception as e:
+            logger.exception("Background user profile regeneration failed for %s", user_email)
+    
     async def _summarize_emails(self, emails: list) -> int:
         """Summarize a list of emails using LLM service"""
         summarized_count = 0
-        from datetime import datetime
-        for email in emails:
+        if self.llm_service is None or not hasattr(self.llm_service, 'summarize_emails_batch'):
+            return summarized_count
+        
+        # Skip emails that are already summarized
+        pending = [email for email in emails if not email.summary]
+        to_update: List[Email] = []
+        for i in range(0, len(pending), SUMMARY_BATCH_SIZE):
+            batch = pending[i:i + SUMMARY_BATCH_SIZE]
+            payloads = []
+            for email in batch:
+                sender, recipient = _contact_strs(email)
+                payloads.append({
+                    "email_content": email.body,
+                    "email_subject": email.subject,
+                    "sender": sender,
+                    "recipient": recipient
+                })
             try:
-                # Skip if already summarized
-                if email.summary:
-                    continue
-                summary_data = {}
-                if self.llm_service is not None and hasattr(self.llm_service, 'summarize_email') and callable(self.llm_service.summarize_email):
-                    maybe_coro = self.llm_service.summarize_email(
-                        email_content=email.body,
-                        email_subject=email.subject,
-                        sender=str(email.sender),
-                        recipient=str(email.recipients[0]) if email.recipients else ""
-                    )
-                    # summarize_email is synchronous, do not await
-                    if maybe_coro is not None and not isinstance(maybe_coro, dict):
-                        summary_data = maybe_coro
-                    elif isinstance(maybe_coro, dict):
-                        summary_data = maybe_coro
-                if not isinstance(summary_data, dict):
-                    summary_data = {}
-                # Update email with summary data
-                email.summary = summary_data.get('summary')
-                email.main_concept = summary_data.get('main_concept')
-                email.sentiment = summary_data.get('sentiment')
-                email.key_topics = summary_data.get('key_topics', [])
-                email.summarized_at = datetime.utcnow()
-                # Save updated email
-                await self.email_repository.save(email)
-                summarized_count += 1
+                # summarize_emails_batch is synchronous, run it in a worker thread
+                summaries = await asyncio.to_thread(self.llm_service.summarize_emails_batch, payloads)
             except Exception as e:
-                print(f"⚠️ Failed to summarize email {email.subject[:50]}: {str(e)}")
+                logger.warning("Failed to summarize batch of %d emails: %s", len(batch), e)
                 continue
-        return summarized_count 
\ No newline at end of file
+            
+            for email, summary_data in zip(batch, summaries):
+                try:
+                    if not isinstance(summary_data, dict):
+                        summary_data = {}
+                    # Update email with summary data
+                    email.summary = summary_data.get('summary')
+                    email.main_concept = summary_data.get('main_concept')
+                    email.sentiment = summary_data.get('sentiment')
+                    email.key_topics = summary_data.get('key_topics', [])
+                    email.summarized_at = datetime.utcnow()
+                    # Buffer updated email and write them out in bulk
+                    to_update.append(email)
+                    if len(to_update) >= SUMMARY_FLUSH_SIZE:
+                        summarized_count += await self._flush_summaries(to_update)
+                except Exception as e:
+                    logger.warning("Failed to summarize email %s: %s", email.subject[:50], e)
+                    continue
+        summarized_count += await self._flush_summaries(to_update)
+        return summarized_count 
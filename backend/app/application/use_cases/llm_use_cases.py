@@ -4,17 +4,110 @@ LLM Use Cases
 Application use cases for Gemini-powered features.
 """
 
-from typing import Dict, List, Optional, Union, Any
-from PIL import Image
-from ...domain.entities.email import Email
+import asyncio
+import functools
+import logging
+import re
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union, Any
+from ..dto.llm_dto import ComposedEmailBodyDTO, SmartComposedEmailDTO
 from ...infrastructure.external_services.llm_service import LLMService
+from ...infrastructure.cache.llm_cache import LLMCache
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+# Common reply indicators, compiled into one alternation so the text is scanned once
+REPLY_INDICATORS = (
+    "re:", "reply:", "responding to", "in response to", "regarding your email",
+    "thank you for your email", "i received your email", "i got your message",
+    "as per your email", "following up on", "in reply to", "answering your",
+    "you mentioned", "you wrote", "you said", "your email", "your message"
+)
+# Number of leading characters of the query searched for reply indicators
+REPLY_SCAN_WINDOW = 512
+_REPLY_INDICATOR_RE = re.compile("|".join(map(re.escape, REPLY_INDICATORS)), re.IGNORECASE)
+
+# How long (seconds) ComposeEmailUseCase reuses a user's profile lookup, and how many users it keeps
+PROFILE_CACHE_TTL = 60
+PROFILE_CACHE_MAX_ENTRIES = 1024
+
+# How long (seconds) a Gemini health check result is reused by GeminiHealthCheckUseCase
+HEALTH_CHECK_TTL = 5.0
+
+# Maximum concurrent Gemini calls for the use cases' execute_batch methods
+BATCH_CONCURRENCY = 16
+
+# Prompt pieces for ComposeEmailUseCase. Static text comes first and the
+# per-request text is only substituted at the very end of each template.
+COMPOSE_SYSTEM_PREAMBLE = "You are an expert email composer. Compose an email body only. Do not include subject or signature."
+PROFILE_BLOCK_TEMPLATE = (
+    "User's email style profile:\n"
+    "- Dominant tone: {dominant_tone}\n"
+    "- Common structures: {structures}\n"
+    "- Favorite phrases: {phrases}\n"
+    "- Summary: {summary}\n"
+)
+REPLY_TEMPLATE = "Reply to the following email in the user's style.\n\nEmail:\n{text}"
+STARTED_TEMPLATE = "Complete the following started email in the user's style.\n\nStarted email:\n{text}"
+
+
+@functools.lru_cache(maxsize=PROFILE_CACHE_MAX_ENTRIES)
+def _render_system_instruction(
+    dominant_tone: str,
+    structures: Tuple[str, ...],
+    phrases: Tuple[str, ...],
+    summary: str
+) -> str:
+    """Render the compose system instruction for one set of profile fields"""
+    return COMPOSE_SYSTEM_PREAMBLE + "\n\n" + PROFILE_BLOCK_TEMPLATE.format_map({
+        "dominant_tone": dominant_tone,
+        "structures": ", ".join(structures),
+        "phrases": ", ".join(phrases),
+        "summary": summary,
+    })
+
+
+async def _cached(llm_cache: Optional[LLMCache], generate: Callable[[], Awaitable[Any]], **request: Any) -> Any:
+    """Return a cached LLM response for the request, generating and storing it on a miss"""
+    if llm_cache is None:
+        return await generate()
+    key = llm_cache.make_key(**request)
+    cached = await llm_cache.get(key)
+    if cached is not None:
+        return cached
+    result = await generate()
+    await llm_cache.set(key, result)
+    return result
+
+
+async def _gather_bounded(llm_service: LLMService, calls: List[Callable[[], Awaitable[Any]]]) -> List[Any]:
+    """
+    Run the calls concurrently, at most BATCH_CONCURRENCY (or the service's own
+    limit, if lower) at a time. Results keep the order of the calls; a failed
+    call is returned as its exception instead of failing the whole batch.
+    """
+    # No point fanning out beyond what the service lets through at once
+    semaphore = asyncio.Semaphore(min(BATCH_CONCURRENCY, llm_service.max_concurrency))
+    
+    async def run(call: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            return await call()
+    
+    return await asyncio.gather(*(run(call) for call in calls), return_exceptions=True)
 
 
 class GenerateEmailContentUseCase:
     """Use case for generating email content using Gemini"""
     
-    def __init__(self, llm_service: LLMService):
+    __slots__ = ("llm_service", "llm_cache")
+    
+    def __init__(self, llm_service: LLMService, llm_cache: Optional[LLMCache] = None):
         self.llm_service = llm_service
+        self.llm_cache = llm_cache
     
     def execute(self, prompt: str, context: str = "") -> str:
         """
@@ -28,11 +121,42 @@ class GenerateEmailContentUseCase:
             str: Generated email content
         """
         return self.llm_service.generate_email_content(prompt, context)
+    
+    async def aexecute(self, prompt: str, context: str = "") -> str:
+        """Async variant of execute that does not block the event loop."""
+        return await _cached(
+            self.llm_cache,
+            lambda: self.llm_service.agenerate_email_content(prompt, context),
+            kind="email_content", model=self.llm_service.model_name, prompt=prompt, context=context
+        )
+    
+    async def execute_batch(self, requests: List[Dict[str, Any]]) -> List[Union[str, BaseException]]:
+        """
+        Run content generation for several requests concurrently.
+        
+        Args:
+            requests: Keyword arguments for aexecute, one dict per request
+            
+        Returns:
+            List: One result per request, in order; a failed request is
+                returned as its exception instead of failing the whole batch
+        """
+        return await _gather_bounded(
+            self.llm_service,
+            [functools.partial(self.aexecute, **request) for request in requests]
+        )
+    
+    async def stream(self, prompt: str, context: str = "") -> AsyncIterator[str]:
+        """Stream the generated email content as it is produced."""
+        async for chunk in self.llm_service.astream_email_content(prompt, context):
+            yield chunk
 
 
 class AnalyzeEmailSentimentUseCase:
     """Use case for analyzing email sentiment and tone using Gemini"""
     
+    __slots__ = ("llm_service",)
+    
     def __init__(self, llm_service: LLMService):
         self.llm_service = llm_service
     
@@ -47,13 +171,36 @@ class AnalyzeEmailSentimentUseCase:
             Dict: Analysis results including sentiment, tone, and suggestions
         """
         return self.llm_service.analyze_email_sentiment(email_content)
+    
+    async def aexecute(self, email_content: str) -> Dict[str, Any]:
+        """Async variant of execute that does not block the event loop."""
+        return await self.llm_service.aanalyze_email_sentiment(email_content)
+    
+    async def execute_batch(self, requests: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Run sentiment analysis for several requests concurrently.
+        
+        Args:
+            requests: Keyword arguments for aexecute, one dict per request
+            
+        Returns:
+            List: One result per request, in order; a failed request is
+                returned as its exception instead of failing the whole batch
+        """
+        return await _gather_bounded(
+            self.llm_service,
+            [functools.partial(self.aexecute, **request) for request in requests]
+        )
 
 
 class SuggestEmailSubjectUseCase:
     """Use case for suggesting email subject lines using Gemini"""
     
-    def __init__(self, llm_service: LLMService):
+    __slots__ = ("llm_service", "llm_cache")
+    
+    def __init__(self, llm_service: LLMService, llm_cache: Optional[LLMCache] = None):
         self.llm_service = llm_service
+        self.llm_cache = llm_cache
     
     def execute(self, email_content: str, context: str = "") -> str:
         """
@@ -67,13 +214,40 @@ class SuggestEmailSubjectUseCase:
             str: Suggested subject line
         """
         return self.llm_service.suggest_email_subject(email_content, context)
+    
+    async def aexecute(self, email_content: str, context: str = "") -> str:
+        """Async variant of execute that does not block the event loop."""
+        return await _cached(
+            self.llm_cache,
+            lambda: self.llm_service.asuggest_email_subject(email_content, context),
+            kind="email_subject", model=self.llm_service.aux_model_name, content=email_content, context=context
+        )
+    
+    async def execute_batch(self, requests: List[Dict[str, Any]]) -> List[Union[str, BaseException]]:
+        """
+        Run subject suggestion for several requests concurrently.
+        
+        Args:
+            requests: Keyword arguments for aexecute, one dict per request
+            
+        Returns:
+            List: One result per request, in order; a failed request is
+                returned as its exception instead of failing the whole batch
+        """
+        return await _gather_bounded(
+            self.llm_service,
+            [functools.partial(self.aexecute, **request) for request in requests]
+        )
 
 
 class GenerateEmailResponseUseCase:
     """Use case for generating email responses"""
     
-    def __init__(self, llm_service: LLMService):
+    __slots__ = ("llm_service", "llm_cache")
+    
+    def __init__(self, llm_service: LLMService, llm_cache: Optional[LLMCache] = None):
         self.llm_service = llm_service
+        self.llm_cache = llm_cache
     
     def execute(self, 
                 original_email: str, 
@@ -90,20 +264,70 @@ class GenerateEmailResponseUseCase:
         Returns:
             str: Generated response
         """
+        return self.llm_service.generate_email_content(
+            self._build_prompt(original_email, response_type, additional_context)
+        )
+    
+    async def aexecute(self, 
+                       original_email: str, 
+                       response_type: str = "acknowledge",
+                       additional_context: str = "") -> str:
+        """Async variant of execute that does not block the event loop."""
+        prompt = self._build_prompt(original_email, response_type, additional_context)
+        return await _cached(
+            self.llm_cache,
+            lambda: self.llm_service.agenerate_email_content(prompt),
+            kind="email_response", model=self.llm_service.model_name, prompt=prompt
+        )
+    
+    async def execute_batch(self, requests: List[Dict[str, Any]]) -> List[Union[str, BaseException]]:
+        """
+        Run response generation for several requests concurrently.
+        
+        Args:
+            requests: Keyword arguments for aexecute, one dict per request
+            
+        Returns:
+            List: One result per request, in order; a failed request is
+                returned as its exception instead of failing the whole batch
+        """
+        return await _gather_bounded(
+            self.llm_service,
+            [functools.partial(self.aexecute, **request) for request in requests]
+        )
+    
+    async def stream(self, 
+                     original_email: str, 
+                     response_type: str = "acknowledge",
+                     additional_context: str = "") -> AsyncIterator[str]:
+        """Stream the generated response as it is produced."""
+        async for chunk in self.llm_service.astream_email_content(
+            self._build_prompt(original_email, response_type, additional_context)
+        ):
+            yield chunk
+    
+    def _build_prompt(self, original_email: str, response_type: str, additional_context: str) -> str:
+        """Build the generation prompt for a response to the given email."""
         prompt = f"Generate a {response_type} response to the following email:\n\n{original_email}"
         
         if additional_context:
             prompt += f"\n\nAdditional context: {additional_context}"
         
-        return self.llm_service.generate_email_content(prompt)
+        return prompt
 
 
 class ComposeEmailUseCase:
     """Use case for composing emails with user profile integration"""
     
+    __slots__ = ("llm_service", "user_repository", "_profile_cache", "_inflight")
+    
     def __init__(self, llm_service: LLMService, user_repository=None):
         self.llm_service = llm_service
         self.user_repository = user_repository
+        # user_id -> (fetched at, time.monotonic(); user profile or None)
+        self._profile_cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+        # (user_id, query) -> compose task currently running for that request
+        self._inflight: Dict[Tuple[str, str], "asyncio.Task[ComposedEmailBodyDTO]"] = {}
     
     def _detect_email_type(self, text: str) -> str:
         """
@@ -115,95 +339,139 @@ class ComposeEmailUseCase:
         Returns:
             str: 'reply' if it appears to be a reply, 'started' if it appears to be a started email
         """
-        # Convert to lowercase for easier analysis
-        text_lower = text.lower().strip()
+        # Reply indicators show up in the opening of an email, so only its head
+        # is scanned; endpos bounds the search without slicing a copy
+        if _REPLY_INDICATOR_RE.search(text, 0, REPLY_SCAN_WINDOW):
+            return "reply"
         
-        # Common reply indicators
-        reply_indicators = [
-            "re:", "reply:", "responding to", "in response to", "regarding your email",
-            "thank you for your email", "i received your email", "i got your message",
-            "as per your email", "following up on", "in reply to", "answering your",
-            "you mentioned", "you wrote", "you said", "your email", "your message"
-        ]
+        # Short or incomplete text, or no clear reply indicators: a started email
+        return "started"
+    
+    async def _get_user_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get the user's profile, reusing a recent lookup for the same user"""
+        if not self.user_repository:
+            return None
         
-        # Check if text contains reply indicators
-        for indicator in reply_indicators:
-            if indicator in text_lower:
-                return "reply"
+        now = time.monotonic()
+        cached = self._profile_cache.get(user_id)
+        if cached and now - cached[0] < PROFILE_CACHE_TTL:
+            return cached[1]
         
-        # Check if text starts with common email patterns that suggest it's a reply
-        if text_lower.startswith(("hi", "hello", "dear")) and any(indicator in text_lower for indicator in ["your email", "your message", "re:", "reply:"]):
-            return "reply"
-        
-        # If text is very short or incomplete, it's likely a started email
-        if len(text.strip()) < 50:
-            return "started"
+        user_profile = None
+        try:
+            user = await self.user_repository.find_by_id(user_id)
+            if user and user.user_profile:
+                user_profile = user.user_profile
+                logger.debug("Using user profile for %s", user.email.value)
+            else:
+                logger.debug("No user profile available for user %s", user_id)
+        except Exception as e:
+            # Don't cache failures so the next request retries the lookup
+            logger.warning("Error fetching user profile: %s", e)
+            return None
         
-        # Default to started email if no clear reply indicators
-        return "started"
+        if len(self._profile_cache) >= PROFILE_CACHE_MAX_ENTRIES:
+            self._profile_cache.pop(next(iter(self._profile_cache)))
+        self._profile_cache[user_id] = (now, user_profile)
+        return user_profile
     
-    async def execute(self, user_id: str, query: str) -> dict:
+    def _build_system_instruction(self, user_profile: Optional[Dict[str, Any]]) -> str:
+        """Build the static composer preamble followed by the user's profile block"""
+        if not user_profile:
+            return COMPOSE_SYSTEM_PREAMBLE
+        return _render_system_instruction(
+            user_profile.get("dominant_tone", "professional"),
+            tuple(user_profile.get("common_structures", ())),
+            tuple(user_profile.get("favorite_phrases", ())),
+            user_profile.get("summary", "")
+        )
+    
+    async def execute(self, user_id: str, query: str) -> ComposedEmailBodyDTO:
         """
         Compose an email body using the user's profile and the provided query.
         Args:
             user_id (str): ID of the user composing the email
             query (str): The query for composing the email (email to reply to, or any text)
         Returns:
-            dict: { 'body': <generated email body as plain text> }
+            ComposedEmailBodyDTO: The generated email body as plain text
         """
-        # Get user profile if available
-        user_profile = None
-        user_profile_used = False
-        if self.user_repository:
-            try:
-                user = await self.user_repository.find_by_id(user_id)
-                if user and user.user_profile:
-                    user_profile = user.user_profile
-                    user_profile_used = True
-                    print(f"✅ Using user profile for {user.email.value}")
-                else:
-                    print(f"ℹ️ No user profile available for user {user_id}")
-            except Exception as e:
-                print(f"⚠️ Error fetching user profile: {e}")
+        # Identical requests already in flight share that call's result
+        key = (user_id, query)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._compose(user_id, query))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller going away doesn't cancel the call for the others
+        return await asyncio.shield(task)
+    
+    async def _compose(self, user_id: str, query: str) -> ComposedEmailBodyDTO:
+        """Compose the full email body from the stream"""
+        body = "".join([chunk async for chunk in self.stream(user_id, query)])
+        return ComposedEmailBodyDTO(body=body)
+    
+    async def execute_batch(self, requests: List[Dict[str, str]]) -> List[Union[ComposedEmailBodyDTO, BaseException]]:
+        """
+        Compose several email bodies concurrently.
+        
+        Args:
+            requests (List[Dict[str, str]]): Items with 'user_id' and 'query' keys
+        Returns:
+            List: One result per request, in order; a failed composition is
+                returned as its exception instead of failing the whole batch
+        """
+        # Identical requests are composed once and share the result
+        unique: Dict[Tuple[str, str], int] = {}
+        for request in requests:
+            unique.setdefault((request["user_id"], request["query"]), len(unique))
+        
+        # Warm the profile cache with one lookup per distinct user, so requests
+        # for the same user don't race each other to the repository
+        await asyncio.gather(*(self._get_user_profile(user_id) for user_id in {user_id for user_id, _ in unique}))
+        
+        results = await _gather_bounded(
+            self.llm_service,
+            [functools.partial(self.execute, user_id, query) for user_id, query in unique]
+        )
+        return [results[unique[(request["user_id"], request["query"])]] for request in requests]
+    
+    async def stream(self, user_id: str, query: str) -> AsyncIterator[str]:
+        """Stream the composed email body as it is produced."""
+        # Only suspend for the profile lookup when there is a repository to ask
+        user_profile = await self._get_user_profile(user_id) if self.user_repository else None
+        system_instruction, prompt = self._build_prompt(user_profile, query)
+        async for chunk in self.llm_service.astream_content(
+            system_instruction=system_instruction,
+            query=prompt
+        ):
+            yield chunk
+    
+    def _build_prompt(self, user_profile: Optional[Dict[str, Any]], query: str) -> Tuple[str, str]:
+        """Build the (system_instruction, prompt) pair for the user's query."""
         # Detect email type
         email_type = self._detect_email_type(query)
-        print(f"🔍 Detected email type: {email_type}")
-        # Build system instruction
-        system_instruction = "You are an expert email composer. Compose an email body only. Do not include subject or signature."
-        if user_profile:
-            profile_context = f"""
-User's email style profile:
-- Dominant tone: {user_profile.get('dominant_tone', 'professional')}
-- Common structures: {', '.join(user_profile.get('common_structures', []))}
-- Favorite phrases: {', '.join(user_profile.get('favorite_phrases', []))}
-- Summary: {user_profile.get('summary', '')}
-"""
-            system_instruction += "\n" + profile_context
-        # Compose prompt
-        if email_type == "reply":
-            prompt = f"Reply to the following email in the user's style.\n\nEmail:\n{query}"
-        else:
-            prompt = f"Complete the following started email in the user's style.\n\nStarted email:\n{query}"
-        # Call LLM service
-        body = self.llm_service.generate_content(
-            system_instruction=system_instruction,
-            query=prompt,
-            response_type="text/plain"
-        )
-        return {"body": body}
+        logger.debug("Detected email type: %s", email_type)
+        # Static text first, per-user profile next, per-request text last, so
+        # consecutive requests share the longest possible prompt prefix
+        system_instruction = self._build_system_instruction(user_profile)
+        template = REPLY_TEMPLATE if email_type == "reply" else STARTED_TEMPLATE
+        return system_instruction, template.format(text=query)
 
 
 class SmartEmailComposerUseCase:
     """Use case for smart email composition with multiple Gemini features"""
     
-    def __init__(self, llm_service: LLMService):
+    __slots__ = ("llm_service", "llm_cache")
+    
+    def __init__(self, llm_service: LLMService, llm_cache: Optional[LLMCache] = None):
         self.llm_service = llm_service
+        self.llm_cache = llm_cache
     
     def execute(self, 
                 purpose: str, 
                 recipient_context: str = "", 
                 tone: str = "professional",
-                include_subject: bool = True) -> Dict[str, str]:
+                include_subject: bool = True) -> SmartComposedEmailDTO:
         """
         Compose a complete email using multiple Gemini features.
         
@@ -214,29 +482,88 @@ class SmartEmailComposerUseCase:
             include_subject (bool): Whether to generate a subject line
             
         Returns:
-            Dict: Dictionary containing subject and content
+            SmartComposedEmailDTO: Generated content and, if requested, subject
         """
-        # Build the prompt with tone and context
-        prompt = f"Write a {tone} email for the following purpose: {purpose}"
-        if recipient_context:
-            prompt += f"\n\nRecipient context: {recipient_context}"
+        prompt = self._build_prompt(purpose, recipient_context, tone)
         
         # Generate email content
         content = self.llm_service.generate_email_content(prompt)
         
-        result = {"content": content}
-        
         # Generate subject line if requested
+        subject = None
         if include_subject:
             subject = self.llm_service.suggest_email_subject(content, recipient_context)
-            result["subject"] = subject
         
-        return result
+        return SmartComposedEmailDTO(content=content, subject=subject)
+    
+    async def aexecute(self, 
+                       purpose: str, 
+                       recipient_context: str = "", 
+                       tone: str = "professional",
+                       include_subject: bool = True) -> SmartComposedEmailDTO:
+        """Async variant of execute that does not block the event loop."""
+        # The cache stores the JSON-friendly dict; wrap it once on the way out
+        result = await _cached(
+            self.llm_cache,
+            lambda: self._compose(purpose, recipient_context, tone, include_subject),
+            kind="smart_compose", model=self.llm_service.model_name, purpose=purpose,
+            context=recipient_context, tone=tone, include_subject=include_subject
+        )
+        return SmartComposedEmailDTO(content=result["content"], subject=result.get("subject"))
+    
+    async def execute_batch(self, requests: List[Dict[str, Any]]) -> List[Union[SmartComposedEmailDTO, BaseException]]:
+        """
+        Run smart composition for several requests concurrently.
+        
+        Args:
+            requests: Keyword arguments for aexecute, one dict per request
+            
+        Returns:
+            List: One result per request, in order; a failed request is
+                returned as its exception instead of failing the whole batch
+        """
+        return await _gather_bounded(
+            self.llm_service,
+            [functools.partial(self.aexecute, **request) for request in requests]
+        )
+    
+    async def _compose(self, 
+                       purpose: str, 
+                       recipient_context: str, 
+                       tone: str,
+                       include_subject: bool) -> Dict[str, str]:
+        """Generate the email body and, if requested, its subject"""
+        prompt = self._build_prompt(purpose, recipient_context, tone)
+        
+        if not include_subject:
+            return {"content": await self.llm_service.agenerate_email_content(prompt)}
+        
+        # Ask for body and subject in one request; fall back to two concurrent
+        # requests if the model does not return the expected JSON object
+        try:
+            return await self.llm_service.agenerate_email_with_subject(prompt)
+        except ValueError as e:
+            logger.warning("Structured compose failed, generating subject separately: %s", e)
+        
+        content, subject = await asyncio.gather(
+            self.llm_service.agenerate_email_content(prompt),
+            self.llm_service.asuggest_email_subject_from_purpose(purpose, recipient_context)
+        )
+        return {"content": content, "subject": subject}
+    
+    def _build_prompt(self, purpose: str, recipient_context: str, tone: str) -> str:
+        """Build the prompt with tone and context"""
+        prompt = f"Write a {tone} email for the following purpose: {purpose}"
+        if recipient_context:
+            prompt += f"\n\nRecipient context: {recipient_context}"
+        return prompt
 
 
 class GeminiChatUseCase:
     """Use case for managing Gemini chat sessions"""
     
+    __slots__ = ("llm_service",)
+    
     def __init__(self, llm_service: LLMService):
         self.llm_service = llm_service
     
@@ -277,6 +604,10 @@ class GeminiChatUseCase:
         """
         return self.llm_service.send_message(message, session_id, model_name)
     
+    async def asend_message(self, message: str, session_id: str, model_name: Optional[str] = None) -> str:
+        """Async variant of send_message that does not block the event loop."""
+        return await self.llm_service.asend_message(message, session_id, model_name)
+    
     def end_chat(self, session_id: str) -> bool:
         """
         End a chat session.
@@ -293,13 +624,15 @@ class GeminiChatUseCase:
 class GeminiVisionUseCase:
     """Use case for Gemini vision capabilities"""
     
+    __slots__ = ("llm_service",)
+    
     def __init__(self, llm_service: LLMService):
         self.llm_service = llm_service
     
     def analyze_image(self, 
                      system_instruction: str,
                      query: str,
-                     image_data: Union[str, bytes, Image.Image],
+                     image_data: Union[str, bytes, "Image.Image"],
                      model_name: Optional[str] = None) -> str:
         """
         Analyze an image using Gemini Vision.
@@ -316,11 +649,33 @@ class GeminiVisionUseCase:
         return self.llm_service.generate_content_with_vision(
             system_instruction, query, image_data, model_name
         )
+    
+    async def aanalyze_image(self, 
+                             system_instruction: str,
+                             query: str,
+                             image_data: Union[str, bytes, "Image.Image"],
+                             model_name: Optional[str] = None) -> str:
+        """Async variant of analyze_image that decodes the image off the event loop."""
+        return await self.llm_service.agenerate_content_with_vision(
+            system_instruction, query, image_data, model_name
+        )
+    
+    async def aanalyze_images(self, 
+                              system_instruction: str,
+                              query: str,
+                              images: List[Union[str, bytes, "Image.Image"]],
+                              model_name: Optional[str] = None) -> str:
+        """Analyze several images together in a single Gemini Vision request."""
+        return await self.llm_service.agenerate_content_with_images(
+            system_instruction, query, images, model_name
+        )
 
 
 class GeminiToolsUseCase:
     """Use case for Gemini tools functionality"""
     
+    __slots__ = ("llm_service",)
+    
     def __init__(self, llm_service: LLMService):
         self.llm_service = llm_service
     
@@ -345,14 +700,44 @@ class GeminiToolsUseCase:
 class GeminiHealthCheckUseCase:
     """Use case for checking Gemini service health"""
     
+    __slots__ = ("llm_service", "_health_cache", "_lock")
+    
     def __init__(self, llm_service: LLMService):
         self.llm_service = llm_service
+        # (checked at, time.monotonic(); result) of the last health check
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._lock = asyncio.Lock()
     
     def execute(self) -> Dict[str, Any]:
         """
         Perform a health check on the Gemini service.
         
         Returns:
-            Dict: Health check results
+            Dict: Health check results, reused for HEALTH_CHECK_TTL seconds
         """
-        return self.llm_service.health_check() 
\ No newline at end of file
+        cached = self._fresh_result()
+        if cached is not None:
+            return cached
+        result = self.llm_service.health_check()
+        self._health_cache = (time.monotonic(), result)
+        return result
+    
+    async def aexecute(self) -> Dict[str, Any]:
+        """Run the health check in a worker thread so the event loop stays free."""
+        cached = self._fresh_result()
+        if cached is not None:
+            return cached
+        # Concurrent probes wait for one upstream check instead of each making their own
+        async with self._lock:
+            cached = self._fresh_result()
+            if cached is not None:
+                return cached
+            result = await asyncio.to_thread(self.llm_service.health_check)
+            self._health_cache = (time.monotonic(), result)
+            return result
+    
+    def _fresh_result(self) -> Optional[Dict[str, Any]]:
+        """Return the last health check result if it is still within HEALTH_CHECK_TTL"""
+        if self._health_cache and time.monotonic() - self._health_cache[0] < HEALTH_CHECK_TTL:
+            return self._health_cache[1]
+        return None
\ No newline at end of file
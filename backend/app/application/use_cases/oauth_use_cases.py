@@ -4,7 +4,12 @@ OAuth Use Cases
 Business use cases for OAuth authentication operations.
 """
 
-from typing import Dict, Any, Optional, Tuple
+import asyncio
+import functools
+import logging
+import operator
+import time
+from typing import Dict, Any, Optional, Set, Tuple
 from datetime import datetime, timedelta
 
 from ...domain.entities.oauth_session import OAuthSession
@@ -15,10 +20,74 @@ from ...domain.repositories.user_repository import UserRepository
 from ...domain.exceptions.domain_exceptions import EntityNotFoundError, DomainValidationError
 
 from ...infrastructure.external_services.google_oauth_service import GoogleOAuthService
+from ...infrastructure.external_services.llm_service import strip_code_fence
 from ...domain.value_objects.oauth_token import OAuthToken
 from ...domain.value_objects.oauth_user_info import OAuthUserInfo
 
 from ..dto.user_dto import UserDTO
+from .profile_prompt import (
+    PROFILE_PROMPT_HEADER,
+    PROFILE_PROMPT_MAX_CHARS,
+    PROFILE_SYSTEM_INSTRUCTION,
+    dumps_compact,
+    loads_json,
+)
+
+logger = logging.getLogger(__name__)
+
+# Tokens with fewer seconds than this left are "stale": still served, but refreshed in the background
+TOKEN_STALE_WINDOW = 180
+# How often (seconds) the background scheduler looks for sessions whose tokens are about to go stale
+TOKEN_REFRESH_INTERVAL = 60
+# The scheduler only keeps sessions used within this many seconds warm; others refresh on their next request
+SCHEDULED_REFRESH_ACTIVITY_WINDOW = 3600
+# Most new-user email imports allowed to run in the background at once
+EMAIL_IMPORT_CONCURRENCY = 10
+# Most user DTOs kept by _build_user_dto
+USER_DTO_CACHE_SIZE = 10000
+# Separates the random state from the flow when no state store is configured
+ADD_ACCOUNT_STATE_MARKER = "_add_account"
+
+# Reads every user field the DTO needs in one call
+_USER_DTO_FIELDS = operator.attrgetter(
+    "id", "email", "name", "role", "is_active", "last_login", "created_at",
+    "updated_at", "google_id", "profile_picture", "oauth_provider"
+)
+
+
+@functools.lru_cache(maxsize=USER_DTO_CACHE_SIZE)
+def _build_user_dto(
+    user_id: str,
+    email: str,
+    name: str,
+    role: str,
+    is_active: bool,
+    last_login: Optional[datetime],
+    created_at: Optional[datetime],
+    updated_at: Optional[datetime],
+    google_id: Optional[str],
+    profile_picture: Optional[str],
+    oauth_provider: Optional[str]
+) -> UserDTO:
+    """
+    Build a user DTO, reusing the one built for identical field values.
+    
+    Every field is part of the key, so any change to the user (updated_at
+    included) builds a fresh DTO. UserDTO is frozen, so sharing it is safe.
+    """
+    return UserDTO(
+        id=user_id,
+        email=email,
+        name=name,
+        role=role,
+        is_active=is_active,
+        last_login=last_login,
+        created_at=created_at,
+        updated_at=updated_at,
+        google_id=google_id,
+        profile_picture=profile_picture,
+        oauth_provider=oauth_provider
+    )
 
 
 class OAuthUseCaseBase:
@@ -36,36 +105,32 @@ class OAuthUseCaseBase:
     
     def _user_entity_to_dto(self, user: User) -> UserDTO:
         """Convert user entity to DTO"""
-        return UserDTO(
-            id=user.id,
-            email=str(user.email),
-            name=user.name,
-            role=user.role.value,
-            is_active=user.is_active,
-            last_login=user.last_login,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            google_id=user.google_id,
-            profile_picture=user.profile_picture,
-            oauth_provider=user.oauth_provider
-        )
+        user_id, email, name, role, *rest = _USER_DTO_FIELDS(user)
+        return _build_user_dto(user_id, email.value, name, role.value, *rest)
 
 
 class InitiateOAuthLoginUseCase(OAuthUseCaseBase):
     """Use case for initiating OAuth login"""
     
+    def __init__(self, oauth_repository, user_repository, oauth_service, state_store=None):
+        super().__init__(oauth_repository, user_repository, oauth_service)
+        self.state_store = state_store
+    
     async def execute(self, flow_type: str = "login", session_id: Optional[str] = None) -> Dict[str, Any]:
         """Initiate OAuth login flow"""
         try:
             # Generate secure state parameter
             state = self.oauth_service.generate_state()
             
-            # Add flow type and session ID to state for callback detection
-            if flow_type == "add_account":
+            if self.state_store:
+                # Remember the state and its flow so the callback can look both up and accept it only once
+                await self.state_store.issue(state, {"flow_type": flow_type, "session_id": session_id})
+            elif flow_type == "add_account":
+                # Without a state store the flow has to travel inside the state itself
                 if session_id:
-                    state = f"{state}_add_account_{session_id}"
+                    state = f"{state}{ADD_ACCOUNT_STATE_MARKER}_{session_id}"
                 else:
-                    state = f"{state}_add_account"
+                    state = f"{state}{ADD_ACCOUNT_STATE_MARKER}"
             
             # Get authorization URL
             auth_url = self.oauth_service.get_authorization_url(state)
@@ -90,20 +155,30 @@ class ProcessOAuthCallbackUseCase(OAuthUseCaseBase):
         oauth_service,
         fetch_emails_use_case=None,
         fetch_sent_emails_use_case=None,
-        user_account_repository=None
+        user_account_repository=None,
+        state_store=None
     ):
         super().__init__(oauth_repository, user_repository, oauth_service)
         self.fetch_emails_use_case = fetch_emails_use_case
         self.fetch_sent_emails_use_case = fetch_sent_emails_use_case
         self.user_account_repository = user_account_repository
+        self.state_store = state_store
+        # Bounds how many new-user imports hit Gmail and Gemini at once
+        self._import_semaphore = asyncio.Semaphore(EMAIL_IMPORT_CONCURRENCY)
+        self._background_imports: Set[asyncio.Task] = set()
+    
+    async def resolve_flow(self, state: str) -> Dict[str, Any]:
+        """Flow type and session ID the state was issued for"""
+        if self.state_store:
+            flow = await self.state_store.get_flow(state)
+            # Unknown or expired states fall through to the login flow, which rejects them
+            return {"flow_type": "login", "session_id": None, **(flow or {})}
         
-        # Debug logging to verify dependencies
-        print(f"🔧 ProcessOAuthCallbackUseCase initialized:")
-        print(f"   - oauth_repository: {type(oauth_repository).__name__}")
-        print(f"   - user_repository: {type(user_repository).__name__}")
-        print(f"   - oauth_service: {type(oauth_service).__name__}")
-        print(f"   - fetch_emails_use_case: {type(fetch_emails_use_case).__name__ if fetch_emails_use_case else 'None'}")
-        print(f"   - fetch_sent_emails_use_case: {type(fetch_sent_emails_use_case).__name__ if fetch_sent_emails_use_case else 'None'}")
+        # No state store: the flow was encoded into the state at initiation
+        _, marker, session_part = state.partition(ADD_ACCOUNT_STATE_MARKER)
+        if not marker:
+            return {"flow_type": "login", "session_id": None}
+        return {"flow_type": "add_account", "session_id": session_part.removeprefix("_") or None}
     
     async def execute(
         self, 
@@ -113,23 +188,20 @@ class ProcessOAuthCallbackUseCase(OAuthUseCaseBase):
     ) -> Dict[str, Any]:
         """Process OAuth callback and create/authenticate user"""
         
-        print(f"🔄 ProcessOAuthCallbackUseCase.execute called with:")
-        print(f"   - code: {code[:10] if code else 'None'}...")
-        print(f"   - state: {state[:10] if state else 'None'}...")
-        print(f"   - error: {error}")
-        
         if error:
-            print(f"❌ OAuth error received: {error}")
+            logger.warning("OAuth error received: %s", error)
             raise DomainValidationError(f"OAuth error: {error}")
         
         if not code:
-            print("❌ No authorization code provided")
             raise DomainValidationError("Authorization code is required")
         
         if not state:
-            print("❌ No state parameter provided")
             raise DomainValidationError("State parameter is required")
         
+        # Reject forged, expired or replayed callbacks before spending a token exchange
+        if self.state_store and not await self.state_store.consume(state):
+            raise DomainValidationError("Invalid or expired state parameter")
+        
         # Initialize result dictionary
         result = {
             "success": True,
@@ -141,185 +213,59 @@ class ProcessOAuthCallbackUseCase(OAuthUseCaseBase):
         }
         
         try:
-            print(f"🔄 Processing OAuth callback - Code: {code[:10]}..., State: {state[:10]}...")
-            print(f"🔧 DEBUG: Available instance attributes: {[attr for attr in dir(self) if not attr.startswith('_')]}")
-            
             # Exchange code for tokens
             try:
-                print("🔄 Exchanging authorization code for tokens...")
-                print(f"🔧 DEBUG: self.oauth_service type: {type(self.oauth_service).__name__}")
-                print(f"🔧 DEBUG: self.oauth_service has exchange_code_for_tokens: {hasattr(self.oauth_service, 'exchange_code_for_tokens')}")
-                
-                if not hasattr(self.oauth_service, 'exchange_code_for_tokens'):
-                    print(f"❌ CRITICAL: oauth_service is wrong type: {type(self.oauth_service)}")
-                    print(f"❌ Available methods: {[method for method in dir(self.oauth_service) if not method.startswith('_')]}")
-                    raise DomainValidationError(f"OAuth service is incorrect type: {type(self.oauth_service).__name__}")
-                
-                token = self.oauth_service.exchange_code_for_tokens(code, state)
-                print(f"✅ Token exchange successful - Access token: {token.access_token[:20]}...")
+                token = await self.oauth_service.aexchange_code_for_tokens(code, state)
             except Exception as e:
-                print(f"❌ Token exchange failed: {str(e)}")
-                print(f"❌ Exception type: {type(e).__name__}")
-                import traceback
-                print(f"❌ Full traceback: {traceback.format_exc()}")
+                logger.warning("Token exchange failed: %s", e, exc_info=True)
                 raise DomainValidationError(f"Token exchange failed: {str(e)}")
             
             # Get user information
             try:
-                print("🔄 Getting user information from Google...")
-                user_info = self.oauth_service.get_user_info(token.access_token)
-                print(f"✅ User info retrieved - Email: {str(user_info.email)}, Name: {user_info.name}")
+                user_info = await self.oauth_service.aget_user_info(token.access_token)
             except Exception as e:
-                print(f"❌ Failed to get user info: {str(e)}")
+                logger.warning("Failed to get user info: %s", e)
                 raise DomainValidationError(f"Failed to get user info: {str(e)}")
             
             # Create OAuth session
             try:
-                print("🔄 Creating OAuth session...")
                 oauth_session = OAuthSession(
                     user_id=None,  # Will be set after user creation/authentication
                     token=token,
                     user_info=user_info,
                     state=state
                 )
-                print("✅ OAuth session created successfully")
             except Exception as e:
-                print(f"❌ Failed to create OAuth session: {str(e)}")
+                logger.warning("Failed to create OAuth session: %s", e)
                 raise DomainValidationError(f"Failed to create OAuth session: {str(e)}")
             
             # Check if user exists
             try:
-                print(f"🔄 Checking if user exists for email: {str(user_info.email)}")
                 existing_user = await self.user_repository.find_by_email(user_info.email)
                 
                 if existing_user:
-                    print(f"✅ Found existing user: {existing_user.id}")
-                    # Existing user - authenticate
+                    # Existing user - authenticate; email fetching is skipped for them
                     user = await self._authenticate_existing_user(existing_user, oauth_session)
-                    print("✅ Existing user authenticated successfully")
-                    
-                    # For existing users, skip email fetching
-                    print("ℹ️ Skipping email fetch - existing user")
                     is_new_user = False
                 else:
-                    print("🔄 No existing user found, creating new user...")
                     # New user - create account
                     user = await self._create_new_user(oauth_session)
-                    print(f"✅ New user created: {user.id}")
+                    logger.info("New user created: %s", user.id)
                     is_new_user = True
                 
-                # Create primary account entry for new user
-                if self.user_account_repository:
-                    try:
-                        from ...domain.entities.user_account import UserAccount
-                        primary_account = UserAccount.create_primary_account(
-                            user_id=user.id,
-                            email=user.email,
-                            provider="google"
-                        )
-                        await self.user_account_repository.save(primary_account)
-                        print(f"✅ Created primary account entry for user: {user.email.value}")
-                    except Exception as e:
-                        print(f"⚠️ Failed to create primary account entry: {str(e)}")
-                        # Don't fail the whole flow for this
+                # The session only needs the user ID, so save it alongside the primary account entry
+                oauth_session.user_id = user.id
+                saved_session, _ = await asyncio.gather(
+                    self.oauth_repository.save_session(oauth_session),
+                    self._create_primary_account(user)
+                )
                 
-                # Fetch emails for new users only
+                # Importing a new user's emails can take seconds, so it runs after the redirect
                 if is_new_user:
-                    try:
-                        # Fetch sent emails for new users
-                        if self.fetch_sent_emails_use_case:
-                            try:
-                                print("🔄 Fetching sent emails for new user...")
-                                print(f"🔧 DEBUG: fetch_sent_emails_use_case type: {type(self.fetch_sent_emails_use_case).__name__}")
-                                
-                                sent_email_result = await self.fetch_sent_emails_use_case.execute(
-                                    oauth_token=token,
-                                    user_email=user.email.value,
-                                    limit=10
-                                )
-                                result["sent_email_import"] = sent_email_result
-                                print(f"✅ Sent email import result: {sent_email_result}")
-                                print(f"📊 Sent emails imported: {sent_email_result.get('emails_imported', 0)}")
-                                print(f"📊 Sent emails summarized: {sent_email_result.get('emails_summarized', 0)}")
-                            except Exception as e:
-                                print(f"⚠️ Failed to fetch sent emails, but continuing: {str(e)}")
-                                print(f"⚠️ Sent email fetch error type: {type(e).__name__}")
-                                import traceback
-                                print(f"⚠️ Sent email fetch traceback: {traceback.format_exc()}")
-                                result["sent_email_import"] = {
-                                    "success": False,
-                                    "error": str(e),
-                                    "message": "Failed to import sent emails but registration succeeded"
-                                }
-                        else:
-                            print("⚠️ Skipping sent email fetch - fetch_sent_emails_use_case is None")
-                        
-                        # --- NEW: Aggregate all emails and update user profile using LLM ---
-                        try:
-                            from app.infrastructure.di.container import get_container
-                            container = get_container()
-                            user_repo = container.user_repository()
-                            email_repo = container.email_repository()
-                            llm_service = container.llm_service()
-                            # Fetch all emails (inbox + sent) for the user
-                            all_emails = await email_repo.find_by_sender(user.email.value)
-                            all_emails += await email_repo.find_by_recipient(user.email.value)
-                            email_samples = []
-                            for email in all_emails:
-                                email_samples.append({
-                                    "subject": email.subject,
-                                    "body": email.body,
-                                    "summary": email.summary,
-                                    "sentiment": email.sentiment,
-                                    "main_concept": email.main_concept,
-                                    "key_topics": email.key_topics
-                                })
-                            prompt = (
-                                "Analyze the following list of emails (inbox and sent) and generate a JSON user profile that describes "
-                                "the user's typical tone, writing style, common structures, and favorite phrases. "
-                                "Be concise and helpful. Respond ONLY with valid JSON in this format: "
-                                '{"dominant_tone": "string", "tone_distribution": {"tone": count, ...}, "common_structures": ["structure1", ...], "favorite_phrases": ["phrase1", ...], "summary": "A helpful summary of the user\'s email style."}'
-                                "\n\nEmails: " + str(email_samples)
-                            )
-                            try:
-                                llm_response = llm_service.generate_content(
-                                    system_instruction="You are an expert at analyzing email writing style and generating user profiles.",
-                                    query=prompt,
-                                    response_type="text/plain"
-                                )
-                                import json
-                                import re
-                                llm_response_clean = llm_response.strip()
-                                if llm_response_clean.startswith('```'):
-                                    llm_response_clean = re.sub(r'^```[a-zA-Z]*\n', '', llm_response_clean)
-                                    llm_response_clean = re.sub(r'```$', '', llm_response_clean)
-                                profile_data = json.loads(llm_response_clean)
-                                print(f"[DEBUG] LLM profile_data to be saved (onboarding): {profile_data}")
-                                user.user_profile = profile_data
-                                print(f"[DEBUG] About to update user {user.email} with profile: {user.user_profile}")
-                                await user_repo.update(user)
-                                print(f"[DEBUG] User profile (LLM, all emails) updated for user: {user.email}")
-                            except Exception as e:
-                                print(f"⚠️ Failed to generate user profile with LLM (onboarding): {e}")
-                                user.user_profile = {"test": "value", "error": str(e)}
-                                print(f"[DEBUG] About to update user {user.email} with fallback profile: {user.user_profile}")
-                                await user_repo.update(user)
-                                print(f"[DEBUG] Fallback user_profile set for user: {user.email}")
-                        except Exception as e:
-                            print(f"⚠️ [DEBUG] Failed to aggregate and store user profile after onboarding: {e}")
-                        # --- END NEW ---
-                    except Exception as e:
-                        print(f"⚠️ Failed to fetch initial emails, but continuing: {str(e)}")
-                        print(f"⚠️ Email fetch error type: {type(e).__name__}")
-                        import traceback
-                        print(f"⚠️ Email fetch traceback: {traceback.format_exc()}")
-                        result["email_import"] = {
-                            "success": False,
-                            "error": str(e),
-                            "message": "Failed to import emails but registration succeeded"
-                        }
+                    self._start_initial_email_import(token, user)
+                    result["email_import"] = self._pending_import_result()
+                    result["sent_email_import"] = self._pending_import_result()
                 else:
-                    print("ℹ️ Skipping email fetch and profile generation - existing user")
                     result["email_import"] = {
                         "success": True,
                         "emails_imported": 0,
@@ -350,35 +296,64 @@ class ProcessOAuthCallbackUseCase(OAuthUseCaseBase):
                                 provider="google"
                             )
                             await self.user_account_repository.save(primary_account)
-                            print(f"✅ Added primary account {user.email.value} to user accounts list")
-                        else:
-                            print(f"ℹ️ Primary account {user.email.value} already exists in user accounts list")
                     except Exception as e:
-                        print(f"⚠️ Failed to add primary account to user accounts list: {str(e)}")
+                        logger.warning("Failed to add primary account to user accounts list: %s", e)
                         # Don't fail the whole flow for this
                 
-                # Save OAuth session and add to result
-                oauth_session.user_id = user.id
-                saved_session = await self.oauth_repository.save_session(oauth_session)
-                
                 # Populate result with user and session info
                 result["user"] = self._user_entity_to_dto(user)
                 result["session_id"] = saved_session.id
                 result["is_new_user"] = is_new_user
                 
-                print("✅ OAuth callback processed successfully!")
                 return result
             except Exception as e:
-                print(f"❌ Failed to prepare return data: {str(e)}")
+                logger.warning("Failed to prepare return data: %s", e)
                 raise DomainValidationError(f"Failed to prepare return data: {str(e)}")
             
         except Exception as e:
-            print(f"❌ OAuth callback processing failed: {str(e)}")
-            print(f"❌ Exception type: {type(e).__name__}")
-            import traceback
-            print(f"❌ Traceback: {traceback.format_exc()}")
+            logger.error("OAuth callback processing failed: %s", e, exc_info=True)
             raise DomainValidationError(f"Failed to process OAuth callback: {str(e)}")
     
+    def _start_initial_email_import(self, token: OAuthToken, user: User) -> None:
+        """Import a new user's emails in the background"""
+        task = asyncio.create_task(self._import_initial_emails(token, user))
+        # Keep a reference so the task isn't garbage collected mid-import
+        self._background_imports.add(task)
+        task.add_done_callback(self._background_imports.discard)
+    
+    @staticmethod
+    def _pending_import_result() -> Dict[str, Any]:
+        """Import result reported while the background import is still running"""
+        return {
+            "success": True,
+            "status": "pending",
+            "emails_imported": 0,
+            "emails_summarized": 0,
+            "message": "Importing emails in the background"
+        }
+    
+    async def _import_initial_emails(self, token: OAuthToken, user: User) -> None:
+        """Fetch a new user's sent emails; the sent import regenerates their profile from them"""
+        async with self._import_semaphore:
+            try:
+                # Fetch sent emails for new users
+                if self.fetch_sent_emails_use_case:
+                    try:
+                        # Passing user_id makes the sent import schedule the (single) profile regeneration
+                        sent_email_result = await self.fetch_sent_emails_use_case.execute(
+                            oauth_token=token,
+                            user_email=user.email.value,
+                            limit=10,
+                            user_id=user.id
+                        )
+                        logger.info("Sent email import for user %s: %s", user.id, sent_email_result)
+                    except Exception as e:
+                        logger.warning("Failed to fetch sent emails, but continuing: %s", e, exc_info=True)
+                else:
+                    logger.warning("Skipping sent email fetch - fetch_sent_emails_use_case is None")
+            except Exception as e:
+                logger.warning("Failed to fetch initial emails, but continuing: %s", e, exc_info=True)
+    
     async def _authenticate_existing_user(
         self, 
         user: User, 
@@ -386,19 +361,38 @@ class ProcessOAuthCallbackUseCase(OAuthUseCaseBase):
     ) -> User:
         """Authenticate existing user and update OAuth info"""
         
+        # Deactivate any existing OAuth sessions for this user
+        updates = [self.oauth_repository.deactivate_user_sessions(user.id)]
+        
         # Update user's OAuth information if needed
         if not user.google_id:
             user.set_oauth_info(
                 google_id=oauth_session.user_info.provider_id,
                 profile_picture=oauth_session.user_info.picture
             )
-            await self.user_repository.update(user)
+            updates.append(self.user_repository.update(user))
         
-        # Deactivate any existing OAuth sessions for this user
-        await self.oauth_repository.deactivate_user_sessions(user.id)
+        # The session and user writes are independent
+        await asyncio.gather(*updates)
         
         return user
     
+    async def _create_primary_account(self, user: User) -> None:
+        """Create the primary account entry for the user, without failing the login"""
+        if not self.user_account_repository:
+            return
+        try:
+            from ...domain.entities.user_account import UserAccount
+            primary_account = UserAccount.create_primary_account(
+                user_id=user.id,
+                email=user.email,
+                provider="google"
+            )
+            await self.user_account_repository.save(primary_account)
+        except Exception as e:
+            logger.warning("Failed to create primary account entry: %s", e)
+            # Don't fail the whole flow for this
+    
     async def _create_new_user(self, oauth_session: OAuthSession) -> User:
         """Create new user from OAuth session"""
         
@@ -419,6 +413,16 @@ class ProcessOAuthCallbackUseCase(OAuthUseCaseBase):
 class RefreshOAuthTokenUseCase(OAuthUseCaseBase):
     """Use case for refreshing OAuth tokens"""
     
+    def __init__(self, oauth_repository, user_repository, oauth_service, redis_client=None):
+        super().__init__(oauth_repository, user_repository, oauth_service)
+        # Claims background refreshes across worker processes; None runs them unclaimed
+        self.redis = redis_client
+        # session_id -> refresh currently running for that session, shared by all callers
+        self._refreshes: Dict[str, "asyncio.Task[OAuthToken]"] = {}
+        # session_id -> last time (time.monotonic()) a request in this process used the session
+        self._last_used: Dict[str, float] = {}
+        self._background_refreshes: Set[asyncio.Task] = set()
+    
     async def execute(self, session_id: str) -> Dict[str, Any]:
         """Refresh OAuth token for a session"""
         
@@ -434,14 +438,7 @@ class RefreshOAuthTokenUseCase(OAuthUseCaseBase):
             raise DomainValidationError("No refresh token available")
         
         try:
-            # Refresh token
-            new_token = self.oauth_service.refresh_access_token(session.token.refresh_token)
-            
-            # Update session with new token
-            session.refresh_token(new_token)
-            
-            # Save updated session
-            await self.oauth_repository.update_session(session)
+            new_token = await self._refresh(session)
             
             return {
                 "access_token": new_token.access_token,
@@ -450,6 +447,106 @@ class RefreshOAuthTokenUseCase(OAuthUseCaseBase):
             
         except Exception as e:
             raise DomainValidationError(f"Failed to refresh token: {str(e)}")
+    
+    async def ensure_fresh_token(self, session: OAuthSession) -> None:
+        """
+        Keep a session's token usable without making the caller wait when possible.
+        
+        Fresh tokens are left alone, stale tokens are refreshed in the background
+        while the current one keeps being served, and only an expired token is
+        refreshed before returning.
+        """
+        if not session.is_active or not session.token.refresh_token or not session.id:
+            return
+        
+        self._last_used[session.id] = time.monotonic()
+        if session.token.is_expired():
+            await self._refresh(session)
+        else:
+            self.refresh_in_background_if_stale(session)
+    
+    def refresh_in_background_if_stale(self, session: OAuthSession, window: int = TOKEN_STALE_WINDOW) -> None:
+        """Schedule a background refresh if the session's token expires within the window"""
+        if not session.is_active or not session.token.refresh_token or not session.id:
+            return
+        if session.token.expires_in_seconds() > window or session.id in self._refreshes:
+            return
+        
+        task = asyncio.create_task(self._refresh_if_claimed(session, window))
+        # Keep a reference so the task isn't garbage collected mid-refresh
+        self._background_refreshes.add(task)
+        task.add_done_callback(self._background_refreshes.discard)
+        task.add_done_callback(self._log_background_failure)
+    
+    async def run_scheduler(self, interval: int = TOKEN_REFRESH_INTERVAL) -> None:
+        """
+        Periodically refresh sessions whose tokens are about to go stale; runs until cancelled.
+        
+        Only sessions this process served within SCHEDULED_REFRESH_ACTIVITY_WINDOW
+        are refreshed, so abandoned sessions stop costing a Google refresh every
+        hour. Every worker runs a scheduler; the Redis claim in _refresh_if_claimed
+        keeps them from refreshing the same session.
+        """
+        while True:
+            try:
+                self._forget_idle_sessions()
+                # Look one interval ahead so tokens are refreshed before they go stale
+                window = TOKEN_STALE_WINDOW + interval
+                for session in await self.oauth_repository.find_sessions_expiring_within(window):
+                    if session.id in self._last_used:
+                        self.refresh_in_background_if_stale(session, window)
+            except Exception as e:
+                logger.warning("Token refresh scan failed: %s", e)
+            await asyncio.sleep(interval)
+    
+    def _forget_idle_sessions(self) -> None:
+        """Stop tracking sessions not used within the activity window"""
+        cutoff = time.monotonic() - SCHEDULED_REFRESH_ACTIVITY_WINDOW
+        for session_id in [sid for sid, last_used in self._last_used.items() if last_used < cutoff]:
+            del self._last_used[session_id]
+    
+    async def _refresh_if_claimed(self, session: OAuthSession, claim_ttl: int) -> None:
+        """Refresh the session in the background unless another worker already claimed it"""
+        if self.redis is not None:
+            try:
+                # The claim outlives the stale window, by which time the new token is stored
+                claimed = await self.redis.set(f"oauth:refresh_claim:{session.id}", "1", ex=claim_ttl, nx=True)
+            except Exception as e:
+                logger.warning("Failed to claim token refresh for session %s: %s", session.id, e)
+                claimed = True
+            if not claimed:
+                return
+        await self._refresh(session)
+    
+    async def _refresh(self, session: OAuthSession) -> OAuthToken:
+        """Refresh the session's token, joining a refresh already running for it"""
+        # Shield so one caller going away doesn't cancel the refresh for the others
+        return await asyncio.shield(self._start_refresh(session))
+    
+    def _start_refresh(self, session: OAuthSession) -> "asyncio.Task[OAuthToken]":
+        """Get the running refresh for the session, starting one if there is none"""
+        session_id = session.id
+        task = self._refreshes.get(session_id)
+        if task is None:
+            # Two concurrent refreshes would both hit Google, and the second can
+            # invalidate the token the first just stored
+            task = asyncio.ensure_future(self._refresh_with_google(session))
+            self._refreshes[session_id] = task
+            task.add_done_callback(lambda _: self._refreshes.pop(session_id, None))
+        return task
+    
+    async def _refresh_with_google(self, session: OAuthSession) -> OAuthToken:
+        """Refresh the session's token with Google and persist it"""
+        new_token = await self.oauth_service.arefresh_access_token(session.token.refresh_token)
+        session.refresh_token(new_token)
+        await self.oauth_repository.update_session(session)
+        return new_token
+    
+    @staticmethod
+    def _log_background_failure(task: asyncio.Task) -> None:
+        """Log a failed background refresh instead of leaving it unretrieved"""
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background token refresh failed: %s", task.exception())
 
 
 class LogoutOAuthUseCase(OAuthUseCaseBase):
@@ -463,98 +560,76 @@ class LogoutOAuthUseCase(OAuthUseCaseBase):
         if not session:
             raise EntityNotFoundError("OAuth session", session_id)
         
-        try:
-            # Revoke access token
-            token_revoked = self.oauth_service.revoke_token(session.token.access_token)
-            
-            # Revoke refresh token if available
-            if session.token.refresh_token:
-                self.oauth_service.revoke_token(session.token.refresh_token)
-            
-            # Deactivate session
-            session.deactivate()
-            await self.oauth_repository.update_session(session)
-            
-            return {
-                "success": True,
-                "token_revoked": token_revoked
-            }
-            
-        except Exception as e:
-            # Even if token revocation fails, deactivate the session locally
-            session.deactivate()
-            await self.oauth_repository.update_session(session)
-            
+        # Revoke the access token, and the refresh token if available, side by side
+        tokens = [session.token.access_token]
+        if session.token.refresh_token:
+            tokens.append(session.token.refresh_token)
+        revocations = asyncio.gather(
+            *(self.oauth_service.arevoke_token(token) for token in tokens),
+            return_exceptions=True
+        )
+        
+        # Deactivate the session locally whatever the revocation outcome
+        session.deactivate()
+        await asyncio.gather(self.oauth_repository.update_session(session), revocations)
+        
+        results = revocations.result()
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
             return {
                 "success": True,
                 "token_revoked": False,
-                "warning": f"Token revocation failed: {str(e)}"
+                "warning": f"Token revocation failed: {str(failures[0])}"
             }
+        
+        return {
+            "success": True,
+            "token_revoked": results[0]
+        }
 
 
 class GetOAuthUserInfoUseCase(OAuthUseCaseBase):
     """Use case for getting current OAuth user info"""
     
+    def __init__(self, oauth_repository, user_repository, oauth_service, token_refresher=None):
+        super().__init__(oauth_repository, user_repository, oauth_service)
+        self.token_refresher = token_refresher
+    
     async def execute(self, session_id: str) -> Dict[str, Any]:
         """Get current user info from OAuth session"""
         
-        print(f"🔍 GetOAuthUserInfoUseCase: Looking for session_id: {session_id}")
-        
         # Find session
-        try:
-            session = await self.oauth_repository.find_session_by_id(session_id)
-            print(f"📋 Session found: {session is not None}")
-            if not session:
-                print(f"❌ Session not found for ID: {session_id}")
-                raise EntityNotFoundError("OAuth session", session_id)
-            
-            print(f"✅ Session details - user_id: {session.user_id}, is_active: {session.is_active}")
-        except Exception as e:
-            print(f"❌ Error finding session: {str(e)}")
-            raise e
+        session = await self.oauth_repository.find_session_by_id(session_id)
+        if not session:
+            logger.debug("OAuth session not found: %s", session_id)
+            raise EntityNotFoundError("OAuth session", session_id)
         
-        try:
-            if not session.is_valid():
-                print(f"❌ Session is not valid")
-                raise DomainValidationError("OAuth session is not valid")
-            print(f"✅ Session is valid")
-        except Exception as e:
-            print(f"❌ Error validating session: {str(e)}")
-            raise e
+        if self.token_refresher:
+            try:
+                await self.token_refresher.ensure_fresh_token(session)
+            except Exception as e:
+                logger.warning("Token refresh failed for session %s: %s", session_id, e)
+        
+        if not session.is_valid():
+            logger.debug("OAuth session is not valid: %s", session_id)
+            raise DomainValidationError("OAuth session is not valid")
         
         # Get user
         if session.user_id:
-            try:
-                print(f"🔍 Looking for user with ID: {session.user_id}")
-                user = await self.user_repository.find_by_id(session.user_id)
-                print(f"👤 User found: {user is not None}")
-                if user:
-                    print(f"👤 User details - email: {user.email}, name: {user.name}")
-                    try:
-                        user_dto = self._user_entity_to_dto(user)
-                        print(f"✅ User DTO created successfully")
-                        
-                        session_info = {
-                            "provider": session.user_info.provider,
-                            "session_active": session.is_active,
-                            "token_expires_in": session.token.expires_in_seconds()
-                        }
-                        print(f"✅ Session info created successfully")
-                        
-                        return {
-                            "user": user_dto,
-                            "session_info": session_info
-                        }
-                    except Exception as e:
-                        print(f"❌ Error creating user DTO or session info: {str(e)}")
-                        import traceback
-                        print(f"❌ DTO creation traceback: {traceback.format_exc()}")
-                        raise e
-            except Exception as e:
-                print(f"❌ Error finding user: {str(e)}")
-                raise e
+            user = await self.user_repository.find_by_id(session.user_id)
+            if user:
+                user_dto = self._user_entity_to_dto(user)
+                session_info = {
+                    "provider": session.user_info.provider,
+                    "session_active": session.is_active,
+                    "token_expires_in": session.token.expires_in_seconds()
+                }
+                return {
+                    "user": user_dto,
+                    "session_info": session_info
+                }
         
-        print(f"❌ No user_id in session or user not found")
+        logger.debug("No user found for OAuth session: %s", session_id)
         raise EntityNotFoundError("User", session.user_id or "unknown") 
 
 
@@ -568,12 +643,55 @@ class AddAnotherAccountUseCase(OAuthUseCaseBase):
         oauth_service,
         fetch_emails_use_case=None,
         fetch_sent_emails_use_case=None,
-        user_account_repository=None
+        user_account_repository=None,
+        state_store=None,
+        email_repository=None,
+        llm_service=None
     ):
         super().__init__(oauth_repository, user_repository, oauth_service)
         self.fetch_emails_use_case = fetch_emails_use_case
         self.fetch_sent_emails_use_case = fetch_sent_emails_use_case
         self.user_account_repository = user_account_repository
+        self.state_store = state_store
+        self.email_repository = email_repository
+        self.llm_service = llm_service
+        self._background_profiles: Set[asyncio.Task] = set()
+    
+    def _start_profile_update(self, user: User) -> None:
+        """Regenerate the user's profile in the background"""
+        if self.email_repository is None or self.llm_service is None:
+            logger.warning("Skipping user profile regeneration - email repository or LLM service not configured")
+            return
+        task = asyncio.create_task(self._update_user_profile(user))
+        # Keep a reference so the task isn't garbage collected mid-update
+        self._background_profiles.add(task)
+        task.add_done_callback(self._background_profiles.discard)
+    
+    async def _update_user_profile(self, user: User) -> None:
+        """Generate the user's writing-style profile from their stored emails with the LLM"""
+        try:
+            # Summary fields of inbox emails the user sent or received (the sent_email collection is not searched)
+            email_samples = await self.email_repository.find_summaries_by_sender_or_recipient(user.email.value)
+            if not email_samples:
+                # Nothing to analyze yet; keep the existing profile rather than asking the LLM about no emails
+                logger.debug("Skipping user profile generation for %s: no emails stored", user.id)
+                return
+            prompt = PROFILE_PROMPT_HEADER + dumps_compact(email_samples)[:PROFILE_PROMPT_MAX_CHARS]
+            try:
+                llm_response = await self.llm_service.agenerate_content(
+                    system_instruction=PROFILE_SYSTEM_INSTRUCTION,
+                    query=prompt,
+                    response_type="text/plain"
+                )
+                profile_data = loads_json(strip_code_fence(llm_response))
+                # Write only the profile fields; the user loaded at request time may be stale by now
+                await self.user_repository.update_profile(user.id, profile_data, None)
+                logger.debug("User profile (LLM, inbox emails) updated for user: %s", user.id)
+            except Exception as e:
+                logger.warning("Failed to generate user profile with LLM (add account): %s", e)
+                await self.user_repository.update_profile(user.id, {"test": "value", "error": str(e)})
+        except Exception as e:
+            logger.warning("Failed to aggregate and store user profile after adding account: %s", e)
     
     async def execute(
         self, 
@@ -584,37 +702,34 @@ class AddAnotherAccountUseCase(OAuthUseCaseBase):
     ) -> Dict[str, Any]:
         """Add another email account to an existing user"""
         try:
-            print(f"🔄 [DEBUG] AddAnotherAccountUseCase.execute called:")
-            print(f"   - current_user_email: {current_user_email}")
-            print(f"   - code: {code[:20] if code else 'None'}...")
-            print(f"   - state: {state[:20] if state else 'None'}...")
-            print(f"   - error: {error}")
-            print(f"   - fetch_emails_use_case: {self.fetch_emails_use_case}")
-            print(f"   - user_account_repository: {self.user_account_repository}")
+            logger.debug("Adding another account for user %s", current_user_email)
             
             if error:
-                print(f"❌ [DEBUG] OAuth error received: {error}")
+                logger.warning("OAuth error received: %s", error)
                 return {
                     "success": False,
                     "error": "oauth_error",
                     "message": f"OAuth error: {error}"
                 }
             
+            # Reject forged, expired or replayed callbacks before spending a token exchange
+            if self.state_store and not await self.state_store.consume(state):
+                return {
+                    "success": False,
+                    "error": "invalid_state",
+                    "message": "Invalid or expired state parameter"
+                }
+            
             # Exchange code for tokens
-            print("🔄 [DEBUG] Exchanging OAuth code for tokens...")
-            token_data = self.oauth_service.exchange_code_for_tokens(code, state)
-            print(f"✅ [DEBUG] Token exchange successful: {token_data}")
+            token_data = await self.oauth_service.aexchange_code_for_tokens(code, state)
             
             # Get user info from Google
-            print("🔄 [DEBUG] Getting user info from Google...")
-            user_info = self.oauth_service.get_user_info(token_data.access_token)
-            print(f"✅ [DEBUG] User info retrieved: {str(user_info.email)}")
+            user_info = await self.oauth_service.aget_user_info(token_data.access_token)
             
             # Use the user_info directly since it's already an OAuthUserInfo object
             oauth_user_info = user_info
             
             # Create OAuth session
-            print("🔄 [DEBUG] Creating OAuth session...")
             oauth_session = OAuthSession(
                 user_id=None,  # Will be set after user association
                 token=token_data,
@@ -623,47 +738,37 @@ class AddAnotherAccountUseCase(OAuthUseCaseBase):
             )
             
             # Save OAuth session
-            print("🔄 [DEBUG] Saving OAuth session...")
             saved_session = await self.oauth_repository.save_session(oauth_session)
-            print(f"✅ [DEBUG] OAuth session saved with ID: {saved_session.id}")
             
             # Find existing user by current_user_email
-            print(f"🔄 [DEBUG] Looking up existing user by email: {current_user_email}")
             existing_user = await self.user_repository.find_by_email(EmailAddress.create(current_user_email))
             if not existing_user:
-                print(f"❌ [DEBUG] User not found for email: {current_user_email}")
+                logger.warning("User not found for email: %s", current_user_email)
                 return {
                     "success": False,
                     "error": "user_not_found",
                     "message": f"User with email {current_user_email} not found"
                 }
             
-            print(f"✅ [DEBUG] Found existing user: {existing_user.email.value}")
-            
             # Check if the new account already exists for this user
             new_account_email = str(user_info.email)
+            owner_email = existing_user.email.value
             account_exists = False
             if self.user_account_repository:
-                print(f"🔄 [DEBUG] Checking if account exists for user: {existing_user.id}, email: {user_info.email}")
                 existing_account = await self.user_account_repository.find_by_user_and_email(
                     existing_user.id, user_info.email
                 )
                 account_exists = existing_account is not None
-                print(f"🔍 [DEBUG] Account {new_account_email} exists for user: {account_exists}")
-            else:
-                print(f"⚠️ [DEBUG] user_account_repository is None!")
+                logger.debug("Account %s exists for user %s: %s", new_account_email, existing_user.id, account_exists)
             
             # Associate OAuth session with existing user
-            print(f"🔄 [DEBUG] Associating OAuth session with user: {existing_user.id}")
             saved_session.associate_user(existing_user.id)
             await self.oauth_repository.update_session(saved_session)
-            print(f"✅ [DEBUG] OAuth session associated with user: {existing_user.id}")
             
             # Add the new account to user's account list if it doesn't exist
             account_added_to_list = False
             if self.user_account_repository and not account_exists:
                 try:
-                    print(f"🔄 [DEBUG] Adding new account to user's account list...")
                     from ...domain.entities.user_account import UserAccount
                     new_user_account = UserAccount.create_secondary_account(
                         user_id=existing_user.id,
@@ -673,89 +778,68 @@ class AddAnotherAccountUseCase(OAuthUseCaseBase):
                     )
                     await self.user_account_repository.save(new_user_account)
                     account_added_to_list = True
-                    print(f"✅ [DEBUG] Added account {new_account_email} to user's account list")
                 except Exception as e:
-                    print(f"⚠️ [DEBUG] Failed to add account to user's account list: {str(e)}")
+                    logger.warning("Failed to add account to user's account list: %s", e)
                     # Don't fail the whole flow for this
             elif account_exists:
-                print(f"ℹ️ [DEBUG] Account {new_account_email} already exists in user's account list")
                 account_added_to_list = True
             else:
-                print(f"⚠️ [DEBUG] user_account_repository is None, cannot add account to list")
+                logger.warning("user_account_repository is not configured, cannot add account to list")
             
             # Fetch emails from the new account (only if it's a new account)
             email_result = None
             sent_email_result = None
-            print(f"🔄 [DEBUG] fetch_emails_use_case: {self.fetch_emails_use_case}, account_exists: {account_exists}")
             if self.fetch_emails_use_case and not account_exists:
                 try:
-                    new_account_email = str(user_info.email)  # Convert EmailAddress to string
-                    print(f"🔄 [DEBUG] Fetching emails from new account: {new_account_email}")
-                    print(f"   - account_owner: {current_user_email}")
-                    print(f"   - email_holder: {new_account_email}")
-                    print(f"   - limit: 10")
-                    print(f"   - fetch_emails_use_case type: {type(self.fetch_emails_use_case).__name__}")
                     email_result = await self.fetch_emails_use_case.execute(
                         oauth_token=token_data,
                         user_email=new_account_email,  # Use the new account's email as string
                         limit=10,
                         account_owner=current_user_email  # Set the logged-in user as account owner
                     )
-                    print(f"✅ [DEBUG] Email fetch result: {email_result}")
-                    print(f"📊 [DEBUG] Emails imported: {email_result.get('emails_imported', 0)}")
-                    print(f"📊 [DEBUG] Emails summarized: {email_result.get('emails_summarized', 0)}")
+                    logger.info("Email import for new account %s: %s", new_account_email, email_result)
                     
                     # Fetch sent emails from the new account
                     if self.fetch_sent_emails_use_case:
                         try:
-                            print(f"🔄 [DEBUG] Fetching sent emails from new account: {new_account_email}")
                             sent_email_result = await self.fetch_sent_emails_use_case.execute(
                                 oauth_token=token_data,
                                 user_email=new_account_email,
                                 limit=10,
                                 account_owner=current_user_email
                             )
-                            print(f"✅ [DEBUG] Sent email fetch result: {sent_email_result}")
-                            print(f"📊 [DEBUG] Sent emails imported: {sent_email_result.get('emails_imported', 0)}")
-                            print(f"📊 [DEBUG] Sent emails summarized: {sent_email_result.get('emails_summarized', 0)}")
+                            logger.info("Sent email import for new account %s: %s", new_account_email, sent_email_result)
                         except Exception as e:
-                            print(f"⚠️ [DEBUG] Failed to fetch sent emails from new account: {str(e)}")
-                            print(f"⚠️ [DEBUG] Sent email fetch error type: {type(e).__name__}")
-                            import traceback
-                            print(f"⚠️ [DEBUG] Sent email fetch traceback: {traceback.format_exc()}")
+                            logger.warning("Failed to fetch sent emails from new account: %s", e, exc_info=True)
                             sent_email_result = {
                                 "success": False,
                                 "error": str(e),
                                 "message": "Failed to fetch sent emails but account was added successfully"
                             }
                     else:
-                        print(f"⚠️ [DEBUG] No fetch_sent_emails_use_case available, skipping sent email import")
+                        logger.warning("Skipping sent email import - fetch_sent_emails_use_case is None")
                 except Exception as e:
-                    print(f"⚠️ [DEBUG] Failed to fetch emails from new account: {str(e)}")
-                    print(f"⚠️ [DEBUG] Exception type: {type(e).__name__}")
-                    import traceback
-                    print(f"⚠️ [DEBUG] Email fetch traceback: {traceback.format_exc()}")
+                    logger.warning("Failed to fetch emails from new account: %s", e, exc_info=True)
                     email_result = {
                         "success": False,
                         "error": str(e),
                         "message": "Failed to fetch emails but account was added successfully"
                     }
             elif account_exists:
-                print(f"ℹ️ [DEBUG] Skipping email fetch - account {new_account_email} already exists for user {existing_user.email.value}")
                 email_result = {
                     "success": True,
                     "emails_imported": 0,
                     "emails_summarized": 0,
-                    "message": f"Account {new_account_email} already exists for user {existing_user.email.value}, no emails fetched"
+                    "message": f"Account {new_account_email} already exists for user {owner_email}, no emails fetched"
                 }
                 sent_email_result = {
                     "success": True,
                     "emails_imported": 0,
                     "emails_summarized": 0,
-                    "message": f"Account {new_account_email} already exists for user {existing_user.email.value}, no sent emails fetched"
+                    "message": f"Account {new_account_email} already exists for user {owner_email}, no sent emails fetched"
                 }
             else:
-                print(f"⚠️ [DEBUG] No fetch_emails_use_case available, skipping email import")
+                logger.warning("Skipping email import - fetch_emails_use_case is None")
                 email_result = {
                     "success": False,
                     "error": "No email fetch service available",
@@ -765,60 +849,8 @@ class AddAnotherAccountUseCase(OAuthUseCaseBase):
             # After fetching emails and sent emails, aggregate all emails for the user and update user_profile
             # Only regenerate profile if new emails were actually fetched
             if not account_exists and (email_result or sent_email_result):
-                try:
-                    from app.infrastructure.di.container import get_container
-                    container = get_container()
-                    user_repo = container.user_repository()
-                    email_repo = container.email_repository()
-                    llm_service = container.llm_service()
-                    # Fetch all emails (inbox + sent) for the user
-                    all_emails = await email_repo.find_by_sender(existing_user.email.value)
-                    all_emails += await email_repo.find_by_recipient(existing_user.email.value)
-                    email_samples = []
-                    for email in all_emails:
-                        email_samples.append({
-                            "subject": email.subject,
-                            "body": email.body,
-                            "summary": email.summary,
-                            "sentiment": email.sentiment,
-                            "main_concept": email.main_concept,
-                            "key_topics": email.key_topics
-                        })
-                    prompt = (
-                        "Analyze the following list of emails (inbox and sent) and generate a JSON user profile that describes "
-                        "the user's typical tone, writing style, common structures, and favorite phrases. "
-                        "Be concise and helpful. Respond ONLY with valid JSON in this format: "
-                        '{"dominant_tone": "string", "tone_distribution": {"tone": count, ...}, "common_structures": ["structure1", ...], "favorite_phrases": ["phrase1", ...], "summary": "A helpful summary of the user\'s email style."}'
-                        "\n\nEmails: " + str(email_samples)
-                    )
-                    try:
-                        llm_response = llm_service.generate_content(
-                            system_instruction="You are an expert at analyzing email writing style and generating user profiles.",
-                            query=prompt,
-                            response_type="text/plain"
-                        )
-                        import json
-                        import re
-                        llm_response_clean = llm_response.strip()
-                        if llm_response_clean.startswith('```'):
-                            llm_response_clean = re.sub(r'^```[a-zA-Z]*\n', '', llm_response_clean)
-                            llm_response_clean = re.sub(r'```$', '', llm_response_clean)
-                        profile_data = json.loads(llm_response_clean)
-                        print(f"[DEBUG] LLM profile_data to be saved (add account): {profile_data}")
-                        existing_user.user_profile = profile_data
-                        print(f"[DEBUG] About to update user {existing_user.email} with profile: {existing_user.user_profile}")
-                        await user_repo.update(existing_user)
-                        print(f"[DEBUG] User profile (LLM, all emails) updated for user: {existing_user.email}")
-                    except Exception as e:
-                        print(f"⚠️ Failed to generate user profile with LLM (add account): {e}")
-                        existing_user.user_profile = {"test": "value", "error": str(e)}
-                        print(f"[DEBUG] About to update user {existing_user.email} with fallback profile: {existing_user.user_profile}")
-                        await user_repo.update(existing_user)
-                        print(f"[DEBUG] Fallback user_profile set for user: {existing_user.email}")
-                except Exception as e:
-                    print(f"⚠️ [DEBUG] Failed to aggregate and store user profile after adding account: {e}")
-            else:
-                print(f"ℹ️ [DEBUG] Skipping user profile regeneration - no new emails fetched or account already exists")
+                # The LLM call takes seconds, so the profile is built after the response is sent
+                self._start_profile_update(existing_user)
             
             result = {
                 "success": True,
@@ -833,27 +865,22 @@ class AddAnotherAccountUseCase(OAuthUseCaseBase):
                 },
                 "existing_user": {
                     "id": existing_user.id,
-                    "email": existing_user.email.value,
+                    "email": owner_email,
                     "name": existing_user.name
                 },
                 "oauth_session_id": saved_session.id
             }
             
             if email_result:
-                print(f"🔄 [DEBUG] Attaching email_result to response: {email_result}")
                 result["email_import"] = email_result
             
             if sent_email_result:
-                print(f"🔄 [DEBUG] Attaching sent_email_result to response: {sent_email_result}")
                 result["sent_email_import"] = sent_email_result
             
-            print(f"✅ [DEBUG] AddAnotherAccountUseCase completed successfully")
             return result
             
         except Exception as e:
-            print(f"❌ [DEBUG] AddAnotherAccountUseCase failed: {str(e)}")
-            import traceback
-            print(f"❌ [DEBUG] Traceback: {traceback.format_exc()}")
+            logger.exception("AddAnotherAccountUseCase failed: %s", e)
             return {
                 "success": False,
                 "error": "internal_error",
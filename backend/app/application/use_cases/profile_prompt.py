@@ -0,0 +1,45 @@
+"""
+Profile Prompt
+
+Prompt constants and JSON helpers shared by the use cases that build a
+user's writing-style profile with the LLM.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+
+# Upper bound on the serialized email samples included in the profile prompt
+PROFILE_PROMPT_MAX_CHARS = 40000
+
+PROFILE_SYSTEM_INSTRUCTION = "You are an expert at analyzing email writing style and generating user profiles."
+
+PROFILE_PROMPT_HEADER = (
+    "Analyze the following list of sent emails and generate a JSON user profile that describes "
+    "the user's typical tone, writing style, common structures, and favorite phrases. "
+    "Be concise and helpful. Respond ONLY with valid JSON in this format: "
+    '{"dominant_tone": "string", "tone_distribution": {"tone": count, ...}, "common_structures": ["structure1", ...], "favorite_phrases": ["phrase1", ...], "summary": "A helpful summary of the user\'s email style."}'
+    "\n\nEmails: "
+)
+
+# Bump whenever the profile prompt changes so cached profiles are regenerated
+PROFILE_TEMPLATE_VERSION = "2"
+
+
+def dumps_compact(value: Any) -> str:
+    """Serialize value as compact JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value, default=str).decode()
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def loads_json(raw: str) -> Any:
+    """Parse JSON text, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -122,6 +122,10 @@ class DeleteUserUseCase(UserUseCaseBase):
 class AuthenticateUserUseCase(UserUseCaseBase):
     """Use case for user authentication"""
     
+    def __init__(self, user_repository: UserRepository, last_login_debouncer=None):
+        super().__init__(user_repository)
+        self.last_login_debouncer = last_login_debouncer
+    
     async def execute(self, email: str) -> UserDTO:
         """Authenticate user by email"""
         email_address = EmailAddress.create(email)
@@ -133,8 +137,9 @@ class AuthenticateUserUseCase(UserUseCaseBase):
         if not user.is_active:
             raise DomainValidationError("User account is deactivated")
         
-        # Update last login
-        user.update_last_login()
-        await self.user_repository.update(user)
+        # Update last login, at most once per debounce window for frequent re-authentication
+        if not self.last_login_debouncer or await self.last_login_debouncer.should_write(user.id):
+            user.update_last_login()
+            await self.user_repository.update(user)
         
         return self._entity_to_dto(user) 
\ No newline at end of file
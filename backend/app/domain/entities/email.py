@@ -230,6 +230,23 @@ class Email(BaseEntity):
         self.categorized_at = datetime.utcnow()
         self.mark_updated()
     
+    @classmethod
+    def prepare_for_sent_import(
+        cls,
+        emails: List["Email"],
+        account_owner: str,
+        email_holder: str,
+        now: Optional[datetime] = None
+    ) -> None:
+        """Mark imported emails as sent emails held by the given account"""
+        now = now or datetime.utcnow()
+        for email in emails:
+            email.account_owner = account_owner
+            email.email_holder = email_holder
+            email.email_type = EmailType.SENT
+            email.categorized_at = now
+            email.updated_at = now
+    
     def is_task_email(self) -> bool:
         """Check if email is categorized as a task"""
         return self.email_type == EmailType.TASKS
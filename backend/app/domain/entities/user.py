@@ -36,6 +36,7 @@ class User(BaseEntity):
     profile_picture: Optional[str] = None
     oauth_provider: Optional[str] = None
     user_profile: Optional[Dict[str, Any]] = None  # LLM-generated profile
+    profile_cache_key: Optional[str] = None  # Hash of the inputs user_profile was generated from
     
     def __post_init__(self):
         """Initialize User entity and validate"""
@@ -5,10 +5,10 @@ Abstract definition for email data access.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-from ..entities.email import Email, EmailStatus
+from ..entities.email import Email, EmailStatus, EmailType
 from ..value_objects.email_address import EmailAddress
 
 
@@ -20,21 +20,41 @@ class EmailRepository(ABC):
         """Save an email"""
         pass
     
+    @abstractmethod
+    async def save_many(self, emails: List[Email]) -> List[Email]:
+        """Save several emails in one round-trip"""
+        pass
+    
     @abstractmethod
     async def find_by_id(self, email_id: str) -> Optional[Email]:
         """Find email by ID"""
         pass
     
+    @abstractmethod
+    async def find_by_ids(self, email_ids: List[str]) -> Dict[str, Email]:
+        """Find several emails by ID in one round-trip, keyed by ID"""
+        pass
+    
     @abstractmethod
     async def find_by_sender(self, sender: EmailAddress, limit: int = 50) -> List[Email]:
         """Find emails by sender"""
         pass
     
+    @abstractmethod
+    async def find_sender_summaries(self, sender: str, email_type: EmailType = EmailType.SENT, limit: int = 200) -> List[Dict[str, Any]]:
+        """Find the most recent emails by sender, projected to their summary fields"""
+        pass
+    
     @abstractmethod
     async def find_by_recipient(self, recipient: EmailAddress, limit: int = 50) -> List[Email]:
         """Find emails by recipient"""
         pass
     
+    @abstractmethod
+    async def find_summaries_by_sender_or_recipient(self, address: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """Find emails the address sent or received, projected to their summary fields"""
+        pass
+    
     @abstractmethod
     async def find_by_account_owner(self, account_owner: str, limit: int = 50) -> List[Email]:
         """Find emails by account owner (logged-in user)"""
@@ -55,6 +75,11 @@ class EmailRepository(ABC):
         """Update an email"""
         pass
     
+    @abstractmethod
+    async def update_many(self, emails: List[Email]) -> List[Email]:
+        """Update several emails in one round-trip"""
+        pass
+    
     @abstractmethod
     async def delete(self, email_id: str) -> bool:
         """Delete an email"""
@@ -5,7 +5,7 @@ Abstract definition for OAuth session data access.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from ..entities.oauth_session import OAuthSession
 
@@ -46,4 +46,9 @@ class OAuthRepository(ABC):
     @abstractmethod
     async def deactivate_user_sessions(self, user_id: str) -> bool:
         """Deactivate all sessions for a user"""
-        pass 
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def find_sessions_expiring_within(self, seconds: int) -> List[OAuthSession]:
+        """Find active OAuth sessions whose tokens expire within the given number of seconds"""
+        pass
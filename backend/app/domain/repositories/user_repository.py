@@ -5,7 +5,7 @@ Abstract definition for user data access.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from ..entities.user import User, UserRole
 from ..value_objects.email_address import EmailAddress
@@ -44,6 +44,11 @@ class UserRepository(ABC):
         """Update a user"""
         pass
     
+    @abstractmethod
+    async def update_profile(self, user_id: str, user_profile: Dict[str, Any], profile_cache_key: Optional[str] = None) -> None:
+        """Update only the LLM-generated profile fields of a user"""
+        pass
+    
     @abstractmethod
     async def delete(self, user_id: str) -> bool:
         """Delete a user"""
@@ -0,0 +1,11 @@
+"""
+Caching
+
+Cache layers used in front of slow external services.
+"""
+
+from .llm_cache import LLMCache, InMemoryLRUBackend, RedisBackend
+from .oauth_state_store import OAuthStateStore
+from .write_debouncer import WriteDebouncer
+
+__all__ = ["LLMCache", "InMemoryLRUBackend", "RedisBackend", "OAuthStateStore", "WriteDebouncer"]
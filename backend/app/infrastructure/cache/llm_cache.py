@@ -0,0 +1,93 @@
+"""
+LLM Response Cache
+
+Prompt-response cache placed in front of LLMService so identical
+requests are answered without another Gemini round trip.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryLRUBackend:
+    """Process-local LRU cache backend with per-entry expiry"""
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        """Store a value for ttl seconds, evicting the least recently used entry if full"""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    async def delete(self, *keys: str) -> None:
+        """Drop entries if present"""
+        for key in keys:
+            self._entries.pop(key, None)
+
+
+class RedisBackend:
+    """Redis cache backend shared by every worker process"""
+    
+    def __init__(self, redis_client):
+        # The container's pooled client, so the cache shares its connection limit and shutdown
+        self._client = redis_client
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None if missing"""
+        raw = await self._client.get(key)
+        return json.loads(raw) if raw is not None else None
+    
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        """Store a value for ttl seconds"""
+        await self._client.set(key, json.dumps(value), ex=ttl)
+
+
+class LLMCache:
+    """Cache of LLM responses keyed by a hash of the request"""
+    
+    def __init__(self, backend, ttl: int = 3600, namespace: str = "llm"):
+        self.backend = backend
+        self.ttl = ttl
+        self.namespace = namespace
+    
+    def make_key(self, **request: Any) -> str:
+        """Build a stable cache key from the request fields (model, prompt, context, ...)"""
+        raw = json.dumps(request, sort_keys=True, default=str)
+        return f"{self.namespace}:{hashlib.sha256(raw.encode()).hexdigest()}"
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached response; cache failures are treated as misses"""
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            logger.warning("LLM cache get failed: %s", e)
+            return None
+    
+    async def set(self, key: str, value: Any) -> None:
+        """Store a response; cache failures never fail the request"""
+        try:
+            await self.backend.set(key, value, self.ttl)
+        except Exception as e:
+            logger.warning("LLM cache set failed: %s", e)
@@ -0,0 +1,42 @@
+"""
+OAuth State Store
+
+Short-lived Redis store for the OAuth state parameter, so each state issued
+at login initiation is accepted by exactly one callback. The flow the state
+was issued for (login or add account) is kept alongside it.
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+# Seconds a user has to complete the Google consent screen
+OAUTH_STATE_TTL = 600
+
+
+class OAuthStateStore:
+    """Single-use OAuth state nonces kept in Redis"""
+    
+    def __init__(self, redis_client, ttl: int = OAUTH_STATE_TTL, namespace: str = "oauth:state"):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.namespace = namespace
+    
+    def _key(self, state: str) -> str:
+        return f"{self.namespace}:{state}"
+    
+    async def issue(self, state: str, flow: Optional[Dict[str, Any]] = None) -> None:
+        """Record a newly issued state, and the flow it belongs to, until it expires"""
+        await self.redis.set(self._key(state), json.dumps(flow or {}), ex=self.ttl, nx=True)
+    
+    async def get_flow(self, state: str) -> Optional[Dict[str, Any]]:
+        """Flow recorded for a state without using it up; None if unknown or expired"""
+        raw = await self.redis.get(self._key(state))
+        if raw is None:
+            return None
+        flow = json.loads(raw)
+        # States issued before flows were recorded hold a bare marker
+        return flow if isinstance(flow, dict) else {}
+    
+    async def consume(self, state: str) -> bool:
+        """Atomically use up a state; False if it was never issued, expired or already used"""
+        return await self.redis.getdel(self._key(state)) is not None
@@ -0,0 +1,42 @@
+"""
+Write Debouncer
+
+Lets a frequently repeated write through at most once per window per key,
+so bookkeeping writes such as last-login timestamps don't hit the database
+on every request.
+"""
+
+import time
+from typing import Dict
+
+# Seconds between writes let through for the same key
+WRITE_DEBOUNCE_WINDOW = 300
+
+
+class WriteDebouncer:
+    """Per-key write gate, shared through Redis when available and per process otherwise"""
+    
+    def __init__(self, redis_client=None, window: int = WRITE_DEBOUNCE_WINDOW, namespace: str = "debounce"):
+        self.redis = redis_client
+        self.window = window
+        self.namespace = namespace
+        # key -> time.monotonic() until which writes are skipped (used without Redis)
+        self._local: Dict[str, float] = {}
+    
+    async def should_write(self, key: str) -> bool:
+        """True if no write for this key was let through within the window"""
+        key = f"{self.namespace}:{key}"
+        if self.redis is not None:
+            try:
+                return bool(await self.redis.set(key, "1", ex=self.window, nx=True))
+            except Exception:
+                # Without the shared gate, writing is the safe choice
+                return True
+        
+        now = time.monotonic()
+        if self._local.get(key, 0.0) > now:
+            return False
+        if len(self._local) >= 10000:
+            self._local = {k: until for k, until in self._local.items() if until > now}
+        self._local[key] = now + self.window
+        return True
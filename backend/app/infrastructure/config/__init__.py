@@ -5,5 +5,6 @@ Application configuration and settings.
 """
 
 from .settings import Settings, get_settings
+from .logging_config import setup_logging, shutdown_logging
 
-__all__ = ["Settings", "get_settings"] 
\ No newline at end of file
+__all__ = ["Settings", "get_settings", "setup_logging", "shutdown_logging"] 
\ No newline at end of file
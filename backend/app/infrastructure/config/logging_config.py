@@ -0,0 +1,45 @@
+"""
+Logging Configuration
+
+Routes application logging through a queue so handler I/O happens
+off the event loop thread.
+"""
+
+import logging
+import logging.handlers
+import queue
+from typing import Optional
+
+from .settings import Settings
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging(settings: Settings) -> logging.handlers.QueueListener:
+    """Configure the root logger with a QueueHandler and start its listener"""
+    global _listener
+    if _listener is not None:
+        return _listener
+    
+    log_queue: queue.Queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(settings.log_format))
+    
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(settings.log_level.upper())
+    # Application debug output is only emitted in debug mode
+    logging.getLogger("app").setLevel(logging.DEBUG if settings.debug else settings.log_level.upper())
+    
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
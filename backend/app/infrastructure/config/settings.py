@@ -33,6 +33,7 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     redis_enabled: bool = os.getenv("REDIS_ENABLED", "false").lower() == "true"
+    redis_max_connections: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
     
     # Email Service
     smtp_server: str = os.getenv("SMTP_SERVER", "smtp.gmail.com")
@@ -82,7 +83,11 @@ class Settings(BaseSettings):
     llm_model_name: str = os.getenv("LLM_MODEL_NAME", "gemini-2.5-flash")
     llm_vision_model_name: str = os.getenv("LLM_VISION_MODEL_NAME", "gemini-2.5-flash")
     llm_pro_model_name: str = os.getenv("LLM_PRO_MODEL_NAME", "gemini-2.5-pro")
+    llm_aux_model_name: str = os.getenv("EMAIL_AUX_MODEL", "gemini-2.5-flash-lite")
     gemini_api_key: str = os.getenv("GEMINI_API_KEY", "")
+    llm_cache_ttl: int = int(os.getenv("LLM_CACHE_TTL", "3600"))  # seconds
+    gemini_max_concurrency: int = int(os.getenv("GEMINI_MAX_CONCURRENCY", "8"))
+    gemini_max_retries: int = int(os.getenv("GEMINI_MAX_RETRIES", "3"))
     
     class Config:
         env_file = ".env"
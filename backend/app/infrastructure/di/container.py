@@ -14,9 +14,14 @@ from ..external_services.email_service import EmailService
 from ..external_services.google_oauth_service import GoogleOAuthService
 from ..external_services.gmail_service import GmailService
 from ..external_services.llm_service import LLMService
+from ..cache.llm_cache import LLMCache, InMemoryLRUBackend, RedisBackend
+from ..cache.oauth_state_store import OAuthStateStore
+from ..cache.write_debouncer import WriteDebouncer
 from ..repositories.firestore_email_repository import FirestoreEmailRepository
 from ..repositories.firestore_user_repository import FirestoreUserRepository
+from ..repositories.cached_user_repository import CachedUserRepository
 from ..repositories.firestore_oauth_repository import FirestoreOAuthRepository
+from ..repositories.cached_oauth_repository import CachedOAuthRepository
 from ..repositories.firestore_category_repository import FirestoreCategoryRepository
 from ..repositories.firestore_user_account_repository import FirestoreUserAccountRepository
 from ..repositories.firestore_user_profile_repository import FirestoreUserProfileRepository
@@ -73,6 +78,11 @@ class Container:
         self._google_oauth_service: Optional[GoogleOAuthService] = None
         self._gmail_service: Optional[GmailService] = None
         self._llm_service: Optional[LLMService] = None
+        self._firestore_client = None
+        self._redis_client = None
+        self._http_client = None
+        self._llm_cache: Optional[LLMCache] = None
+        self._oauth_state_store: Optional[OAuthStateStore] = None
         self._email_repository: Optional[EmailRepository] = None
         self._user_repository: Optional[UserRepository] = None
         self._oauth_repository: Optional[OAuthRepository] = None
@@ -162,7 +172,7 @@ class Container:
     def google_oauth_service(self) -> GoogleOAuthService:
         """Get Google OAuth service"""
         if self._google_oauth_service is None:
-            self._google_oauth_service = GoogleOAuthService(self.settings())
+            self._google_oauth_service = GoogleOAuthService(self.settings(), http_client=self.http_client())
         return self._google_oauth_service
     
     def gmail_service(self) -> GmailService:
@@ -190,29 +200,75 @@ class Container:
             print(f"🔧 DEBUG: [Container] Returning existing LLMService instance")
         return self._llm_service
     
+    def firestore_client(self):
+        """Get the Firestore client shared by every repository"""
+        if self._firestore_client is None:
+            self._firestore_client = self.firebase_service().get_firestore_client()
+        return self._firestore_client
+    
+    def http_client(self):
+        """Get the pooled keep-alive HTTP client shared by the external API services"""
+        if self._http_client is None:
+            import httpx
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60),
+                timeout=httpx.Timeout(10.0)
+            )
+        return self._http_client
+    
+    def redis_client(self):
+        """Get the pooled async Redis client shared by the cache layers"""
+        if self._redis_client is None:
+            import redis.asyncio as redis
+            settings = self.settings()
+            self._redis_client = redis.from_url(
+                settings.redis_url, max_connections=settings.redis_max_connections
+            )
+        return self._redis_client
+    
+    def llm_cache(self) -> LLMCache:
+        """Get LLM response cache (Redis when enabled, in-process LRU otherwise)"""
+        if self._llm_cache is None:
+            settings = self.settings()
+            if settings.redis_enabled:
+                backend = RedisBackend(self.redis_client())
+            else:
+                backend = InMemoryLRUBackend()
+            self._llm_cache = LLMCache(backend, ttl=settings.llm_cache_ttl)
+        return self._llm_cache
+    
+    def oauth_state_store(self) -> Optional[OAuthStateStore]:
+        """Get the OAuth state store, or None when Redis is disabled and states go unchecked"""
+        if self._oauth_state_store is None and self.settings().redis_enabled:
+            self._oauth_state_store = OAuthStateStore(self.redis_client())
+        return self._oauth_state_store
+    
     # Repositories
     def email_repository(self) -> EmailRepository:
         """Get email repository"""
         if self._email_repository is None:
-            firebase = self.firebase_service()
-            db = firebase.get_firestore_client()
+            db = self.firestore_client()
             self._email_repository = FirestoreEmailRepository(db)
         return self._email_repository
     
     def user_repository(self) -> UserRepository:
         """Get user repository"""
         if self._user_repository is None:
-            firebase = self.firebase_service()
-            db = firebase.get_firestore_client()
-            self._user_repository = FirestoreUserRepository(db)
+            db = self.firestore_client()
+            # Users are looked up by ID or email on every login and info request;
+            # cached in Redis when enabled, briefly per process otherwise
+            redis_client = self.redis_client() if self.settings().redis_enabled else None
+            self._user_repository = CachedUserRepository(FirestoreUserRepository(db), redis_client)
         return self._user_repository
     
     def oauth_repository(self) -> OAuthRepository:
         """Get OAuth repository"""
         if self._oauth_repository is None:
-            firebase = self.firebase_service()
-            db = firebase.get_firestore_client()
-            self._oauth_repository = FirestoreOAuthRepository(db)
+            db = self.firestore_client()
+            # Session lookups sit on every authenticated request;
+            # cached in Redis when enabled, briefly per process otherwise
+            redis_client = self.redis_client() if self.settings().redis_enabled else None
+            self._oauth_repository = CachedOAuthRepository(FirestoreOAuthRepository(db), redis_client)
         return self._oauth_repository
     
     def category_repository(self) -> CategoryRepository:
@@ -220,8 +276,7 @@ class Container:
         print(f"🔧 DEBUG: [Container] category_repository called")
         if self._category_repository is None:
             print(f"🔧 DEBUG: [Container] Creating new FirestoreCategoryRepository")
-            firebase = self.firebase_service()
-            db = firebase.get_firestore_client()
+            db = self.firestore_client()
             print(f"🔧 DEBUG: [Container] Firestore client type: {type(db).__name__}")
             self._category_repository = FirestoreCategoryRepository(db)
             print(f"🔧 DEBUG: [Container] FirestoreCategoryRepository created successfully")
@@ -232,16 +287,14 @@ class Container:
     def user_account_repository(self) -> UserAccountRepository:
         """Get user account repository"""
         if self._user_account_repository is None:
-            firebase = self.firebase_service()
-            db = firebase.get_firestore_client()
+            db = self.firestore_client()
             self._user_account_repository = FirestoreUserAccountRepository(db)
         return self._user_account_repository
     
     def user_profile_repository(self) -> UserProfileRepository:
         """Get user profile repository"""
         if self._user_profile_repository is None:
-            firebase = self.firebase_service()
-            db = firebase.get_firestore_client()
+            db = self.firestore_client()
             self._user_profile_repository = FirestoreUserProfileRepository(db)
         return self._user_profile_repository
     
@@ -371,7 +424,8 @@ class Container:
                 gmail_svc,
                 llm_svc,
                 self.category_repository(),
-                user_profile_repo
+                user_profile_repo,
+                self.user_repository()
             )
             print(f"🔧 DEBUG: [Container] FetchSentEmailsUseCase created successfully")
         else:
@@ -430,7 +484,11 @@ class Container:
     def authenticate_user_use_case(self) -> AuthenticateUserUseCase:
         """Get authenticate user use case"""
         if self._authenticate_user_use_case is None:
-            self._authenticate_user_use_case = AuthenticateUserUseCase(self.user_repository())
+            redis_client = self.redis_client() if self.settings().redis_enabled else None
+            self._authenticate_user_use_case = AuthenticateUserUseCase(
+                self.user_repository(),
+                last_login_debouncer=WriteDebouncer(redis_client, namespace="user:lastlogin")
+            )
         return self._authenticate_user_use_case
     
     # OAuth Use Cases
@@ -440,7 +498,8 @@ class Container:
             self._initiate_oauth_login_use_case = InitiateOAuthLoginUseCase(
                 oauth_repository=self.oauth_repository(),
                 user_repository=self.user_repository(),
-                oauth_service=self.google_oauth_service()
+                oauth_service=self.google_oauth_service(),
+                state_store=self.oauth_state_store()
             )
         return self._initiate_oauth_login_use_case
     
@@ -467,17 +526,21 @@ class Container:
                 oauth_service=oauth_service,
                 fetch_emails_use_case=fetch_emails_use_case,
                 fetch_sent_emails_use_case=fetch_sent_emails_use_case,
-                user_account_repository=self.user_account_repository()
+                user_account_repository=self.user_account_repository(),
+                state_store=self.oauth_state_store()
             )
         return self._process_oauth_callback_use_case
     
     def refresh_oauth_token_use_case(self) -> RefreshOAuthTokenUseCase:
         """Get refresh OAuth token use case"""
         if self._refresh_oauth_token_use_case is None:
+            # Redis lets the per-worker refresh schedulers claim each session once
+            redis_client = self.redis_client() if self.settings().redis_enabled else None
             self._refresh_oauth_token_use_case = RefreshOAuthTokenUseCase(
                 oauth_repository=self.oauth_repository(),
                 user_repository=self.user_repository(),
-                oauth_service=self.google_oauth_service()
+                oauth_service=self.google_oauth_service(),
+                redis_client=redis_client
             )
         return self._refresh_oauth_token_use_case
     
@@ -497,7 +560,8 @@ class Container:
             self._get_oauth_user_info_use_case = GetOAuthUserInfoUseCase(
                 oauth_repository=self.oauth_repository(),
                 user_repository=self.user_repository(),
-                oauth_service=self.google_oauth_service()
+                oauth_service=self.google_oauth_service(),
+                token_refresher=self.refresh_oauth_token_use_case()
             )
         return self._get_oauth_user_info_use_case
     
@@ -510,7 +574,10 @@ class Container:
                 oauth_service=self.google_oauth_service(),
                 fetch_emails_use_case=self.fetch_initial_emails_use_case(),
                 fetch_sent_emails_use_case=self.fetch_sent_emails_use_case(),
-                user_account_repository=self.user_account_repository()
+                user_account_repository=self.user_account_repository(),
+                state_store=self.oauth_state_store(),
+                email_repository=self.email_repository(),
+                llm_service=self.llm_service()
             )
         return self._add_another_account_use_case
     
@@ -518,7 +585,7 @@ class Container:
     def generate_email_content_use_case(self) -> GenerateEmailContentUseCase:
         """Get generate email content use case"""
         if self._generate_email_content_use_case is None:
-            self._generate_email_content_use_case = GenerateEmailContentUseCase(self.llm_service())
+            self._generate_email_content_use_case = GenerateEmailContentUseCase(self.llm_service(), self.llm_cache())
         return self._generate_email_content_use_case
     
     def analyze_email_sentiment_use_case(self) -> AnalyzeEmailSentimentUseCase:
@@ -530,19 +597,19 @@ class Container:
     def suggest_email_subject_use_case(self) -> SuggestEmailSubjectUseCase:
         """Get suggest email subject use case"""
         if self._suggest_email_subject_use_case is None:
-            self._suggest_email_subject_use_case = SuggestEmailSubjectUseCase(self.llm_service())
+            self._suggest_email_subject_use_case = SuggestEmailSubjectUseCase(self.llm_service(), self.llm_cache())
         return self._suggest_email_subject_use_case
     
     def generate_email_response_use_case(self) -> GenerateEmailResponseUseCase:
         """Get generate email response use case"""
         if self._generate_email_response_use_case is None:
-            self._generate_email_response_use_case = GenerateEmailResponseUseCase(self.llm_service())
+            self._generate_email_response_use_case = GenerateEmailResponseUseCase(self.llm_service(), self.llm_cache())
         return self._generate_email_response_use_case
     
     def smart_email_composer_use_case(self) -> SmartEmailComposerUseCase:
         """Get smart email composer use case"""
         if self._smart_email_composer_use_case is None:
-            self._smart_email_composer_use_case = SmartEmailComposerUseCase(self.llm_service())
+            self._smart_email_composer_use_case = SmartEmailComposerUseCase(self.llm_service(), self.llm_cache())
         return self._smart_email_composer_use_case
     
     def compose_email_use_case(self) -> ComposeEmailUseCase:
@@ -695,10 +762,20 @@ class Container:
             print("⚠️ Application will continue without Firebase (some features may not work)")
             # Don't raise the exception to allow the app to start
     
+    async def aclose(self) -> None:
+        """Close the pooled network clients"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        if self._redis_client is not None:
+            await self._redis_client.aclose()
+            self._redis_client = None
+    
     def cleanup(self) -> None:
         """Cleanup all services"""
         if self._firebase_service:
             self._firebase_service.close()
+        self._firestore_client = None
 
 
 # Global container instance
@@ -4,8 +4,9 @@ Gmail Service
 Service for fetching emails from Gmail using OAuth tokens.
 """
 
+import asyncio
 import base64
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 from datetime import datetime
 from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
@@ -37,65 +38,45 @@ class GmailService:
     async def fetch_recent_emails(self, oauth_token: OAuthToken, user_email: str, limit: int = 50) -> List[Email]:
         """Fetch recent emails from user's Gmail inbox"""
         try:
-            print(f"🔄 GmailService.fetch_recent_emails called:")
-            print(f"   - user_email: {user_email}")
-            print(f"   - limit: {limit}")
-            print(f"   - oauth_token.access_token: {oauth_token.access_token[:20] if oauth_token.access_token else 'None'}...")
-            print(f"   - oauth_token.scope: {oauth_token.scope}")
-            
-            # Create Gmail service
-            print("🔄 Creating Google credentials...")
-            credentials = self._create_credentials(oauth_token)
-            print(f"🔧 Credentials created - token: {credentials.token[:20] if credentials.token else 'None'}...")
-            
-            print("🔄 Building Gmail service...")
-            service = build(self.service_name, self.version, credentials=credentials)
-            print("✅ Gmail service built successfully")
-            
-            # Get list of messages
-            print("🔄 Getting message list from Gmail...")
-            result = service.users().messages().list(
+            return [email_obj async for email_obj in self.stream_recent_emails(oauth_token, user_email, limit)]
+        except Exception as e:
+            print(f"❌ Failed to fetch emails from Gmail: {str(e)}")
+            raise Exception(f"Failed to fetch emails from Gmail: {str(e)}")
+
+    async def stream_recent_emails(self, oauth_token: OAuthToken, user_email: str, limit: int = 50) -> AsyncIterator[Email]:
+        """Yield recent inbox emails one at a time as they are fetched from Gmail"""
+        credentials = self._create_credentials(oauth_token)
+        service = build(self.service_name, self.version, credentials=credentials)
+        
+        # The Gmail client is blocking, so every API call runs in a worker thread
+        result = await asyncio.to_thread(
+            service.users().messages().list(
                 userId='me',
                 maxResults=limit,
                 q='in:inbox'  # Only inbox messages
-            ).execute()
-            
-            messages = result.get('messages', [])
-            print(f"✅ Found {len(messages)} messages to fetch")
-            
-            emails = []
-            user_email_address = EmailAddress.create(user_email)
-            
-            for i, message in enumerate(messages[:limit]):
-                try:
-                    print(f"🔄 Fetching message {i+1}/{len(messages)}: {message['id']}")
-                    
-                    # Get full message
-                    msg = service.users().messages().get(
+            ).execute
+        )
+        
+        messages = result.get('messages', [])
+        user_email_address = EmailAddress.create(user_email)
+        
+        for message in messages[:limit]:
+            try:
+                msg = await asyncio.to_thread(
+                    service.users().messages().get(
                         userId='me',
                         id=message['id'],
                         format='full'
-                    ).execute()
-                    
-                    # Parse email
-                    email_obj = self._parse_gmail_message(msg, user_email_address)
-                    if email_obj:
-                        emails.append(email_obj)
-                        print(f"✅ Parsed email: {email_obj.subject[:50]}...")
-                    
-                except Exception as e:
-                    print(f"⚠️ Failed to fetch message {message['id']}: {str(e)}")
-                    continue
-            
-            print(f"✅ Successfully fetched {len(emails)} emails")
-            return emails
-            
-        except Exception as e:
-            print(f"❌ Failed to fetch emails from Gmail: {str(e)}")
-            import traceback
-            print(f"❌ Gmail fetch traceback: {traceback.format_exc()}")
-            raise Exception(f"Failed to fetch emails from Gmail: {str(e)}")
-
+                    ).execute
+                )
+            except Exception as e:
+                print(f"⚠️ Failed to fetch message {message['id']}: {str(e)}")
+                continue
+            
+            email_obj = self._parse_gmail_message(msg, user_email_address)
+            if email_obj:
+                yield email_obj
+    
     async def fetch_starred_emails(self, oauth_token: OAuthToken, user_email: str, limit: int = 50) -> List[Email]:
         """Fetch starred emails from user's Gmail account"""
         try:
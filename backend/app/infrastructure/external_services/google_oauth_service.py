@@ -4,25 +4,42 @@ Google OAuth Service
 External service for handling Google OAuth authentication flow.
 """
 
+import asyncio
 import secrets
+import traceback
+from functools import lru_cache
 from typing import Dict, Any, Tuple
 from urllib.parse import urlencode
 
-from google.auth.transport.requests import Request
-from google.oauth2 import id_token
 from google_auth_oauthlib.flow import Flow
+import httpx
 import requests
+import requests.adapters
 
 from ..config.settings import Settings
 from ...domain.value_objects.oauth_token import OAuthToken
 from ...domain.value_objects.oauth_user_info import OAuthUserInfo
 
 
+GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/auth"
+GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
+GOOGLE_REVOKE_URL = "https://oauth2.googleapis.com/revoke"
+GOOGLE_USERINFO_URL = "https://openidconnect.googleapis.com/v1/userinfo"
+
+
+@lru_cache(maxsize=1)
+def _shared_https_adapter() -> requests.adapters.HTTPAdapter:
+    """Keep-alive connection pool shared by the blocking token exchanges, so they reuse TLS connections"""
+    return requests.adapters.HTTPAdapter()
+
+
 class GoogleOAuthService:
     """Service for Google OAuth authentication"""
     
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, http_client: httpx.AsyncClient):
         self.settings = settings
+        # The container's pooled keep-alive client; it owns the client's limits and closes it on shutdown
+        self.http_client = http_client
         self.client_id = settings.google_client_id
         self.client_secret = settings.google_client_secret
         self.redirect_uri = settings.google_redirect_uri
@@ -30,6 +47,17 @@ class GoogleOAuthService:
         
         # Validate OAuth configuration
         self._validate_config()
+        
+        # Google's endpoints are fixed, so the client config is built once instead of per flow
+        self.client_config = {
+            "web": {
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "auth_uri": GOOGLE_AUTH_URL,
+                "token_uri": GOOGLE_TOKEN_URL,
+                "redirect_uris": [self.redirect_uri]
+            }
+        }
     
     def _validate_config(self) -> None:
         """Validate OAuth configuration"""
@@ -53,15 +81,7 @@ class GoogleOAuthService:
         """Get Google OAuth authorization URL"""
         # Create OAuth flow
         flow = Flow.from_client_config(
-            {
-                "web": {
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": [self.redirect_uri]
-                }
-            },
+            self.client_config,
             scopes=self.scopes
         )
         flow.redirect_uri = self.redirect_uri
@@ -80,19 +100,13 @@ class GoogleOAuthService:
         """Exchange authorization code for access and refresh tokens"""
         # Create OAuth flow
         flow = Flow.from_client_config(
-            {
-                "web": {
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": [self.redirect_uri]
-                }
-            },
+            self.client_config,
             scopes=self.scopes,
             state=state
         )
         flow.redirect_uri = self.redirect_uri
+        # Each flow has its own OAuth session, but they all draw connections from one pool
+        flow.oauth2session.mount("https://", _shared_https_adapter())
         
         # Fetch token
         try:
@@ -101,7 +115,6 @@ class GoogleOAuthService:
             print("✅ Token fetched successfully from Google")
         except Exception as e:
             print(f"❌ Google token fetch failed: {str(e)}")
-            import traceback
             print(f"❌ Token fetch traceback: {traceback.format_exc()}")
             raise Exception(f"Failed to exchange authorization code for tokens: {str(e)}")
         
@@ -130,20 +143,25 @@ class GoogleOAuthService:
             scope=" ".join(self.scopes)
         )
     
-    def get_user_info(self, access_token: str) -> OAuthUserInfo:
-        """Get user information from Google using access token"""
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Accept': 'application/json'
-        }
-        
-        # Get user info from Google OpenID Connect endpoint (more reliable for 'sub' field)
-        print(f"🔄 Requesting user info from Google OpenID Connect...")
-        response = requests.get(
-            'https://openidconnect.googleapis.com/v1/userinfo',
-            headers=headers
+    async def aexchange_code_for_tokens(self, code: str, state: str) -> OAuthToken:
+        """Exchange authorization code for tokens without blocking the event loop"""
+        # The oauthlib flow only offers a blocking fetch, so it runs in a worker thread
+        return await asyncio.to_thread(self.exchange_code_for_tokens, code, state)
+    
+    async def aget_user_info(self, access_token: str) -> OAuthUserInfo:
+        """Get user information from Google using access token, over the shared client"""
+        response = await self.http_client.get(
+            GOOGLE_USERINFO_URL,
+            headers={
+                'Authorization': f'Bearer {access_token}',
+                'Accept': 'application/json'
+            }
         )
         
+        return self._user_info_from_response(response)
+    
+    def _user_info_from_response(self, response) -> OAuthUserInfo:
+        """Build user info from a Google userinfo response"""
         print(f"🔄 Google userinfo response status: {response.status_code}")
         
         if response.status_code != 200:
@@ -170,20 +188,26 @@ class GoogleOAuthService:
             print(f"❌ User data was: {user_data}")
             raise Exception(f"Failed to create OAuth user info: {str(e)}")
     
-    def refresh_access_token(self, refresh_token: str) -> OAuthToken:
-        """Refresh access token using refresh token"""
-        data = {
+    async def arefresh_access_token(self, refresh_token: str) -> OAuthToken:
+        """Refresh access token using refresh token, over the shared client"""
+        response = await self.http_client.post(
+            GOOGLE_TOKEN_URL,
+            data=self._refresh_request_data(refresh_token)
+        )
+        
+        return self._token_from_refresh_response(response, refresh_token)
+    
+    def _refresh_request_data(self, refresh_token: str) -> Dict[str, str]:
+        """Form data for a refresh token grant"""
+        return {
             'client_id': self.client_id,
             'client_secret': self.client_secret,
             'refresh_token': refresh_token,
             'grant_type': 'refresh_token'
         }
-        
-        response = requests.post(
-            'https://oauth2.googleapis.com/token',
-            data=data
-        )
-        
+    
+    def _token_from_refresh_response(self, response, refresh_token: str) -> OAuthToken:
+        """Build the new token from a Google token endpoint response"""
         if response.status_code != 200:
             raise Exception(f"Failed to refresh token: {response.text}")
         
@@ -197,23 +221,8 @@ class GoogleOAuthService:
             scope=token_data.get('scope', " ".join(self.scopes))
         )
     
-    def verify_token(self, access_token: str) -> bool:
-        """Verify if access token is valid"""
-        headers = {
-            'Authorization': f'Bearer {access_token}'
-        }
-        
-        response = requests.get(
-            'https://www.googleapis.com/oauth2/v1/tokeninfo',
-            headers=headers
-        )
-        
-        return response.status_code == 200
-    
-    def revoke_token(self, token: str) -> bool:
-        """Revoke access or refresh token"""
-        response = requests.post(
-            f'https://oauth2.googleapis.com/revoke?token={token}'
-        )
+    async def arevoke_token(self, token: str) -> bool:
+        """Revoke access or refresh token, over the shared client"""
+        response = await self.http_client.post(GOOGLE_REVOKE_URL, params={"token": token})
         
         return response.status_code == 200 
\ No newline at end of file
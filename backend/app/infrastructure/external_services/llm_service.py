@@ -4,13 +4,86 @@ LLM Service
 Integration with Google Gemini for AI-powered features.
 """
 
+import asyncio
+import io
 import os
 import json
-from typing import Dict, List, Optional, Any
+import random
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Any, Tuple, TypeVar, Union
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 
 from ..config.settings import Settings
 
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+EMAIL_CONTENT_SYSTEM_INSTRUCTION = (
+    "You are an expert email writer. Generate professional, clear, and engaging email content "
+    "based on the provided prompt. The email should be well-structured, appropriate in tone, "
+    "and ready to send. Include a proper greeting and closing."
+)
+
+SENTIMENT_SYSTEM_INSTRUCTION = (
+    "You are an expert in email analysis. Analyze the provided email content for sentiment, "
+    "tone, professionalism, and provide suggestions for improvement if needed. "
+    "Respond in JSON format with the following structure: "
+    '{"sentiment": "positive/negative/neutral", "tone": "description", '
+    '"professionalism_score": number_0_to_10, "suggestions": ["suggestion1", "suggestion2"], '
+    '"summary": "brief summary"}'
+)
+
+SENTIMENT_FALLBACK = {
+    "sentiment": "neutral",
+    "tone": "unknown",
+    "professionalism_score": 5.0,
+    "suggestions": ["Unable to analyze email"],
+    "summary": "Analysis failed"
+}
+
+SUBJECT_SYSTEM_INSTRUCTION = (
+    "You are an expert at writing email subject lines. Generate a clear, concise, "
+    "and compelling subject line that accurately represents the email content. "
+    "Keep it under 60 characters and avoid spam trigger words."
+)
+
+EMAIL_WITH_SUBJECT_SYSTEM_INSTRUCTION = (
+    EMAIL_CONTENT_SYSTEM_INSTRUCTION + " Also write a clear, concise subject line for it, "
+    "under 60 characters and free of spam trigger words. "
+    'Respond in JSON format with the following structure: {"subject": "subject line", "content": "email body"}'
+)
+
+T = TypeVar("T")
+
+# Gemini errors worth retrying: rate limiting and transient server-side failures
+RETRYABLE_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.DeadlineExceeded,
+)
+
+# Chat sessions idle for longer than this (seconds) are dropped, and at most
+# CHAT_SESSION_MAX_ENTRIES are kept, evicting the least recently used first
+CHAT_SESSION_TTL = 3600
+CHAT_SESSION_MAX_ENTRIES = 1000
+
+# Images are downscaled so their longest side is at most this many pixels before upload
+VISION_MAX_IMAGE_SIDE = 2048
+
+
+def strip_code_fence(response: str) -> str:
+    """Remove a surrounding markdown code fence (and its language tag) from a model response."""
+    text = response.strip()
+    if text.startswith("```"):
+        # Drop the opening fence line, e.g. ```json
+        text = text.partition("\n")[2]
+        text = text.rstrip().removesuffix("```")
+    return text.strip()
+
 
 class LLMService:
     """Gemini LLM service wrapper for AI-powered features."""
@@ -20,6 +93,8 @@ class LLMService:
         self.model_name = getattr(settings, 'llm_model_name', 'gemini-2.5-flash')
         self.vision_model_name = getattr(settings, 'llm_vision_model_name', 'gemini-2.5-flash')
         self.pro_model_name = getattr(settings, 'llm_pro_model_name', 'gemini-2.5-pro')
+        # Faster, cheaper model for low-stakes calls: subject lines, sentiment, health checks
+        self.aux_model_name = getattr(settings, 'llm_aux_model_name', 'gemini-2.5-flash-lite')
 
         # Load API key from settings
         self.api_key = getattr(settings, 'gemini_api_key', None)
@@ -31,13 +106,50 @@ class LLMService:
         # Configure Gemini
         genai.configure(api_key=self.api_key)
         
-        # Initialize chat sessions
-        self._chat_sessions = {}
+        # Chat sessions by session ID as (last used, time.monotonic(); session),
+        # least recently used first
+        self._chat_sessions: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        
+        # Bound concurrent async Gemini calls and retry transient failures; at least one of each,
+        # since a zero semaphore would deadlock and zero attempts would never make the call
+        self.max_concurrency = max(1, getattr(settings, 'gemini_max_concurrency', 8))
+        self.max_retries = max(1, getattr(settings, 'gemini_max_retries', 3))
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        # GenerativeModel instances by model name. They share the SDK's
+        # process-wide clients, so reusing them keeps the same channel alive.
+        self._models: Dict[str, genai.GenerativeModel] = {}
 
     # ------------------------------------------------------------------
     # Core Gemini Methods
     # ------------------------------------------------------------------
     
+    async def _call(self, request: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run an async Gemini request within the concurrency limit.
+        
+        Rate-limit and transient server errors are retried with exponential
+        backoff and jitter, up to max_retries attempts in total.
+        """
+        async with self._semaphore:
+            for attempt in range(self.max_retries):
+                try:
+                    return await request()
+                except RETRYABLE_ERRORS as e:
+                    if attempt == self.max_retries - 1:
+                        raise
+                    delay = 0.5 * (2 ** attempt) + random.random() * 0.1
+                    print(f"[LLMService] Gemini call failed ({type(e).__name__}), retrying in {delay:.2f}s")
+                    await asyncio.sleep(delay)
+    
+    def _get_model(self, model_name: Optional[str] = None) -> genai.GenerativeModel:
+        """Get the shared GenerativeModel for a model name, creating it on first use."""
+        name = model_name or self.model_name
+        model = self._models.get(name)
+        if model is None:
+            model = self._models[name] = genai.GenerativeModel(model_name=name)
+        return model
+    
     def generate_content(
         self,
         system_instruction: str = "",
@@ -67,9 +179,7 @@ class LLMService:
         try:
             # Create model
             print(f"🔧 DEBUG: [LLMService] Creating GenerativeModel...")
-            model = genai.GenerativeModel(
-                model_name=model_name or self.model_name
-            )
+            model = self._get_model(model_name)
             print(f"🔧 DEBUG: [LLMService] Model created successfully")
 
             # Handle different response types
@@ -77,13 +187,13 @@ class LLMService:
                 # For JSON responses, use the response_schema parameter
                 print(f"🔧 DEBUG: [LLMService] Using JSON response schema")
                 response = model.generate_content(
-                    query,
+                    self._build_contents(system_instruction, query),
                     response_schema=response_schema
                 )
             else:
                 # For plain text responses
                 print(f"🔧 DEBUG: [LLMService] Using plain text response")
-                response = model.generate_content(query)
+                response = model.generate_content(self._build_contents(system_instruction, query))
 
             print(f"🔧 DEBUG: [LLMService] Response received, text length: {len(response.text)}")
             print(f"🔧 DEBUG: [LLMService] Response preview: {response.text[:200]}...")
@@ -96,7 +206,180 @@ class LLMService:
             print(f"🔧 DEBUG: [LLMService] Full traceback: {traceback.format_exc()}")
             raise
 
+    def _build_contents(self, system_instruction: str, query: str) -> str:
+        """
+        Put the system instruction ahead of the query in a single prompt.
+        
+        The pinned SDK has no system_instruction parameter on GenerativeModel,
+        so it is sent as the prompt prefix. Keeping static text first lets
+        Gemini's implicit prompt caching match a shared prefix across calls.
+        """
+        if not system_instruction:
+            return query
+        return f"{system_instruction}\n\n{query}"
 
+    async def agenerate_content(
+        self,
+        system_instruction: str = "",
+        query: str = "",
+        response_type: str = "text/plain",
+        response_schema: Optional[dict] = None,
+        model_name: Optional[str] = None
+    ) -> str:
+        """
+        Generate content using Gemini without blocking the event loop.
+        
+        Takes the same arguments as generate_content.
+        
+        Returns:
+            Generated content as string
+        """
+        try:
+            model = self._get_model(model_name)
+
+            contents = self._build_contents(system_instruction, query)
+
+            if response_type == "application/json" and response_schema:
+                response = await self._call(lambda: model.generate_content_async(
+                    contents,
+                    response_schema=response_schema
+                ))
+            else:
+                response = await self._call(lambda: model.generate_content_async(contents))
+
+            return response.text
+
+        except Exception as e:
+            print(f"[LLMService] agenerate_content failed: {e}")
+            raise
+
+    async def astream_content(
+        self,
+        system_instruction: str = "",
+        query: str = "",
+        model_name: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream plain text content from Gemini as it is generated.
+        
+        Args:
+            system_instruction: System instruction for the model
+            query: The query/prompt to send to the model
+            model_name: Specific model to use (optional)
+            
+        Yields:
+            Text chunks in generation order
+        """
+        try:
+            model = self._get_model(model_name)
+            contents = self._build_contents(system_instruction, query)
+            # Only opening the stream is retried; chunks already yielded can't be replayed
+            response = await self._call(lambda: model.generate_content_async(contents, stream=True))
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+
+        except Exception as e:
+            print(f"[LLMService] astream_content failed: {e}")
+            raise
+
+    def generate_content_with_vision(
+        self,
+        system_instruction: str,
+        query: str,
+        image_data: Union[str, bytes, "Image.Image"],
+        model_name: Optional[str] = None
+    ) -> str:
+        """
+        Generate content about an image using Gemini Vision.
+        
+        Args:
+            system_instruction: System instruction for the analysis
+            query: Query about the image
+            image_data: Image file path, encoded image bytes, or PIL Image
+            model_name: Specific vision model to use (optional)
+            
+        Returns:
+            Generated content as string
+        """
+        try:
+            model = self._get_model(model_name or self.vision_model_name)
+            response = model.generate_content([
+                self._build_contents(system_instruction, query),
+                self._load_image(image_data)
+            ])
+            return response.text
+
+        except Exception as e:
+            print(f"[LLMService] generate_content_with_vision failed: {e}")
+            raise
+
+    async def agenerate_content_with_vision(
+        self,
+        system_instruction: str,
+        query: str,
+        image_data: Union[str, bytes, "Image.Image"],
+        model_name: Optional[str] = None
+    ) -> str:
+        """
+        Async variant of generate_content_with_vision.
+        
+        Image decoding and resizing run in a worker thread so they do not
+        block the event loop.
+        """
+        return await self.agenerate_content_with_images(
+            system_instruction, query, [image_data], model_name
+        )
+
+    async def agenerate_content_with_images(
+        self,
+        system_instruction: str,
+        query: str,
+        images: List[Union[str, bytes, "Image.Image"]],
+        model_name: Optional[str] = None
+    ) -> str:
+        """
+        Generate content about several images in a single Gemini Vision request.
+        
+        Args:
+            system_instruction: System instruction for the analysis
+            query: Query about the images
+            images: Image file paths, encoded image bytes, or PIL Images
+            model_name: Specific vision model to use (optional)
+            
+        Returns:
+            Generated content as string
+        """
+        try:
+            # Decode every image concurrently off the event loop
+            decoded = await asyncio.gather(
+                *(asyncio.to_thread(self._load_image, image_data) for image_data in images)
+            )
+            model = self._get_model(model_name or self.vision_model_name)
+            contents = [self._build_contents(system_instruction, query), *decoded]
+            response = await self._call(lambda: model.generate_content_async(contents))
+            return response.text
+
+        except Exception as e:
+            print(f"[LLMService] agenerate_content_with_images failed: {e}")
+            raise
+
+    def _load_image(self, image_data: Union[str, bytes, "Image.Image"]) -> "Image.Image":
+        """Decode image data and downscale it to VISION_MAX_IMAGE_SIDE."""
+        from PIL import Image
+
+        if isinstance(image_data, Image.Image):
+            image = image_data.copy()
+        elif isinstance(image_data, bytes):
+            image = Image.open(io.BytesIO(image_data))
+        else:
+            image = Image.open(image_data)
+
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        # thumbnail keeps the aspect ratio and never upscales
+        image.thumbnail((VISION_MAX_IMAGE_SIDE, VISION_MAX_IMAGE_SIDE))
+        return image
 
     def start_chat(
         self,
@@ -120,15 +403,15 @@ class LLMService:
             Chat session object
         """
         try:
-            model = genai.GenerativeModel(
-                model_name=model_name or self.model_name
-            )
+            model = self._get_model(model_name)
             
             chat = model.start_chat(history=history or [])
             
             # Store chat session if session_id provided
             if session_id:
-                self._chat_sessions[session_id] = chat
+                self._chat_sessions[session_id] = (time.monotonic(), chat)
+                self._chat_sessions.move_to_end(session_id)
+                self._evict_chat_sessions()
                 
             return chat
             
@@ -154,10 +437,7 @@ class LLMService:
             Response from the chat session
         """
         try:
-            if session_id not in self._chat_sessions:
-                raise ValueError(f"Chat session '{session_id}' not found")
-                
-            chat = self._chat_sessions[session_id]
+            chat = self._get_chat_session(session_id)
             response = chat.send_message(message)
             return response.text
             
@@ -165,6 +445,42 @@ class LLMService:
             print(f"[LLMService] send_message failed: {e}")
             raise
 
+    async def asend_message(
+        self,
+        message: str,
+        session_id: str,
+        model_name: Optional[str] = None
+    ) -> str:
+        """Async variant of send_message that does not block the event loop."""
+        try:
+            chat = self._get_chat_session(session_id)
+            response = await self._call(lambda: chat.send_message_async(message))
+            return response.text
+            
+        except Exception as e:
+            print(f"[LLMService] asend_message failed: {e}")
+            raise
+
+    def _get_chat_session(self, session_id: str) -> Any:
+        """Get a live chat session and mark it as most recently used."""
+        self._evict_chat_sessions()
+        entry = self._chat_sessions.get(session_id)
+        if entry is None:
+            raise ValueError(f"Chat session '{session_id}' not found")
+        self._chat_sessions[session_id] = (time.monotonic(), entry[1])
+        self._chat_sessions.move_to_end(session_id)
+        return entry[1]
+
+    def _evict_chat_sessions(self) -> None:
+        """Drop expired chat sessions and trim to CHAT_SESSION_MAX_ENTRIES."""
+        cutoff = time.monotonic() - CHAT_SESSION_TTL
+        # Oldest sessions are at the front, so stop at the first live one
+        while self._chat_sessions:
+            session_id, (last_used, _) = next(iter(self._chat_sessions.items()))
+            if last_used >= cutoff and len(self._chat_sessions) <= CHAT_SESSION_MAX_ENTRIES:
+                break
+            del self._chat_sessions[session_id]
+
     def end_chat(self, session_id: str) -> bool:
         """
         End a chat session.
@@ -176,10 +492,7 @@ class LLMService:
             True if session was ended successfully
         """
         try:
-            if session_id in self._chat_sessions:
-                del self._chat_sessions[session_id]
-                return True
-            return False
+            return self._chat_sessions.pop(session_id, None) is not None
         except Exception as e:
             print(f"[LLMService] end_chat failed: {e}")
             return False
@@ -223,22 +536,28 @@ class LLMService:
         Returns:
             Generated email content
         """
-        system_instruction = (
-            "You are an expert email writer. Generate professional, clear, and engaging email content "
-            "based on the provided prompt. The email should be well-structured, appropriate in tone, "
-            "and ready to send. Include a proper greeting and closing."
-        )
-        
-        query = f"Generate an email based on this request: {prompt}"
-        if context:
-            query += f"\n\nContext: {context}"
-            
+        system_instruction, query = self._email_content_prompt(prompt, context)
         return self.generate_content(
             system_instruction=system_instruction,
             query=query,
             response_type="text/plain"
         )
 
+    async def agenerate_email_content(self, prompt: str, context: str = "") -> str:
+        """Async variant of generate_email_content."""
+        system_instruction, query = self._email_content_prompt(prompt, context)
+        return await self.agenerate_content(
+            system_instruction=system_instruction,
+            query=query,
+            response_type="text/plain"
+        )
+
+    async def astream_email_content(self, prompt: str, context: str = "") -> AsyncIterator[str]:
+        """Streaming variant of generate_email_content."""
+        system_instruction, query = self._email_content_prompt(prompt, context)
+        async for chunk in self.astream_content(system_instruction=system_instruction, query=query):
+            yield chunk
+
     def analyze_email_sentiment(self, email_content: str) -> Dict[str, Any]:
         """
         Analyze email sentiment using Gemini.
@@ -249,31 +568,31 @@ class LLMService:
         Returns:
             Analysis results including sentiment, tone, and suggestions
         """
-        system_instruction = (
-            "You are an expert in email analysis. Analyze the provided email content for sentiment, "
-            "tone, professionalism, and provide suggestions for improvement if needed. "
-            "Respond in JSON format with the following structure: "
-            '{"sentiment": "positive/negative/neutral", "tone": "description", '
-            '"professionalism_score": number_0_to_10, "suggestions": ["suggestion1", "suggestion2"], '
-            '"summary": "brief summary"}'
-        )
-        
         try:
             response = self.generate_content(
-                system_instruction=system_instruction,
+                system_instruction=SENTIMENT_SYSTEM_INSTRUCTION,
                 query=f"Analyze this email:\n\n{email_content}",
-                response_type="text/plain"
+                response_type="text/plain",
+                model_name=self.aux_model_name
             )
             return json.loads(response)
         except Exception as e:
             print(f"[LLMService] analyze_email_sentiment failed: {e}")
-            return {
-                "sentiment": "neutral",
-                "tone": "unknown",
-                "professionalism_score": 5.0,
-                "suggestions": ["Unable to analyze email"],
-                "summary": "Analysis failed"
-            }
+            return dict(SENTIMENT_FALLBACK)
+
+    async def aanalyze_email_sentiment(self, email_content: str) -> Dict[str, Any]:
+        """Async variant of analyze_email_sentiment."""
+        try:
+            response = await self.agenerate_content(
+                system_instruction=SENTIMENT_SYSTEM_INSTRUCTION,
+                query=f"Analyze this email:\n\n{email_content}",
+                response_type="text/plain",
+                model_name=self.aux_model_name
+            )
+            return json.loads(response)
+        except Exception as e:
+            print(f"[LLMService] aanalyze_email_sentiment failed: {e}")
+            return dict(SENTIMENT_FALLBACK)
 
     def suggest_email_subject(self, email_content: str, context: str = "") -> str:
         """
@@ -286,21 +605,71 @@ class LLMService:
         Returns:
             Suggested subject line
         """
-        system_instruction = (
-            "You are an expert at writing email subject lines. Generate a clear, concise, "
-            "and compelling subject line that accurately represents the email content. "
-            "Keep it under 60 characters and avoid spam trigger words."
+        system_instruction, query = self._subject_prompt(email_content, context)
+        return self.generate_content(
+            system_instruction=system_instruction,
+            query=query,
+            response_type="text/plain",
+            model_name=self.aux_model_name
+        ).strip()
+
+    async def asuggest_email_subject(self, email_content: str, context: str = "") -> str:
+        """Async variant of suggest_email_subject."""
+        system_instruction, query = self._subject_prompt(email_content, context)
+        response = await self.agenerate_content(
+            system_instruction=system_instruction,
+            query=query,
+            response_type="text/plain",
+            model_name=self.aux_model_name
         )
+        return response.strip()
+
+    async def asuggest_email_subject_from_purpose(self, purpose: str, context: str = "") -> str:
+        """
+        Suggest a subject line from the purpose of an email, before its body exists.
         
-        query = f"Suggest a subject line for this email:\n\n{email_content}"
+        Args:
+            purpose: The purpose of the email
+            context: Optional context about the recipient or situation
+            
+        Returns:
+            Suggested subject line
+        """
+        query = f"Suggest a subject line for an email about:\n\n{purpose}"
         if context:
             query += f"\n\nContext: {context}"
+        response = await self.agenerate_content(
+            system_instruction=SUBJECT_SYSTEM_INSTRUCTION,
+            query=query,
+            response_type="text/plain",
+            model_name=self.aux_model_name
+        )
+        return response.strip()
+
+    async def agenerate_email_with_subject(self, prompt: str, context: str = "") -> Dict[str, str]:
+        """
+        Generate email content and its subject line in a single Gemini request.
+        
+        Args:
+            prompt: Description of what kind of email to generate
+            context: Optional context about recipient, situation, etc.
             
-        return self.generate_content(
-            system_instruction=system_instruction,
+        Returns:
+            Dictionary with "subject" and "content" keys
+            
+        Raises:
+            ValueError: If the response is not a JSON object with both fields
+        """
+        _, query = self._email_content_prompt(prompt, context)
+        response = await self.agenerate_content(
+            system_instruction=EMAIL_WITH_SUBJECT_SYSTEM_INSTRUCTION,
             query=query,
             response_type="text/plain"
-        ).strip()
+        )
+        result = json.loads(strip_code_fence(response))
+        if not isinstance(result, dict) or not result.get("subject") or not result.get("content"):
+            raise ValueError("Structured response is missing subject or content")
+        return {"content": str(result["content"]), "subject": str(result["subject"]).strip()}
 
     def generate_email_response(
         self,
@@ -319,6 +688,48 @@ class LLMService:
         Returns:
             Generated response
         """
+        system_instruction, query = self._email_response_prompt(original_email, response_type, additional_context)
+        return self.generate_content(
+            system_instruction=system_instruction,
+            query=query,
+            response_type="text/plain"
+        )
+
+    async def agenerate_email_response(
+        self,
+        original_email: str,
+        response_type: str = "acknowledge",
+        additional_context: str = ""
+    ) -> str:
+        """Async variant of generate_email_response."""
+        system_instruction, query = self._email_response_prompt(original_email, response_type, additional_context)
+        return await self.agenerate_content(
+            system_instruction=system_instruction,
+            query=query,
+            response_type="text/plain"
+        )
+
+    def _email_content_prompt(self, prompt: str, context: str) -> Tuple[str, str]:
+        """Build the system instruction and query for email content generation."""
+        query = f"Generate an email based on this request: {prompt}"
+        if context:
+            query += f"\n\nContext: {context}"
+        return EMAIL_CONTENT_SYSTEM_INSTRUCTION, query
+
+    def _subject_prompt(self, email_content: str, context: str) -> Tuple[str, str]:
+        """Build the system instruction and query for subject line suggestion."""
+        query = f"Suggest a subject line for this email:\n\n{email_content}"
+        if context:
+            query += f"\n\nContext: {context}"
+        return SUBJECT_SYSTEM_INSTRUCTION, query
+
+    def _email_response_prompt(
+        self,
+        original_email: str,
+        response_type: str,
+        additional_context: str
+    ) -> Tuple[str, str]:
+        """Build the system instruction and query for an email response."""
         system_instruction = (
             f"You are an expert at writing email responses. Generate a {response_type} response "
             "to the provided email. The response should be professional, appropriate, and "
@@ -328,12 +739,7 @@ class LLMService:
         query = f"Generate a {response_type} response to this email:\n\n{original_email}"
         if additional_context:
             query += f"\n\nAdditional context: {additional_context}"
-        
-        return self.generate_content(
-            system_instruction=system_instruction,
-            query=query,
-            response_type="text/plain"
-        )
+        return system_instruction, query
 
     def summarize_email(
         self,
@@ -458,6 +864,74 @@ class LLMService:
                 "key_topics": []
             }
 
+    def summarize_emails_batch(self, items: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Summarize several emails with a single Gemini request.
+
+        Args:
+            items: List of dictionaries with email_content, email_subject,
+                sender and recipient keys (the summarize_email arguments)
+
+        Returns:
+            List of summarization dictionaries in the same order as items
+        """
+        if not items:
+            return []
+        if len(items) == 1:
+            return [self.summarize_email(**items[0])]
+
+        system_instruction = (
+            "You are an expert email analyst. Analyze each provided email and extract key information. "
+            "You MUST respond with ONLY a valid JSON array containing one object per email, "
+            "in the same order as the emails are given. "
+            "Do not include any markdown formatting, explanations, or additional text."
+        )
+
+        email_blocks = []
+        for index, item in enumerate(items, start=1):
+            context_parts = [f"Email {index}"]
+            if item.get("email_subject"):
+                context_parts.append(f"Subject: {item['email_subject']}")
+            if item.get("sender"):
+                context_parts.append(f"From: {item['sender']}")
+            if item.get("recipient"):
+                context_parts.append(f"To: {item['recipient']}")
+            context_parts.append(f"Content:\n{item.get('email_content', '')}")
+            email_blocks.append("\n".join(context_parts))
+
+        query = (
+            f"Analyze and summarize each of the following {len(items)} emails. "
+            "Return ONLY a JSON array where each element has this structure:\n"
+            '{"summary": "brief summary", "main_concept": "main topic", '
+            '"sentiment": "positive/negative/neutral/mixed", "key_topics": ["topic1", "topic2"]}'
+            "\n\n" + "\n\n".join(email_blocks)
+        )
+
+        try:
+            response = self.generate_content(
+                system_instruction=system_instruction,
+                query=query,
+                response_type="text/plain"
+            )
+            results = json.loads(response)
+            if not isinstance(results, list) or len(results) != len(items):
+                raise ValueError(f"Expected a JSON array of {len(items)} summaries")
+
+            required_fields = ["summary", "main_concept", "sentiment", "key_topics"]
+            for result in results:
+                if not isinstance(result, dict):
+                    raise ValueError("Summary entries must be JSON objects")
+                for field in required_fields:
+                    if field not in result:
+                        result[field] = "Unknown" if field != "key_topics" else []
+            return results
+
+        except Exception as e:
+            # Fall back to one request per email so a malformed batch reply
+            # does not lose every summary
+            print(f"[LLMService] summarize_emails_batch failed, summarizing individually: {e}")
+            return [self.summarize_email(**item) for item in items]
+
     def extract_email_concepts(self, email_content: str) -> List[str]:
         """
         Extract key concepts and topics from email content.
@@ -624,13 +1098,14 @@ class LLMService:
             test_response = self.generate_content(
                 system_instruction="You are a helpful assistant.",
                 query="Say 'Hello'",
-                response_type="text/plain"
+                response_type="text/plain",
+                model_name=self.aux_model_name
             )
             
             return {
                 "status": "healthy",
                 "service": "Gemini LLM Service",
-                "model": self.model_name,
+                "model": self.aux_model_name,
                 "test_response": test_response,
                 "available_models": []
             }
@@ -0,0 +1,137 @@
+"""
+Cached OAuth Repository
+
+Read-through cache for OAuth session lookups by ID, placed in front of
+another OAuthRepository implementation. Uses Redis when available and a
+short-lived process-local cache otherwise.
+"""
+
+import logging
+import pickle
+from typing import List, Optional, Set
+
+from ..cache.llm_cache import InMemoryLRUBackend
+from ...domain.entities.oauth_session import OAuthSession
+from ...domain.repositories.oauth_repository import OAuthRepository
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached session stays valid per process; other workers' writes can't invalidate it
+LOCAL_SESSION_CACHE_TTL = 30
+LOCAL_SESSION_CACHE_MAX_ENTRIES = 10000
+
+
+class CachedOAuthRepository(OAuthRepository):
+    """OAuth repository that serves session lookups by ID from a cache"""
+
+    def __init__(self, repository: OAuthRepository, redis_client=None, namespace: str = "oauth"):
+        self.repository = repository
+        self.redis = redis_client
+        self.namespace = namespace
+        # Entries are stored pickled either way, so callers never share a mutable session
+        self._local = InMemoryLRUBackend(LOCAL_SESSION_CACHE_MAX_ENTRIES) if redis_client is None else None
+
+    def _session_key(self, session_id: str) -> str:
+        return f"{self.namespace}:sess:{session_id}"
+
+    def _user_sessions_key(self, user_id: str) -> str:
+        return f"{self.namespace}:user_sess:{user_id}"
+
+    async def _cache_session(self, session: OAuthSession) -> None:
+        """Cache a session until its token expires; cache failures never fail the request"""
+        ttl = session.token.expires_in_seconds()
+        if not session.id or ttl <= 0:
+            return
+        user_sessions_key = self._user_sessions_key(session.user_id)
+        try:
+            if self._local is not None:
+                await self._local.set(
+                    self._session_key(session.id), pickle.dumps(session), min(ttl, LOCAL_SESSION_CACHE_TTL)
+                )
+                if session.user_id:
+                    # Lives in the same bounded cache and expires with the newest session it lists
+                    session_ids = await self._local.get(user_sessions_key) or frozenset()
+                    await self._local.set(user_sessions_key, session_ids | {session.id}, LOCAL_SESSION_CACHE_TTL)
+                return
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(self._session_key(session.id), pickle.dumps(session), ex=ttl)
+                # Track which cached sessions belong to the user so they can all be dropped at once
+                pipe.sadd(user_sessions_key, session.id)
+                pipe.expire(user_sessions_key, ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to cache OAuth session %s: %s", session.id, e)
+
+    async def _invalidate(self, *keys: str) -> None:
+        """Drop cached entries; cache failures never fail the request"""
+        try:
+            if self._local is not None:
+                await self._local.delete(*keys)
+            else:
+                await self.redis.delete(*keys)
+        except Exception as e:
+            logger.warning("Failed to invalidate cached OAuth sessions: %s", e)
+
+    async def _cached_user_session_ids(self, user_id: str) -> Set[str]:
+        """IDs of the user's sessions that may be cached"""
+        if self._local is not None:
+            return set(await self._local.get(self._user_sessions_key(user_id)) or ())
+        try:
+            session_ids = await self.redis.smembers(self._user_sessions_key(user_id))
+        except Exception as e:
+            logger.warning("Failed to list cached OAuth sessions for user %s: %s", user_id, e)
+            return set()
+        return {sid.decode() if isinstance(sid, bytes) else sid for sid in session_ids}
+
+    async def save_session(self, session: OAuthSession) -> OAuthSession:
+        """Save an OAuth session"""
+        saved = await self.repository.save_session(session)
+        await self._invalidate(self._session_key(saved.id))
+        return saved
+
+    async def find_session_by_id(self, session_id: str) -> Optional[OAuthSession]:
+        """Find OAuth session by ID, from the cache when present"""
+        try:
+            key = self._session_key(session_id)
+            raw = await (self._local.get(key) if self._local is not None else self.redis.get(key))
+            if raw is not None:
+                return pickle.loads(raw)
+        except Exception as e:
+            logger.warning("Failed to read cached OAuth session %s: %s", session_id, e)
+
+        session = await self.repository.find_session_by_id(session_id)
+        if session:
+            await self._cache_session(session)
+        return session
+
+    async def find_session_by_state(self, state: str) -> Optional[OAuthSession]:
+        """Find OAuth session by state parameter"""
+        return await self.repository.find_session_by_state(state)
+
+    async def find_active_session_by_user_id(self, user_id: str) -> Optional[OAuthSession]:
+        """Find active OAuth session for a user"""
+        return await self.repository.find_active_session_by_user_id(user_id)
+
+    async def update_session(self, session: OAuthSession) -> OAuthSession:
+        """Update an OAuth session"""
+        updated = await self.repository.update_session(session)
+        await self._invalidate(self._session_key(updated.id))
+        return updated
+
+    async def delete_session(self, session_id: str) -> bool:
+        """Delete an OAuth session"""
+        deleted = await self.repository.delete_session(session_id)
+        await self._invalidate(self._session_key(session_id))
+        return deleted
+
+    async def deactivate_user_sessions(self, user_id: str) -> bool:
+        """Deactivate all sessions for a user"""
+        deactivated = await self.repository.deactivate_user_sessions(user_id)
+        session_ids = await self._cached_user_session_ids(user_id)
+        keys = [self._session_key(session_id) for session_id in session_ids]
+        await self._invalidate(self._user_sessions_key(user_id), *keys)
+        return deactivated
+
+    async def find_sessions_expiring_within(self, seconds: int) -> List[OAuthSession]:
+        """Find active OAuth sessions whose tokens expire within the given number of seconds"""
+        return await self.repository.find_sessions_expiring_within(seconds)
@@ -0,0 +1,153 @@
+"""
+Cached User Repository
+
+Read-through cache for user lookups by ID and email, placed in front of
+another UserRepository implementation. Uses Redis when available and a
+short-lived process-local cache otherwise.
+"""
+
+import logging
+import pickle
+from typing import Any, Dict, List, Optional
+
+from ..cache.llm_cache import InMemoryLRUBackend
+from ...domain.entities.user import User, UserRole
+from ...domain.repositories.user_repository import UserRepository
+from ...domain.value_objects.email_address import EmailAddress
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached user stays valid in Redis
+USER_CACHE_TTL = 300
+# Seconds a cached user stays valid per process; other workers' writes can't invalidate it
+LOCAL_USER_CACHE_TTL = 60
+LOCAL_USER_CACHE_MAX_ENTRIES = 10000
+
+
+class CachedUserRepository(UserRepository):
+    """User repository that serves lookups by ID and email from a cache"""
+
+    def __init__(self, repository: UserRepository, redis_client=None, ttl: Optional[int] = None, namespace: str = "user"):
+        self.repository = repository
+        self.redis = redis_client
+        # Entries are stored pickled either way, so callers never share a mutable User
+        self._local = InMemoryLRUBackend(LOCAL_USER_CACHE_MAX_ENTRIES) if redis_client is None else None
+        self.ttl = ttl or (LOCAL_USER_CACHE_TTL if redis_client is None else USER_CACHE_TTL)
+        self.namespace = namespace
+
+    def _id_key(self, user_id: str) -> str:
+        return f"{self.namespace}:id:{user_id}"
+
+    def _email_key(self, email: EmailAddress) -> str:
+        return f"{self.namespace}:email:{str(email).lower()}"
+
+    async def _get_raw(self, key: str) -> Optional[Any]:
+        if self._local is not None:
+            return await self._local.get(key)
+        return await self.redis.get(key)
+
+    async def _get_cached(self, user_id: str) -> Optional[User]:
+        """Get a cached user by ID; cache failures are treated as misses"""
+        try:
+            raw = await self._get_raw(self._id_key(user_id))
+            return pickle.loads(raw) if raw is not None else None
+        except Exception as e:
+            logger.warning("Failed to read cached user %s: %s", user_id, e)
+            return None
+
+    async def _cache(self, user: User) -> None:
+        """Cache a user under its ID, and its email as a pointer to the ID"""
+        if not user.id:
+            return
+        entries = {
+            self._id_key(user.id): pickle.dumps(user),
+            self._email_key(user.email): user.id
+        }
+        try:
+            if self._local is not None:
+                for key, value in entries.items():
+                    await self._local.set(key, value, self.ttl)
+                return
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in entries.items():
+                    pipe.set(key, value, ex=self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to cache user %s: %s", user.id, e)
+
+    async def _invalidate(self, *keys: str) -> None:
+        """Drop cached entries; cache failures never fail the request"""
+        try:
+            if self._local is not None:
+                await self._local.delete(*keys)
+            else:
+                await self.redis.delete(*keys)
+        except Exception as e:
+            logger.warning("Failed to invalidate cached users: %s", e)
+
+    async def save(self, user: User) -> User:
+        """Save a user"""
+        saved = await self.repository.save(user)
+        await self._invalidate(self._id_key(saved.id), self._email_key(saved.email))
+        return saved
+
+    async def find_by_id(self, user_id: str) -> Optional[User]:
+        """Find user by ID, from the cache when present"""
+        user = await self._get_cached(user_id)
+        if user is not None:
+            return user
+
+        user = await self.repository.find_by_id(user_id)
+        if user:
+            await self._cache(user)
+        return user
+
+    async def find_by_email(self, email: EmailAddress) -> Optional[User]:
+        """Find user by email, from the cache when present"""
+        try:
+            user_id = await self._get_raw(self._email_key(email))
+        except Exception as e:
+            logger.warning("Failed to read cached user for %s: %s", email, e)
+            user_id = None
+
+        if user_id is not None:
+            user = await self._get_cached(user_id.decode() if isinstance(user_id, bytes) else user_id)
+            # The email pointer can outlive a change of the user's email
+            if user is not None and str(user.email).lower() == str(email).lower():
+                return user
+
+        user = await self.repository.find_by_email(email)
+        if user:
+            await self._cache(user)
+        return user
+
+    async def find_by_role(self, role: UserRole) -> List[User]:
+        """Find users by role"""
+        return await self.repository.find_by_role(role)
+
+    async def find_active_users(self, limit: int = 50) -> List[User]:
+        """Find active users"""
+        return await self.repository.find_active_users(limit)
+
+    async def update(self, user: User) -> User:
+        """Update a user"""
+        updated = await self.repository.update(user)
+        await self._invalidate(self._id_key(updated.id), self._email_key(updated.email))
+        return updated
+
+    async def update_profile(self, user_id: str, user_profile: Dict[str, Any], profile_cache_key: Optional[str] = None) -> None:
+        """Update only the LLM-generated profile fields of a user"""
+        await self.repository.update_profile(user_id, user_profile, profile_cache_key)
+        await self._invalidate(self._id_key(user_id))
+
+    async def delete(self, user_id: str) -> bool:
+        """Delete a user"""
+        deleted = await self.repository.delete(user_id)
+        # A leftover email pointer misses on the ID key and falls through to the store
+        await self._invalidate(self._id_key(user_id))
+        return deleted
+
+    async def exists_by_email(self, email: EmailAddress) -> bool:
+        """Check if user exists by email"""
+        user = await self.find_by_email(email)
+        return user is not None
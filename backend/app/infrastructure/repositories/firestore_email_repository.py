@@ -4,15 +4,27 @@ Firestore Email Repository Implementation
 Concrete implementation of email repository using Firestore.
 """
 
-from typing import List, Optional
+import logging
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from firebase_admin import firestore
+from google.api_core.exceptions import FailedPrecondition
+from google.cloud.firestore_v1.base_query import FieldFilter, Or
 
 from ...domain.entities.email import Email, EmailStatus, EmailType
 from ...domain.value_objects.email_address import EmailAddress
 from ...domain.repositories.email_repository import EmailRepository
 from ...domain.exceptions.domain_exceptions import EntityNotFoundError
 
+logger = logging.getLogger(__name__)
+
+# Firestore caps a single write batch at 500 operations
+FIRESTORE_BATCH_LIMIT = 500
+
+# Fields returned by find_sender_summaries, and how much of each body to keep
+SENDER_SUMMARY_FIELDS = ["subject", "body", "summary", "sentiment", "main_concept", "key_topics"]
+SENDER_SUMMARY_BODY_LIMIT = 1000
+
 
 class FirestoreEmailRepository(EmailRepository):
     """Firestore implementation of email repository"""
@@ -50,6 +62,12 @@ class FirestoreEmailRepository(EmailRepository):
             "categorized_at": email.categorized_at
         }
     
+    def _collection_for(self, email: Email):
+        """Get the collection an email is stored in ('sent_email' for sent emails)"""
+        if email.email_type == EmailType.SENT:
+            return self.db.collection("sent_email")
+        return self.db.collection(self.collection_name)
+    
     def _doc_to_entity(self, doc_id: str, doc_data: dict) -> Email:
         """Convert Firestore document to email entity"""
         sender = EmailAddress.create(doc_data["sender"])
@@ -109,6 +127,23 @@ class FirestoreEmailRepository(EmailRepository):
             email.id = doc_ref[1].id
         return email
     
+    async def save_many(self, emails: List[Email]) -> List[Email]:
+        """Save several emails using Firestore write batches"""
+        for i in range(0, len(emails), FIRESTORE_BATCH_LIMIT):
+            batch = self.db.batch()
+            for email in emails[i:i + FIRESTORE_BATCH_LIMIT]:
+                doc_data = self._entity_to_doc(email)
+                doc_data["created_at"] = firestore.SERVER_TIMESTAMP
+                doc_data["updated_at"] = firestore.SERVER_TIMESTAMP
+                
+                collection = self._collection_for(email)
+                doc_ref = collection.document(email.id) if email.id else collection.document()
+                email.id = doc_ref.id
+                batch.set(doc_ref, doc_data)
+            batch.commit()
+        
+        return emails
+    
     async def find_by_id(self, email_id: str) -> Optional[Email]:
         """Find email by ID"""
         doc_ref = self.db.collection(self.collection_name).document(email_id)
@@ -119,6 +154,20 @@ class FirestoreEmailRepository(EmailRepository):
         
         return self._doc_to_entity(doc.id, doc.to_dict())
     
+    async def find_by_ids(self, email_ids: List[str]) -> Dict[str, Email]:
+        """Find several emails by ID with a single multi-get"""
+        if not email_ids:
+            return {}
+        
+        collection = self.db.collection(self.collection_name)
+        doc_refs = [collection.document(email_id) for email_id in dict.fromkeys(email_ids)]
+        
+        return {
+            doc.id: self._doc_to_entity(doc.id, doc.to_dict())
+            for doc in self.db.get_all(doc_refs)
+            if doc.exists
+        }
+    
     async def find_by_sender(self, sender: EmailAddress, limit: int = 50) -> List[Email]:
         """Find emails by sender"""
         query = self.db.collection(self.collection_name)\
@@ -129,6 +178,43 @@ class FirestoreEmailRepository(EmailRepository):
         docs = query.stream()
         return [self._doc_to_entity(doc.id, doc.to_dict()) for doc in docs]
     
+    async def find_sender_summaries(self, sender: str, email_type: EmailType = EmailType.SENT, limit: int = 200) -> List[Dict[str, Any]]:
+        """
+        Find the most recent emails by sender, projected to their summary fields.
+        
+        Ordering by recency needs a composite index on the collection
+        (sender ASC, created_at DESC). Without it the emails are returned
+        in no particular order instead of failing.
+        """
+        # Sent emails live in their own collection (see save())
+        collection_name = "sent_email" if email_type == EmailType.SENT else self.collection_name
+        query = self.db.collection(collection_name)\
+            .where("sender", "==", str(sender))\
+            .select(SENDER_SUMMARY_FIELDS)\
+            .limit(limit)
+        
+        try:
+            docs = list(query.order_by("created_at", direction=firestore.Query.DESCENDING).stream())
+        except FailedPrecondition as e:
+            logger.warning(
+                "Missing Firestore index on %s (sender ASC, created_at DESC); falling back to unordered query: %s",
+                collection_name, e
+            )
+            docs = list(query.stream())
+        
+        return [{"id": doc.id, **self._summary_fields(doc.to_dict())} for doc in docs]
+    
+    def _summary_fields(self, doc_data: dict) -> Dict[str, Any]:
+        """Project a document to its summary fields, with the body truncated"""
+        return {
+            "subject": doc_data.get("subject"),
+            "body": (doc_data.get("body") or "")[:SENDER_SUMMARY_BODY_LIMIT],
+            "summary": doc_data.get("summary"),
+            "sentiment": doc_data.get("sentiment"),
+            "main_concept": doc_data.get("main_concept"),
+            "key_topics": doc_data.get("key_topics") or []
+        }
+    
     async def find_by_recipient(self, recipient: EmailAddress, limit: int = 50) -> List[Email]:
         """Find emails by recipient"""
         query = self.db.collection(self.collection_name).where("recipients", "array_contains", str(recipient)).limit(limit)
@@ -140,6 +226,18 @@ class FirestoreEmailRepository(EmailRepository):
         
         return emails
     
+    async def find_summaries_by_sender_or_recipient(self, address: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """Find emails the address sent or received, projected to their summary fields"""
+        query = self.db.collection(self.collection_name)\
+            .where(filter=Or([
+                FieldFilter("sender", "==", str(address)),
+                FieldFilter("recipients", "array_contains", str(address))
+            ]))\
+            .select(SENDER_SUMMARY_FIELDS)\
+            .limit(limit)
+        
+        return [self._summary_fields(doc.to_dict()) for doc in query.stream()]
+    
     async def find_by_account_owner(self, account_owner: str, limit: int = 50) -> List[Email]:
         """Find emails by account owner (logged-in user)"""
         query = self.db.collection(self.collection_name)\
@@ -198,6 +296,22 @@ class FirestoreEmailRepository(EmailRepository):
         print(f"🔧 DEBUG: [FirestoreEmailRepository] Email updated successfully in Firestore")
         return email
     
+    async def update_many(self, emails: List[Email]) -> List[Email]:
+        """Update several emails using Firestore write batches"""
+        for email in emails:
+            if not email.id:
+                raise ValueError("Email ID is required for update")
+        
+        for i in range(0, len(emails), FIRESTORE_BATCH_LIMIT):
+            batch = self.db.batch()
+            for email in emails[i:i + FIRESTORE_BATCH_LIMIT]:
+                doc_data = self._entity_to_doc(email)
+                doc_data["updated_at"] = firestore.SERVER_TIMESTAMP
+                batch.update(self._collection_for(email).document(email.id), doc_data)
+            batch.commit()
+        
+        return emails
+    
     async def delete(self, email_id: str) -> bool:
         """Delete an email"""
         doc_ref = self.db.collection(self.collection_name).document(email_id)
@@ -4,15 +4,16 @@ Firestore OAuth Repository Implementation
 Concrete implementation of OAuth repository using Firestore.
 """
 
-from typing import Optional
+from typing import List, Optional
 from firebase_admin import firestore
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from ...domain.entities.oauth_session import OAuthSession
 from ...domain.repositories.oauth_repository import OAuthRepository
 from ...domain.value_objects.oauth_token import OAuthToken
 from ...domain.value_objects.oauth_user_info import OAuthUserInfo
 from ...domain.value_objects.email_address import EmailAddress
+from ...domain.exceptions.domain_exceptions import DomainValidationError
 
 
 class FirestoreOAuthRepository(OAuthRepository):
@@ -199,4 +200,26 @@ class FirestoreOAuthRepository(OAuthRepository):
                 "updated_at": firestore.SERVER_TIMESTAMP
             })
         
-        return len(docs) > 0 
\ No newline at end of file
+        return len(docs) > 0
+    
+    async def find_sessions_expiring_within(self, seconds: int) -> List[OAuthSession]:
+        """Find active OAuth sessions whose tokens expire within the given number of seconds"""
+        now = datetime.utcnow()
+        # expires_at is stored as an ISO string, which orders the same as the datetime
+        query = self.db.collection(self.collection_name)\
+            .where("token.expires_at", ">", now.isoformat())\
+            .where("token.expires_at", "<=", (now + timedelta(seconds=seconds)).isoformat())
+        
+        sessions = []
+        for doc in query.stream():
+            doc_data = doc.to_dict()
+            # Filtered here rather than in the query to avoid needing a composite index
+            if not doc_data.get("is_active", True):
+                continue
+            try:
+                sessions.append(self._doc_to_entity(doc.id, doc_data))
+            except DomainValidationError:
+                # Token expired between the query and loading it
+                continue
+        
+        return sessions
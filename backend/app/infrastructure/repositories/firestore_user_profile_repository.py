@@ -8,8 +8,8 @@ from app.domain.entities.user_profile import UserProfile
 from app.domain.repositories.user_profile_repository import UserProfileRepository
 
 class FirestoreUserProfileRepository(UserProfileRepository):
-    def __init__(self, client: Optional[firestore.Client] = None):
-        self.client = client or firestore.Client()
+    def __init__(self, client: firestore.Client):
+        self.client = client
         self.collection = self.client.collection("user_profiles")
 
     async def save(self, profile: UserProfile) -> UserProfile:
@@ -4,7 +4,7 @@ Firestore User Repository Implementation
 Concrete implementation of user repository using Firestore.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from firebase_admin import firestore
 
 from ...domain.entities.user import User, UserRole
@@ -35,6 +35,8 @@ class FirestoreUserRepository(UserRepository):
         }
         if user.user_profile is not None:
             doc["user_profile"] = user.user_profile
+        if user.profile_cache_key is not None:
+            doc["profile_cache_key"] = user.profile_cache_key
         return doc
     
     def _doc_to_entity(self, doc_id: str, doc_data: dict) -> User:
@@ -50,7 +52,8 @@ class FirestoreUserRepository(UserRepository):
             google_id=doc_data.get("google_id"),
             profile_picture=doc_data.get("profile_picture"),
             oauth_provider=doc_data.get("oauth_provider"),
-            user_profile=doc_data.get("user_profile")
+            user_profile=doc_data.get("user_profile"),
+            profile_cache_key=doc_data.get("profile_cache_key")
         )
         # Set entity ID and timestamps
         user.id = doc_id
@@ -128,6 +131,15 @@ class FirestoreUserRepository(UserRepository):
         
         return user
     
+    async def update_profile(self, user_id: str, user_profile: Dict[str, Any], profile_cache_key: Optional[str] = None) -> None:
+        """Update only the LLM-generated profile fields of a user"""
+        doc_ref = self.db.collection(self.collection_name).document(user_id)
+        doc_ref.update({
+            "user_profile": user_profile,
+            "profile_cache_key": profile_cache_key,
+            "updated_at": firestore.SERVER_TIMESTAMP
+        })
+    
     async def delete(self, user_id: str) -> bool:
         """Delete a user"""
         doc_ref = self.db.collection(self.collection_name).document(user_id)
@@ -5,10 +5,9 @@ API endpoints for Gemini-powered features.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi.responses import StreamingResponse
 from typing import Dict, List, Optional, Any
 import base64
-from PIL import Image
-import io
 
 from ...infrastructure.di.container import get_container
 from ...presentation.middleware.auth_middleware import get_current_user
@@ -35,6 +34,9 @@ from ...presentation.models.llm_models import (
     GeminiHealthResponse
 )
 
+# Keep proxies from buffering streamed generations, so chunks reach the client as they arrive
+STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
 router = APIRouter(
     prefix="/llm", 
     tags=["LLM"],
@@ -58,7 +60,7 @@ async def generate_email_content(
         container = get_container()
         use_case = container.generate_email_content_use_case()
         
-        content = use_case.execute(
+        content = await use_case.aexecute(
             prompt=request.prompt,
             context=request.context
         )
@@ -71,6 +73,23 @@ async def generate_email_content(
         raise HTTPException(status_code=500, detail=f"Failed to generate email content: {str(e)}")
 
 
+@router.post("/generate-email-content/stream", response_class=StreamingResponse)
+async def stream_email_content(
+    request: GenerateEmailContentRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream generated email content as plain text while Gemini produces it.
+    """
+    container = get_container()
+    use_case = container.generate_email_content_use_case()
+    return StreamingResponse(
+        use_case.stream(prompt=request.prompt, context=request.context),
+        media_type="text/plain",
+        headers=STREAM_HEADERS
+    )
+
+
 @router.post("/analyze-email-sentiment", response_model=AnalyzeEmailSentimentResponse)
 async def analyze_email_sentiment(
     request: AnalyzeEmailSentimentRequest,
@@ -83,7 +102,7 @@ async def analyze_email_sentiment(
         container = get_container()
         use_case = container.analyze_email_sentiment_use_case()
         
-        analysis = use_case.execute(request.email_content)
+        analysis = await use_case.aexecute(request.email_content)
         
         return AnalyzeEmailSentimentResponse(
             sentiment=analysis.get("sentiment", "neutral"),
@@ -109,7 +128,7 @@ async def suggest_email_subject(
         container = get_container()
         use_case = container.suggest_email_subject_use_case()
         
-        subject = use_case.execute(
+        subject = await use_case.aexecute(
             email_content=request.email_content,
             context=request.context
         )
@@ -156,7 +175,7 @@ async def smart_email_composer(
         container = get_container()
         use_case = container.smart_email_composer_use_case()
         
-        result = use_case.execute(
+        result = await use_case.aexecute(
             purpose=request.purpose,
             recipient_context=request.recipient_context,
             tone=request.tone,
@@ -164,8 +183,8 @@ async def smart_email_composer(
         )
         
         return SmartEmailComposerResponse(
-            content=result.get("content", ""),
-            subject=result.get("subject", ""),
+            content=result.content,
+            subject=result.subject or "",
             success=True
         )
     except Exception as e:
@@ -184,7 +203,7 @@ async def generate_email_response(
         container = get_container()
         use_case = container.generate_email_response_use_case()
         
-        response = use_case.execute(
+        response = await use_case.aexecute(
             original_email=request.original_email,
             response_type=request.response_type,
             additional_context=request.additional_context
@@ -198,6 +217,27 @@ async def generate_email_response(
         raise HTTPException(status_code=500, detail=f"Failed to generate email response: {str(e)}")
 
 
+@router.post("/generate-email-response/stream", response_class=StreamingResponse)
+async def stream_email_response(
+    request: GenerateEmailResponseRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream a generated email response as plain text while Gemini produces it.
+    """
+    container = get_container()
+    use_case = container.generate_email_response_use_case()
+    return StreamingResponse(
+        use_case.stream(
+            original_email=request.original_email,
+            response_type=request.response_type,
+            additional_context=request.additional_context
+        ),
+        media_type="text/plain",
+        headers=STREAM_HEADERS
+    )
+
+
 @router.post(
     "/compose-email",
     response_model=ComposeEmailBodyResponse,
@@ -235,18 +275,30 @@ async def compose_email(
             user_id=current_user.id,
             query=request.query
         )
-        # Assume result is a dict with 'body' key or just a string
-        if isinstance(result, dict):
-            body = result.get("body") or result.get("content") or ""
-        else:
-            body = str(result)
-        return ComposeEmailBodyResponse(body=body)
+        return ComposeEmailBodyResponse(body=result.body)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid request: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to compose email: {str(e)}")
 
 
+@router.post("/compose-email/stream", response_class=StreamingResponse, tags=["LLM", "Email Composition"])
+async def stream_compose_email(
+    request: ComposeEmailQueryRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream an email body composed in the user's style as plain text.
+    """
+    container = get_container()
+    use_case = container.compose_email_use_case()
+    return StreamingResponse(
+        use_case.stream(user_id=current_user.id, query=request.query),
+        media_type="text/plain",
+        headers=STREAM_HEADERS
+    )
+
+
 @router.post("/chat/start", response_model=GeminiChatResponse)
 async def start_chat(
     request: GeminiChatRequest,
@@ -290,7 +342,7 @@ async def send_chat_message(
         container = get_container()
         use_case = container.gemini_chat_use_case()
         
-        response = use_case.send_message(message, session_id, model_name)
+        response = await use_case.asend_message(message, session_id, model_name)
         
         return GeminiChatResponse(
             session_id=session_id,
@@ -341,7 +393,7 @@ async def analyze_image(
         else:
             image_data = request.image_data
         
-        result = use_case.analyze_image(
+        result = await use_case.aanalyze_image(
             system_instruction=request.system_instruction,
             query=request.query,
             image_data=image_data,
@@ -378,7 +430,7 @@ async def analyze_image_file(
         container = get_container()
         use_case = container.gemini_vision_use_case()
         
-        result = use_case.analyze_image(
+        result = await use_case.aanalyze_image(
             system_instruction=system_instruction,
             query=query,
             image_data=image_data,
@@ -442,7 +494,7 @@ async def llm_health_check():
         container = get_container()
         use_case = container.gemini_health_check_use_case()
         
-        health_info = use_case.execute()
+        health_info = await use_case.aexecute()
         
         return GeminiHealthResponse(
             status=health_info.get("status", "unknown"),
@@ -4,6 +4,8 @@ OAuth Controller
 Clean architecture implementation of OAuth API endpoints.
 """
 
+import traceback
+
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from fastapi.responses import RedirectResponse
 from fastapi.security import HTTPBearer
@@ -191,17 +193,10 @@ async def google_oauth_callback(
             return RedirectResponse(url=redirect_url)
         
         # Check if this is an add account flow
-        is_add_account_flow = state is not None and "_add_account" in state
+        flow = await use_case.resolve_flow(state) if state is not None else {"flow_type": "login", "session_id": None}
         
-        if is_add_account_flow:
-            # Extract session ID from state parameter
-            session_id = None
-            if state is not None and "_add_account_" in state:
-                # Format: {random_state}_add_account_{session_id}
-                parts = state.split("_add_account_")
-                if len(parts) == 2:
-                    session_id = parts[1]
-                    print(f"🔄 Extracted session ID from state: {session_id}")
+        if flow["flow_type"] == "add_account":
+            session_id = flow.get("session_id")
             
             print("🔄 Detected add account flow, redirecting to frontend with code/state")
             redirect_params = [
@@ -232,7 +227,6 @@ async def google_oauth_callback(
         except Exception as use_case_error:
             print(f"❌ Use case execution failed: {str(use_case_error)}")
             print(f"❌ Use case error type: {type(use_case_error).__name__}")
-            import traceback
             print(f"❌ Use case traceback: {traceback.format_exc()}")
             raise use_case_error
         
@@ -290,7 +284,6 @@ async def google_oauth_callback(
     except Exception as e:
         # Redirect to frontend with general error
         print(f"❌ Unexpected exception in OAuth callback: {str(e)}")
-        import traceback
         print(f"❌ Callback traceback: {traceback.format_exc()}")
         redirect_url = f"{settings.frontend_url}/login?error=server_error&message=Authentication failed"
         print(f"🔄 Redirecting to error page: {redirect_url}")
@@ -383,7 +376,6 @@ async def get_current_user_info(
     except Exception as e:
         print(f"❌ Unexpected exception in get_current_user_info: {str(e)}")
         print(f"❌ Exception type: {type(e).__name__}")
-        import traceback
         print(f"❌ Traceback: {traceback.format_exc()}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
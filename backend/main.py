@@ -8,6 +8,8 @@ FastAPI application following clean architecture principles with:
 - Separation of concerns
 """
 
+import asyncio
+
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -16,6 +18,7 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 # Infrastructure
 from app.infrastructure.config.settings import get_settings
+from app.infrastructure.config.logging_config import setup_logging, shutdown_logging
 from app.infrastructure.di.container import get_container
 
 # Presentation layer - Clean controllers
@@ -30,6 +33,7 @@ from app.presentation.api.llm_controller import router as llm_router
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    setup_logging(get_settings())
     print("🚀 FastAPI application starting up with Clean Architecture...")
     
     # Initialize dependency injection container
@@ -41,18 +45,30 @@ async def lifespan(app: FastAPI):
         print(f"❌ Failed to initialize Clean Architecture services: {e}")
         raise e
     
+    # Refresh OAuth tokens before they expire, off the request path
+    token_refresh_task = asyncio.create_task(container.refresh_oauth_token_use_case().run_scheduler())
+    
     yield
     
     # Shutdown
     print("🛑 FastAPI application shutting down...")
     
+    token_refresh_task.cancel()
+    try:
+        await token_refresh_task
+    except asyncio.CancelledError:
+        pass
+    
     # Clean up services
     try:
         container = get_container()
+        await container.aclose()
         container.cleanup()
         print("✅ Clean Architecture services cleaned up")
     except Exception as e:
         print(f"⚠️ Error during Clean Architecture cleanup: {e}")
+    
+    shutdown_logging()
 
 
 # Get application settings
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test Batched Email Summarization
+
+This script tests how LLMService.summarize_emails_batch validates a batched
+Gemini reply and falls back to per-email summaries when the reply is
+malformed. Gemini is replaced by canned responses, so no API key is needed.
+"""
+
+import os
+import sys
+import json
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.infrastructure.external_services.llm_service import LLMService
+
+
+ITEMS = [
+    {"email_content": "Lunch tomorrow?", "email_subject": "Lunch", "sender": "a@example.com", "recipient": "b@example.com"},
+    {"email_content": "Invoice attached.", "email_subject": "Invoice", "sender": "c@example.com", "recipient": "b@example.com"},
+]
+
+
+def _service(batch_response):
+    """LLMService whose batched reply is canned and whose single summaries are tagged"""
+    service = LLMService.__new__(LLMService)
+    service.batch_calls = 0
+    service.single_calls = []
+
+    def generate_content(**kwargs):
+        service.batch_calls += 1
+        return batch_response
+
+    def summarize_email(**item):
+        service.single_calls.append(item["email_subject"])
+        return {"summary": f"single:{item['email_subject']}", "main_concept": "x", "sentiment": "neutral", "key_topics": []}
+
+    service.generate_content = generate_content
+    service.summarize_email = summarize_email
+    return service
+
+
+def _summary(text):
+    return {"summary": text, "main_concept": "topic", "sentiment": "positive", "key_topics": ["t"]}
+
+
+def test_valid_batch_is_used_in_order():
+    """A well-formed array is returned as is, with one Gemini call"""
+    service = _service(json.dumps([_summary("first"), _summary("second")]))
+    results = service.summarize_emails_batch(ITEMS)
+    assert [r["summary"] for r in results] == ["first", "second"]
+    assert service.batch_calls == 1
+    assert service.single_calls == []
+
+
+def test_missing_fields_are_filled():
+    """Entries missing fields get the same defaults as single summaries"""
+    service = _service(json.dumps([{"summary": "first"}, _summary("second")]))
+    results = service.summarize_emails_batch(ITEMS)
+    assert results[0] == {"summary": "first", "main_concept": "Unknown", "sentiment": "Unknown", "key_topics": []}
+    assert service.single_calls == []
+
+
+def test_wrong_length_falls_back_per_email():
+    """A reply with the wrong number of entries is discarded"""
+    service = _service(json.dumps([_summary("only one")]))
+    results = service.summarize_emails_batch(ITEMS)
+    assert [r["summary"] for r in results] == ["single:Lunch", "single:Invoice"]
+
+
+def test_wrong_shape_falls_back_per_email():
+    """Non-array replies, non-object entries and invalid JSON are discarded"""
+    for response in [json.dumps(_summary("not a list")), json.dumps(["a", "b"]), "not json"]:
+        service = _service(response)
+        results = service.summarize_emails_batch(ITEMS)
+        assert [r["summary"] for r in results] == ["single:Lunch", "single:Invoice"], response
+
+
+def test_small_batches_skip_the_batch_prompt():
+    """Empty input makes no call, and a single email uses the single-email path"""
+    service = _service("unused")
+    assert service.summarize_emails_batch([]) == []
+    assert service.summarize_emails_batch(ITEMS[:1])[0]["summary"] == "single:Lunch"
+    assert service.batch_calls == 0
+
+
+def main():
+    """Main test function"""
+    print("🚀 Batched Email Summarization Test")
+    print("=" * 50)
+
+    tests = [
+        test_valid_batch_is_used_in_order,
+        test_missing_fields_are_filled,
+        test_wrong_length_falls_back_per_email,
+        test_wrong_shape_falls_back_per_email,
+        test_small_batches_skip_the_batch_prompt,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ FAIL {test.__name__}: {e!r}")
+
+    print("=" * 50)
+    print("🎉 All tests passed!" if not failed else f"⚠️ {failed} test(s) failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)